@@ -1,24 +1,22 @@
 import streamlit as st
-import asyncio
 import uuid
 from datetime import datetime, timedelta
-from db import Database, seed_database
-from vectorstore import seed_vectors
+from db import Database, seed_database, run_async
+from vectorstore import seed_vectors, request_sync
 from graph import create_workflow, run_query, resume_with_actions
+from graph.usage import usage_stats
+from graph.routing import routing_stats
 from logger import log
 
 st.set_page_config(page_title="ecomx", page_icon="🦉", layout="wide")
 
 
-def run_async(coro):
-    return asyncio.run(coro)
-
-
 @st.cache_resource
 def init_system():
     log.info("Initializing system...")
     run_async(seed_database())
     seed_vectors()
+    request_sync()
     workflow = create_workflow()
     log.info("System initialized")
     return workflow
@@ -71,6 +69,19 @@ def render_sidebar():
     col1.metric("Campaigns", m["campaigns"])
     col2.metric("Ad Spend", f"${m['ad_spend']:,.0f}")
 
+    usage = usage_stats()["all"]
+    if usage["calls"]:
+        st.subheader("LLM")
+        col1, col2 = st.columns(2)
+        col1.metric("Input Tokens", f"{usage['input']:,}")
+        col2.metric("Prompt Cache Hits", f"{usage['cache_hit_rate']:.0%}")
+
+    routing = routing_stats()
+    if routing["rules"] + routing["model"] + routing["cache"] + routing["llm"]:
+        col1, col2 = st.columns(2)
+        col1.metric("Router LLM Fallback", f"{routing['fallback_rate']:.0%}")
+        col2.metric("Route Cache Hits", f"{routing['route_cache']['hit_rate']:.0%}")
+
     st.divider()
 
     if st.button("🔄 Refresh", use_container_width=True):
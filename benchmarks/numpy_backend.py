@@ -0,0 +1,121 @@
+"""Benchmark the in-process NumPy backend against Qdrant in-memory mode.
+
+Both clients get the same random points and queries through the same calls
+VectorStore makes. The benchmark reports build time, p50/p95 search latency
+(unfiltered and filtered) and top-k agreement with Qdrant.
+
+Usage:
+    python -m benchmarks.numpy_backend --points 5000
+"""
+
+import argparse
+import time
+import warnings
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    QueryRequest,
+    VectorParams,
+)
+from vectorstore.numpy_backend import NumpyClient
+
+TYPES = ["sales_drop", "stockout", "campaign_failure", "support_spike", "pricing_error"]
+
+
+def build(client, args, vectors, types) -> float:
+    start = time.perf_counter()
+    client.create_collection(
+        collection_name="bench",
+        vectors_config=VectorParams(size=args.dim, distance=Distance.COSINE),
+    )
+    client.upload_collection(
+        collection_name="bench",
+        vectors=vectors,
+        payload=({"incident_type": t} for t in types),
+        ids=range(len(vectors)),
+        batch_size=1000,
+    )
+    return time.perf_counter() - start
+
+
+def time_queries(client, args, queries, query_filter) -> tuple[float, float, list]:
+    latencies, results = [], []
+    for q in queries:
+        start = time.perf_counter()
+        response = client.query_points(
+            collection_name="bench",
+            query=q.tolist(),
+            limit=args.limit,
+            query_filter=query_filter,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([p.id for p in response.points])
+    return np.percentile(latencies, 50), np.percentile(latencies, 95), results
+
+
+def time_batch(client, args, queries, query_filter) -> float:
+    requests = [
+        QueryRequest(query=q.tolist(), limit=args.limit, filter=query_filter)
+        for q in queries
+    ]
+    start = time.perf_counter()
+    client.query_batch_points(collection_name="bench", requests=requests)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def agreement(a: list, b: list) -> float:
+    return float(np.mean([len(set(x) & set(y)) / max(len(x), 1) for x, y in zip(a, b)]))
+
+
+def main(args):
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.standard_normal((args.points, args.dim), dtype=np.float32)
+    types = rng.choice(TYPES, size=args.points).tolist()
+    queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+    only_stockouts = Filter(
+        must=[FieldCondition(key="incident_type", match=MatchValue(value="stockout"))]
+    )
+
+    clients = {"qdrant :memory:": QdrantClient(":memory:"), "numpy": NumpyClient()}
+    rows, ids = {}, {}
+    for name, client in clients.items():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            built = build(client, args, vectors, types)
+            p50, p95, ids[name] = time_queries(client, args, queries, None)
+            fp50, fp95, ids[name + " filtered"] = time_queries(
+                client, args, queries, only_stockouts
+            )
+            batch = time_batch(client, args, queries, None)
+        rows[name] = (built, p50, p95, fp50, fp95, batch)
+        client.close()
+
+    print(f"\n{args.points:,} points x {args.dim} dims, {args.queries} queries")
+    print(
+        f"{'backend':<18}{'build s':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'filt p50':>10}{'filt p95':>10}{'batch ms/q':>12}"
+    )
+    for name, (built, p50, p95, fp50, fp95, batch) in rows.items():
+        print(
+            f"{name:<18}{built:>9.2f}{p50:>9.2f}{p95:>9.2f}"
+            f"{fp50:>10.2f}{fp95:>10.2f}{batch:>12.3f}"
+        )
+    print(
+        f"\ntop-{args.limit} agreement with Qdrant: "
+        f"{agreement(ids['numpy'], ids['qdrant :memory:']):.3f} unfiltered, "
+        f"{agreement(ids['numpy filtered'], ids['qdrant :memory: filtered']):.3f} filtered"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=5_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
@@ -0,0 +1,138 @@
+"""Benchmark filtered vector search with and without keyword payload indexes.
+
+Needs a Qdrant server (payload indexes have no effect in local/in-memory mode).
+
+Usage:
+    python -m benchmarks.qdrant_filtered --points 1000000 --host localhost
+"""
+
+import argparse
+import time
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (
+    CollectionStatus,
+    Distance,
+    FieldCondition,
+    Filter,
+    HnswConfigDiff,
+    MatchValue,
+    PayloadSchemaType,
+    VectorParams,
+)
+from config import Config
+
+
+def category_weights(categories: int) -> np.ndarray:
+    # Zipf-like: a few broad categories and a long tail of highly selective ones
+    weights = 1.0 / np.arange(1, categories + 1)
+    return weights / weights.sum()
+
+
+def build_collection(client, name: str, args, indexed: bool):
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        collection_name=name,
+        vectors_config=VectorParams(size=args.dim, distance=Distance.COSINE),
+        hnsw_config=HnswConfigDiff(
+            m=Config.QDRANT_HNSW_M, ef_construct=Config.QDRANT_HNSW_EF_CONSTRUCT
+        ),
+    )
+    if indexed:
+        # Create before upload so HNSW builds the extra per-category links
+        client.create_payload_index(
+            collection_name=name,
+            field_name="category",
+            field_schema=PayloadSchemaType.KEYWORD,
+        )
+
+    rng = np.random.default_rng(args.seed)
+    p = category_weights(args.categories)
+    for start in range(0, args.points, args.batch):
+        n = min(args.batch, args.points - start)
+        vectors = rng.standard_normal((n, args.dim), dtype=np.float32)
+        categories = rng.choice(args.categories, size=n, p=p)
+        client.upload_collection(
+            collection_name=name,
+            vectors=vectors,
+            payload=({"category": f"cat_{c}"} for c in categories),
+            ids=range(start, start + n),
+            batch_size=args.batch,
+            parallel=args.parallel,
+            wait=True,
+        )
+
+    while client.get_collection(name).status != CollectionStatus.GREEN:
+        time.sleep(1)
+
+
+def time_searches(client, name: str, args) -> dict[str, tuple[float, float]]:
+    rng = np.random.default_rng(args.seed + 1)
+    queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32)
+    buckets = {
+        "unfiltered": None,
+        "broad (cat_0)": "cat_0",
+        "mid (cat_9)": f"cat_{min(9, args.categories - 1)}",
+        f"rare (cat_{args.categories - 1})": f"cat_{args.categories - 1}",
+    }
+
+    timings = {}
+    for label, category in buckets.items():
+        query_filter = (
+            Filter(
+                must=[FieldCondition(key="category", match=MatchValue(value=category))]
+            )
+            if category
+            else None
+        )
+        latencies = []
+        for vector in queries:
+            start = time.perf_counter()
+            client.query_points(
+                collection_name=name,
+                query=vector.tolist(),
+                limit=args.limit,
+                query_filter=query_filter,
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+        timings[label] = (np.percentile(latencies, 50), np.percentile(latencies, 95))
+    return timings
+
+
+def main(args):
+    client = QdrantClient(host=args.host, port=args.port, timeout=600)
+    stages = {}
+    for indexed in (False, True):
+        name = f"bench_filtered_{'indexed' if indexed else 'plain'}"
+        print(f"Building {name}: {args.points:,} points x {args.dim} dims ...")
+        start = time.perf_counter()
+        build_collection(client, name, args, indexed)
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+        stages["indexed" if indexed else "plain"] = time_searches(client, name, args)
+        if not args.keep:
+            client.delete_collection(name)
+
+    print(f"\n{'search':<24}{'plain p50':>12}{'p95':>10}{'indexed p50':>14}{'p95':>10}")
+    for label, (plain_p50, plain_p95) in stages["plain"].items():
+        idx_p50, idx_p95 = stages["indexed"][label]
+        print(
+            f"{label:<24}{plain_p50:>12.2f}{plain_p95:>10.2f}"
+            f"{idx_p50:>14.2f}{idx_p95:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--host", default=Config.QDRANT_HOST or "localhost")
+    parser.add_argument("--port", type=int, default=Config.QDRANT_PORT)
+    parser.add_argument("--keep", action="store_true")
+    main(parser.parse_args())
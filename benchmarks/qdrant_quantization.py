@@ -0,0 +1,121 @@
+"""Benchmark the quantized collections VectorStore creates on a Qdrant server.
+
+Builds one collection per QDRANT_QUANTIZATION mode through VectorStore's own
+collection setup, uploads the embedded seed corpus (plus synthetic
+recombinations, see benchmarks.quantization_simulation) and searches it with
+the search params VectorStore would use. Recall@k is measured against exact
+float32 search in NumPy.
+
+Needs a Qdrant server: local and in-memory Qdrant ignore quantization.
+
+Usage:
+    EMBEDDING_PROVIDER=hash python -m benchmarks.qdrant_quantization --synthetic 20000
+"""
+
+import argparse
+import time
+import numpy as np
+from qdrant_client.models import CollectionStatus
+from config import Config
+from vectorstore.store import VectorStore
+from benchmarks.quantization_simulation import build_corpus, embed, recall, top_k
+
+MODES = ("none", "scalar", "binary")
+
+
+def build_collection(vs: VectorStore, name: str, docs: np.ndarray, args):
+    if vs.client.collection_exists(name):
+        vs.client.delete_collection(name)
+    vs._create_collection(name, docs.shape[1])
+    vs.client.upload_collection(
+        collection_name=name,
+        vectors=docs,
+        ids=range(len(docs)),
+        batch_size=args.batch,
+        wait=True,
+    )
+    while vs.client.get_collection(name).status != CollectionStatus.GREEN:
+        time.sleep(1)
+
+
+def search(vs: VectorStore, name: str, queries: np.ndarray, k: int):
+    found, latencies = [], []
+    params = vs._search_params(name)
+    for vector in queries:
+        start = time.perf_counter()
+        response = vs.client.query_points(
+            collection_name=name, query=vector.tolist(), limit=k, search_params=params
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        found.append([p.id for p in response.points])
+    return np.array(found), latencies
+
+
+def main(args):
+    Config.QDRANT_MODE = "server"
+    Config.QDRANT_HOST, Config.QDRANT_PORT = args.host, args.port
+    # Per-collection spec, so each benchmark collection goes through
+    # VectorStore.quantization() like the real ones
+    names = {mode: f"bench_quant_{mode}" for mode in args.modes}
+    Config.QDRANT_QUANTIZATION = ",".join(f"{n}={m}" for m, n in names.items())
+    vs = VectorStore()
+
+    print(f"Embedding corpus with provider={Config.EMBEDDING_PROVIDER} ...")
+    texts = build_corpus(args.synthetic, args.seed)
+    docs = embed(texts, args.batch)
+    rng = np.random.default_rng(args.seed)
+    query_ids = rng.choice(
+        len(texts), size=min(args.queries, len(texts)), replace=False
+    )
+    queries = embed([" ".join(texts[i].split()[::2]) for i in query_ids], args.batch)
+    truth = top_k(queries @ docs.T, args.k)
+    n, dim = docs.shape
+
+    rows = []
+    for mode, name in names.items():
+        print(f"Building {name}: {n:,} points x {dim} dims ...")
+        start = time.perf_counter()
+        build_collection(vs, name, docs, args)
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+        found, latencies = search(vs, name, queries, args.k)
+        quantized = {"none": 0, "scalar": dim, "binary": (dim + 7) // 8}[mode]
+        rows.append(
+            (
+                mode,
+                quantized,
+                recall(found, truth),
+                np.percentile(latencies, 50),
+                np.percentile(latencies, 95),
+            )
+        )
+        if not args.keep:
+            vs.client.delete_collection(name)
+
+    print(
+        f"\nrescore={Config.QDRANT_QUANTIZATION_RESCORE} "
+        f"oversampling={Config.QDRANT_QUANTIZATION_OVERSAMPLING}"
+    )
+    print(
+        f"{'mode':<10}{'quantized/vector':>18}{f'recall@{args.k}':>12}"
+        f"{'p50 ms':>10}{'p95 ms':>10}"
+    )
+    for mode, quantized, r, p50, p95 in rows:
+        print(f"{mode:<10}{quantized:>16} B{r:>12.3f}{p50:>10.2f}{p95:>10.2f}")
+    print(
+        f"\nEvery mode also stores the {dim * 4} B float32 original per vector "
+        "(off-heap with QDRANT_VECTORS_ON_DISK=true)."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--synthetic", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--modes", nargs="*", default=list(MODES), choices=MODES)
+    parser.add_argument("--batch", type=int, default=Config.EMBED_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--host", default=Config.QDRANT_HOST or "localhost")
+    parser.add_argument("--port", type=int, default=Config.QDRANT_PORT)
+    parser.add_argument("--keep", action="store_true")
+    main(parser.parse_args())
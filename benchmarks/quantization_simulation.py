@@ -0,0 +1,156 @@
+"""Simulate the memory and recall tradeoffs of vector quantization in NumPy.
+
+This is a simulation, not a Qdrant measurement: it embeds the vector-store
+seed corpus (plus synthetic recombinations of it) with the configured
+embeddings provider, then compares exact float32 search with NumPy
+re-implementations of int8 scalar and binary quantization (each rescored on
+the originals) and with truncated dimensions. Recall@k is measured against
+exact float32 search. Useful for a quick estimate without a server; for the
+collections VectorStore actually creates, run benchmarks.qdrant_quantization.
+
+Usage:
+    EMBEDDING_PROVIDER=hash python -m benchmarks.quantization_simulation --synthetic 20000
+"""
+
+import argparse
+import random
+import time
+import numpy as np
+from config import Config, get_embeddings
+from vectorstore import seed as vector_seed
+from vectorstore.store import VectorStore
+
+
+class CorpusCollector:
+    """Stands in for VectorStore in the seeders and keeps the embedded texts."""
+
+    def __init__(self):
+        self.texts: list[str] = []
+
+    def add_incidents_batch(self, incidents, **_):
+        self.texts += [VectorStore._incident_text(i) for i in incidents]
+
+    def add_tickets_batch(self, tickets, **_):
+        self.texts += [VectorStore._ticket_text(t) for t in tickets]
+
+    def add_products_batch(self, products, **_):
+        self.texts += [VectorStore._product_text(p) for p in products]
+
+
+def build_corpus(synthetic: int, seed: int) -> list[str]:
+    collector = CorpusCollector()
+    vector_seed.seed_incidents(collector)
+    vector_seed.seed_tickets(collector)
+    vector_seed.seed_products(collector)
+
+    rng = random.Random(seed)
+    sentences = [s.strip() for t in collector.texts for s in t.split(". ") if s.strip()]
+    texts = list(collector.texts)
+    for _ in range(synthetic):
+        texts.append(". ".join(rng.sample(sentences, rng.randint(2, 5))))
+    return texts
+
+
+def unit(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True).clip(1e-12)
+
+
+def embed(texts: list[str], batch: int) -> np.ndarray:
+    embeddings = get_embeddings()
+    chunks = [
+        embeddings.embed_documents(texts[i : i + batch])
+        for i in range(0, len(texts), batch)
+    ]
+    vectors = np.array([v for chunk in chunks for v in chunk], dtype=np.float32)
+    return unit(vectors)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(scores, idx, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(idx, order, axis=1)
+
+
+def rescored(
+    approx: np.ndarray, docs: np.ndarray, queries: np.ndarray, k: int, oversampling
+):
+    candidates = top_k(approx, min(int(k * oversampling), approx.shape[1]))
+    exact = np.einsum("qd,qcd->qc", queries, docs[candidates])
+    return np.take_along_axis(candidates, top_k(exact, k), axis=1)
+
+
+def scalar_int8(docs: np.ndarray, quantile: float = 0.99):
+    lo, hi = np.quantile(docs, [1 - quantile, quantile])
+    scale = (hi - lo) / 255
+    codes = np.clip(np.round((docs - lo) / scale), 0, 255).astype(np.uint8)
+    return codes, lambda: codes.astype(np.float32) * scale + lo
+
+
+def recall(found: np.ndarray, truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return float(np.mean([len(set(f) & set(t)) / k for f, t in zip(found, truth)]))
+
+
+def main(args):
+    print(f"Embedding corpus with provider={Config.EMBEDDING_PROVIDER} ...")
+    texts = build_corpus(args.synthetic, args.seed)
+    start = time.perf_counter()
+    docs = embed(texts, args.batch)
+    print(
+        f"  {len(texts):,} x {docs.shape[1]} dims in {time.perf_counter() - start:.1f}s"
+    )
+
+    rng = np.random.default_rng(args.seed)
+    query_ids = rng.choice(
+        len(texts), size=min(args.queries, len(texts)), replace=False
+    )
+    # Queries are perturbed documents, so near neighbours are non-trivial
+    query_texts = [" ".join(texts[i].split()[::2]) for i in query_ids]
+    queries = embed(query_texts, args.batch)
+
+    k, n, dim = args.k, len(docs), docs.shape[1]
+    truth = top_k(queries @ docs.T, k)
+    rows = [("float32 (exact)", dim * 4, 1.0)]
+
+    codes, dequantize = scalar_int8(docs)
+    approx = queries @ dequantize().T
+    rows.append(("int8 scalar", codes.nbytes // n, recall(top_k(approx, k), truth)))
+    found = rescored(approx, docs, queries, k, args.oversampling)
+    rows.append(("int8 scalar + rescore", codes.nbytes // n, recall(found, truth)))
+
+    bits = np.packbits(docs > 0, axis=1)
+    approx = np.where(queries > 0, 1.0, -1.0) @ np.where(docs > 0, 1.0, -1.0).T
+    rows.append(("binary", bits.nbytes // n, recall(top_k(approx, k), truth)))
+    found = rescored(approx, docs, queries, k, args.oversampling)
+    rows.append(("binary + rescore", bits.nbytes // n, recall(found, truth)))
+
+    for d in args.dims:
+        if d >= dim:
+            continue
+        scores = unit(queries[:, :d]) @ unit(docs[:, :d]).T
+        rows.append((f"truncate to {d}", d * 4, recall(top_k(scores, k), truth)))
+
+    print(
+        f"\n{'variant':<26}{'RAM/vector':>12}{f'RAM for {n:,}':>16}{f'recall@{k}':>12}"
+    )
+    for name, per_vector, r in rows:
+        total_mb = per_vector * n / 1e6
+        print(f"{name:<26}{per_vector:>10} B{total_mb:>13.1f} MB{r:>12.3f}")
+    print(
+        "\nRescored variants also keep float32 originals for rescoring; "
+        "set QDRANT_VECTORS_ON_DISK=true to keep those off-heap.\n"
+        "Truncation is only meaningful for models trained for it "
+        "(e.g. text-embedding-3-*); prefer setting EMBEDDING_DIM."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--synthetic", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--oversampling", type=float, default=2.0)
+    parser.add_argument("--dims", type=int, nargs="*", default=[768, 512, 256])
+    parser.add_argument("--batch", type=int, default=Config.EMBED_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
@@ -0,0 +1,156 @@
+"""Benchmark Database read paths on a large sales table at each schema migration.
+
+Usage:
+    python -m benchmarks.sales_indexes --rows 2000000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+from db import Database
+from db.database import SCHEMA, MIGRATIONS
+
+REGIONS = ["North", "South", "East", "West"]
+
+# Pre-rollup (schema version < 2) form of the aggregates now served by sales_daily.
+RAW_AGGREGATES = {
+    "get_sales": "SELECT sale_date, SUM(amount) as revenue, SUM(quantity) as orders "
+    "FROM sales WHERE sale_date BETWEEN ? AND ? GROUP BY sale_date",
+    "get_top_products": "SELECT p.id, p.name, SUM(s.amount) as revenue, SUM(s.quantity) as units "
+    "FROM sales s JOIN products p ON s.product_id = p.id "
+    "WHERE s.sale_date BETWEEN ? AND ? GROUP BY p.id ORDER BY revenue DESC LIMIT 5",
+    "get_sales_by_region": "SELECT region, SUM(amount) as revenue, SUM(quantity) as orders "
+    "FROM sales WHERE sale_date BETWEEN ? AND ? GROUP BY region",
+}
+
+
+def build_sales_table(path: str, rows: int, products: int, days: int, seed: int):
+    rng = random.Random(seed)
+    today = date.today()
+    dates = [(today - timedelta(days=d)).isoformat() for d in range(days)]
+
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.executemany(
+        "INSERT INTO products (id, name, category, price) VALUES (?, ?, ?, ?)",
+        ((i, f"Product {i}", "Bench", 10.0 + i % 90) for i in range(1, products + 1)),
+    )
+
+    def sales():
+        for _ in range(rows):
+            qty = rng.randint(1, 4)
+            yield (
+                rng.randint(1, products),
+                qty,
+                qty * 25.0,
+                rng.choice(dates),
+                rng.choice(REGIONS),
+            )
+
+    conn.executemany(
+        "INSERT INTO sales (product_id, quantity, amount, sale_date, region) "
+        "VALUES (?, ?, ?, ?, ?)",
+        sales(),
+    )
+    conn.executemany(
+        "INSERT INTO tickets (subject, category, priority, status, created_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                "Bench ticket",
+                rng.choice(["shipping", "order", "refund"]),
+                rng.choice(["high", "medium", "low"]),
+                "open" if rng.random() < 0.02 else "resolved",
+                rng.choice(dates),
+            )
+            for _ in range(rows // 20)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def time_queries(db: Database, repeat: int) -> dict[str, float]:
+    today = date.today()
+    week = (today - timedelta(days=7)).isoformat()
+    year = (today - timedelta(days=365)).isoformat()
+    end = today.isoformat()
+
+    if await db.schema_version() >= 2:
+        get_sales, get_top_products, get_sales_by_region = (
+            db.get_sales,
+            db.get_top_products,
+            db.get_sales_by_region,
+        )
+    else:
+        get_sales, get_top_products, get_sales_by_region = (
+            (lambda s, e, sql=sql: db._fetch(sql, (s, e)))
+            for sql in RAW_AGGREGATES.values()
+        )
+
+    queries = {
+        "get_sales (7d)": lambda: get_sales(week, end),
+        "get_sales (365d)": lambda: get_sales(year, end),
+        "get_top_products (7d)": lambda: get_top_products(week, end),
+        "get_top_products (365d)": lambda: get_top_products(year, end),
+        "get_sales_by_region (365d)": lambda: get_sales_by_region(year, end),
+        "get_product_sales (365d)": lambda: db.get_product_sales(1, year, end),
+        "get_open_tickets": db.get_open_tickets,
+        "get_ticket_summary": db.get_ticket_summary,
+        "get_ticket_stats (7d)": lambda: db.get_ticket_stats(week, end),
+    }
+
+    timings = {}
+    for name, query in queries.items():
+        await query()  # warm page cache
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await query()
+        timings[name] = (time.perf_counter() - start) / repeat * 1000
+    return timings
+
+
+async def main(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        print(f"Building {args.rows:,} sales rows ...")
+        start = time.perf_counter()
+        build_sales_table(path, args.rows, args.products, args.days, args.seed)
+        print(f"  done in {time.perf_counter() - start:.1f}s")
+
+        db = Database(path)
+        await db.init(migrate=False)
+        stages = {"v0": await time_queries(db, args.repeat)}
+
+        for version, name, _ in MIGRATIONS:
+            start = time.perf_counter()
+            await db.migrate(target=version)
+            print(f"Migration {version} ({name}) in {time.perf_counter() - start:.1f}s")
+            stages[f"v{version}"] = await time_queries(db, args.repeat)
+        await db.close()
+
+    baseline = stages["v0"]
+    header = "".join(f"{stage + ' ms':>12}" for stage in stages)
+    print(f"\n{'query':<28}{header}{'speedup':>10}")
+    for query in baseline:
+        cells = "".join(f"{timings[query]:>12.2f}" for timings in stages.values())
+        last = stages[f"v{MIGRATIONS[-1][0]}"][query]
+        speedup = baseline[query] / last if last else float("inf")
+        print(f"{query:<28}{cells}{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--products", type=int, default=50)
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
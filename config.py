@@ -1,4 +1,5 @@
 import os
+import threading
 from dotenv import load_dotenv
 from logger import log
 
@@ -21,14 +22,61 @@ class Config:
     MODEL_TESTING = os.getenv("MODEL_TESTING")
 
     DB_PATH = os.getenv("DB_PATH")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_PING_INTERVAL = float(os.getenv("DB_POOL_PING_INTERVAL", "60"))
+    DB_BULK_BATCH_SIZE = int(os.getenv("DB_BULK_BATCH_SIZE", "10000"))
+    DB_BULK_CACHE_KB = int(os.getenv("DB_BULK_CACHE_KB", "200000"))
 
     QDRANT_MODE = os.getenv("QDRANT_MODE")
     QDRANT_HOST = os.getenv("QDRANT_HOST")
     QDRANT_PORT = int(os.getenv("QDRANT_PORT"))
     QDRANT_PATH = os.getenv("QDRANT_PATH")
+    QDRANT_HNSW_M = int(os.getenv("QDRANT_HNSW_M", "16"))
+    QDRANT_HNSW_EF_CONSTRUCT = int(os.getenv("QDRANT_HNSW_EF_CONSTRUCT", "100"))
+    QDRANT_HNSW_ON_DISK = os.getenv("QDRANT_HNSW_ON_DISK", "false").lower() == "true"
+    QDRANT_VECTORS_ON_DISK = (
+        os.getenv("QDRANT_VECTORS_ON_DISK", "false").lower() == "true"
+    )
+    QDRANT_QUANTIZATION = os.getenv("QDRANT_QUANTIZATION", "none")
+    QDRANT_QUANTIZATION_RESCORE = (
+        os.getenv("QDRANT_QUANTIZATION_RESCORE", "true").lower() == "true"
+    )
+    QDRANT_QUANTIZATION_OVERSAMPLING = float(
+        os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0")
+    )
+
+    EMBEDDING_PROVIDER = os.getenv("EMBEDDING_PROVIDER", "azure")
+    EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1536"))
+    EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+    EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH")
+    EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "256"))
+    EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "4"))
+    SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+    SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+    HYBRID_SEARCH = os.getenv("HYBRID_SEARCH", "true").lower() == "true"
+    HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", "60"))
+    VECTOR_SYNC_BATCH_SIZE = int(os.getenv("VECTOR_SYNC_BATCH_SIZE", "256"))
+    VECTOR_SYNC_INTERVAL = float(os.getenv("VECTOR_SYNC_INTERVAL", "0"))
+    VECTOR_SNAPSHOT_PATH = os.getenv("VECTOR_SNAPSHOT_PATH")
 
     TEMPERATURE = 0.2
 
+    LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+    LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "10"))
+    LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+
+    ROUTER_LOCAL = os.getenv("ROUTER_LOCAL", "true").lower() == "true"
+    ROUTER_CONFIDENCE = float(os.getenv("ROUTER_CONFIDENCE", "0.9"))
+    ROUTER_MODEL_PATH = os.getenv("ROUTER_MODEL_PATH", "data/router_model.npz")
+    ROUTER_LOG_PATH = os.getenv("ROUTER_LOG_PATH", "data/router_decisions.jsonl")
+    ROUTER_CACHE_SIZE = int(os.getenv("ROUTER_CACHE_SIZE", "512"))
+    ROUTER_CACHE_SIMILARITY = float(os.getenv("ROUTER_CACHE_SIMILARITY", "0.92"))
+    ROUTER_CACHE_HISTORY = int(os.getenv("ROUTER_CACHE_HISTORY", "2"))
+
+    TOOL_POOL_SIZE = int(os.getenv("TOOL_POOL_SIZE", "16"))
+    TOOL_CONCURRENCY = os.getenv("TOOL_CONCURRENCY", "4")
+
 
 def get_langfuse_handler():
     if not os.getenv("LANGFUSE_SECRET_KEY"):
@@ -44,23 +92,68 @@ def get_callbacks():
     return [handler] if handler else []
 
 
+# LLM clients keyed by (deployment, temperature, timeout), all sharing one
+# pooled HTTP client so TLS connections survive across requests.
+_llm_clients: dict[tuple, object] = {}
+_llm_lock = threading.Lock()
+_http_client = None
+_http_lock = threading.Lock()
+
+
+def _get_http_client():
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=Config.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=Config.LLM_MAX_KEEPALIVE,
+                    keepalive_expiry=Config.LLM_KEEPALIVE_EXPIRY,
+                )
+            )
+        return _http_client
+
+
 def get_llm(model_name: str = None, temperature: float = None, timeout: int = 120):
     from langchain_openai import AzureChatOpenAI
 
-    model = model_name
-    log.debug(f"LLM init: {model}")
-    return AzureChatOpenAI(
-        api_key=Config.API_KEY,
-        azure_endpoint=Config.AZURE_ENDPOINT,
-        api_version=Config.API_VERSION,
-        azure_deployment=model_name or Config.MODEL_SUPERVISOR,
-        temperature=temperature if temperature is not None else Config.TEMPERATURE,
-        timeout=timeout,
-        streaming=True,
-    )
+    deployment = model_name or Config.MODEL_SUPERVISOR
+    temperature = temperature if temperature is not None else Config.TEMPERATURE
+    key = (deployment, temperature, timeout)
+
+    with _llm_lock:
+        llm = _llm_clients.get(key)
+        if llm is None:
+            log.debug(f"LLM init: {deployment}")
+            llm = AzureChatOpenAI(
+                api_key=Config.API_KEY,
+                azure_endpoint=Config.AZURE_ENDPOINT,
+                api_version=Config.API_VERSION,
+                azure_deployment=deployment,
+                temperature=temperature,
+                timeout=timeout,
+                streaming=True,
+                stream_usage=True,
+                http_client=_get_http_client(),
+            )
+            _llm_clients[key] = llm
+    return llm
 
 
 def get_embeddings():
+    provider = Config.EMBEDDING_PROVIDER
+
+    if provider == "hash":
+        from vectorstore.embeddings import HashEmbeddings
+
+        log.debug(f"Embeddings init: local hash ({Config.EMBEDDING_DIM} dims)")
+        return HashEmbeddings(dim=Config.EMBEDDING_DIM)
+
+    if provider != "azure":
+        raise ValueError(f"Unknown EMBEDDING_PROVIDER: {provider}")
+
     from langchain_openai import AzureOpenAIEmbeddings
 
     log.debug(f"Embeddings init: {Config.MODEL_EMBEDDING}")
@@ -68,9 +161,28 @@ def get_embeddings():
         api_key=Config.API_KEY,
         azure_endpoint=Config.AZURE_ENDPOINT,
         azure_deployment=Config.MODEL_EMBEDDING,
+        dimensions=embedding_dimensions(),
+        http_client=_get_http_client(),
     )
 
 
+def embedding_dimensions() -> int | None:
+    """`dimensions` request parameter for the embedding deployment.
+
+    text-embedding-3-* accept any size up to their native one (1536 small,
+    3072 large), so it is always sent; ada-002 is fixed at 1536 and rejects it.
+    """
+    if "ada" in (Config.MODEL_EMBEDDING or "").lower():
+        return None
+    return Config.EMBEDDING_DIM
+
+
+def embedding_model_id() -> str:
+    """Identifies the vector space, so caches never mix providers or dims."""
+    model = Config.MODEL_EMBEDDING if Config.EMBEDDING_PROVIDER == "azure" else ""
+    return f"{Config.EMBEDDING_PROVIDER}:{model}:{Config.EMBEDDING_DIM}"
+
+
 def get_supervisor_llm():
     return get_llm(Config.MODEL_SUPERVISOR)
 
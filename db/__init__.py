@@ -1,4 +1,5 @@
 from .database import Database
 from .seed import seed_database
+from .runner import run_async
 
-__all__ = ["Database", "seed_database"]
+__all__ = ["Database", "seed_database", "run_async"]
@@ -1,7 +1,10 @@
-import aiosqlite
 import os
+import threading
+from contextlib import asynccontextmanager
+from itertools import islice
 from config import Config
 from logger import log
+from .pool import ConnectionPool
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS products (
@@ -60,29 +63,335 @@ CREATE TABLE IF NOT EXISTS incidents (
 );
 """
 
+SALES_DAILY_TABLE = """
+CREATE TABLE IF NOT EXISTS sales_daily (
+    sale_date TEXT NOT NULL,
+    product_id INTEGER NOT NULL,
+    region TEXT NOT NULL,
+    revenue REAL NOT NULL DEFAULT 0,
+    units INTEGER NOT NULL DEFAULT 0,
+    orders INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (sale_date, product_id, region)
+) WITHOUT ROWID;
+"""
+
+# Keep sales_daily in step with every write to sales. NULL product/region are
+# folded to 0/'' because they are part of the rollup's primary key.
+SALES_DAILY_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS sales_daily_insert AFTER INSERT ON sales
+WHEN NEW.sale_date IS NOT NULL
+BEGIN
+    INSERT INTO sales_daily (sale_date, product_id, region, revenue, units, orders)
+    VALUES (NEW.sale_date, IFNULL(NEW.product_id, 0), IFNULL(NEW.region, ''),
+            IFNULL(NEW.amount, 0), IFNULL(NEW.quantity, 0), 1)
+    ON CONFLICT (sale_date, product_id, region) DO UPDATE SET
+        revenue = revenue + excluded.revenue,
+        units = units + excluded.units,
+        orders = orders + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS sales_daily_delete AFTER DELETE ON sales
+WHEN OLD.sale_date IS NOT NULL
+BEGIN
+    UPDATE sales_daily SET
+        revenue = revenue - IFNULL(OLD.amount, 0),
+        units = units - IFNULL(OLD.quantity, 0),
+        orders = orders - 1
+    WHERE sale_date = OLD.sale_date
+      AND product_id = IFNULL(OLD.product_id, 0)
+      AND region = IFNULL(OLD.region, '');
+    DELETE FROM sales_daily
+    WHERE sale_date = OLD.sale_date
+      AND product_id = IFNULL(OLD.product_id, 0)
+      AND region = IFNULL(OLD.region, '')
+      AND orders <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS sales_daily_update
+AFTER UPDATE OF product_id, quantity, amount, sale_date, region ON sales
+BEGIN
+    UPDATE sales_daily SET
+        revenue = revenue - IFNULL(OLD.amount, 0),
+        units = units - IFNULL(OLD.quantity, 0),
+        orders = orders - 1
+    WHERE OLD.sale_date IS NOT NULL
+      AND sale_date = OLD.sale_date
+      AND product_id = IFNULL(OLD.product_id, 0)
+      AND region = IFNULL(OLD.region, '');
+    DELETE FROM sales_daily
+    WHERE OLD.sale_date IS NOT NULL
+      AND sale_date = OLD.sale_date
+      AND product_id = IFNULL(OLD.product_id, 0)
+      AND region = IFNULL(OLD.region, '')
+      AND orders <= 0;
+    INSERT INTO sales_daily (sale_date, product_id, region, revenue, units, orders)
+    SELECT NEW.sale_date, IFNULL(NEW.product_id, 0), IFNULL(NEW.region, ''),
+           IFNULL(NEW.amount, 0), IFNULL(NEW.quantity, 0), 1
+    WHERE NEW.sale_date IS NOT NULL
+    ON CONFLICT (sale_date, product_id, region) DO UPDATE SET
+        revenue = revenue + excluded.revenue,
+        units = units + excluded.units,
+        orders = orders + 1;
+END;
+"""
+
+SALES_DAILY_REBUILD = """
+DELETE FROM sales_daily;
+INSERT INTO sales_daily (sale_date, product_id, region, revenue, units, orders)
+SELECT sale_date, IFNULL(product_id, 0), IFNULL(region, ''),
+       TOTAL(amount), IFNULL(SUM(quantity), 0), COUNT(*)
+FROM sales WHERE sale_date IS NOT NULL
+GROUP BY sale_date, IFNULL(product_id, 0), IFNULL(region, '');
+"""
+
+# Change log consumed by the vector-store sync worker (vectorstore/sync.py).
+# Only row ids are recorded; the worker reads current row state when it runs.
+VECTOR_CHANGES = """
+CREATE TABLE IF NOT EXISTS vector_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_id INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS vector_changes_tickets_insert AFTER INSERT ON tickets
+BEGIN
+    INSERT INTO vector_changes (table_name, row_id) VALUES ('tickets', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS vector_changes_tickets_update
+AFTER UPDATE OF subject, description, category, status ON tickets
+BEGIN
+    INSERT INTO vector_changes (table_name, row_id) VALUES ('tickets', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS vector_changes_tickets_delete AFTER DELETE ON tickets
+BEGIN
+    INSERT INTO vector_changes (table_name, row_id) VALUES ('tickets', OLD.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS vector_changes_incidents_insert AFTER INSERT ON incidents
+BEGIN
+    INSERT INTO vector_changes (table_name, row_id) VALUES ('incidents', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS vector_changes_incidents_update
+AFTER UPDATE OF type, description, root_cause, action_taken, outcome ON incidents
+BEGIN
+    INSERT INTO vector_changes (table_name, row_id) VALUES ('incidents', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS vector_changes_incidents_delete AFTER DELETE ON incidents
+BEGIN
+    INSERT INTO vector_changes (table_name, row_id) VALUES ('incidents', OLD.id);
+END;
+"""
+
+# Versioned migrations applied on top of SCHEMA, tracked via PRAGMA user_version.
+# Append new entries; never edit or reorder released ones.
+MIGRATIONS = [
+    (
+        1,
+        "covering indexes",
+        """
+        CREATE INDEX IF NOT EXISTS idx_sales_date_product
+            ON sales (sale_date, product_id, amount, quantity);
+        CREATE INDEX IF NOT EXISTS idx_sales_date_region
+            ON sales (sale_date, region, amount, quantity);
+        CREATE INDEX IF NOT EXISTS idx_sales_product_date
+            ON sales (product_id, sale_date);
+        CREATE INDEX IF NOT EXISTS idx_tickets_status_priority
+            ON tickets (status, priority, category);
+        CREATE INDEX IF NOT EXISTS idx_tickets_created_date
+            ON tickets (DATE(created_at));
+        CREATE INDEX IF NOT EXISTS idx_campaigns_status
+            ON campaigns (status);
+        CREATE INDEX IF NOT EXISTS idx_incidents_type_occurred
+            ON incidents (type, occurred_at);
+        """,
+    ),
+    (
+        2,
+        "sales_daily rollup",
+        SALES_DAILY_TABLE + SALES_DAILY_REBUILD + SALES_DAILY_TRIGGERS,
+    ),
+    (3, "vector sync change log", VECTOR_CHANGES),
+    (
+        4,
+        "vector sync ledger",
+        # Rows the sync worker has written to the vector store. The store may
+        # be rebuilt from the curated seed (in-memory mode, snapshot), so this
+        # is what gets replayed into vector_changes afterwards.
+        """
+        CREATE TABLE IF NOT EXISTS vector_synced (
+            table_name TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            PRIMARY KEY (table_name, row_id)
+        ) WITHOUT ROWID;
+        """,
+    ),
+]
+
+
+class BulkWriter:
+    def __init__(self, conn, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+
+    async def insert(self, query: str, rows) -> int:
+        """Stream rows (any iterable) through executemany in fixed-size batches."""
+        rows = iter(rows)
+        count = 0
+        while batch := list(islice(rows, self.batch_size)):
+            await self.conn.executemany(query, batch)
+            count += len(batch)
+        return count
+
 
 class Database:
-    def __init__(self):
-        self.path = Config.DB_PATH
+    # One pool per database file, shared by every Database() instance
+    # (tool modules, actions, dashboard).
+    _pools: dict[str, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, path: str = None):
+        self.path = path or Config.DB_PATH
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
 
+    @property
+    def pool(self) -> ConnectionPool:
+        with Database._pools_lock:
+            pool = Database._pools.get(self.path)
+            if pool is None or pool.closed:
+                pool = ConnectionPool(
+                    self.path,
+                    size=Config.DB_POOL_SIZE,
+                    timeout=Config.DB_POOL_TIMEOUT,
+                    ping_interval=Config.DB_POOL_PING_INTERVAL,
+                )
+                Database._pools[self.path] = pool
+                log.debug(f"DB pool created: {self.path} (size={pool.size})")
+            return pool
+
+    async def close(self):
+        with Database._pools_lock:
+            pool = Database._pools.pop(self.path, None)
+        if pool is not None:
+            await pool.close()
+
     async def _execute(self, query: str, params: tuple = ()):
-        async with aiosqlite.connect(self.path) as db:
+        async with self.pool.connection() as db:
             await db.execute(query, params)
             await db.commit()
 
     async def _fetch(self, query: str, params: tuple = ()) -> list[dict]:
-        async with aiosqlite.connect(self.path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.connection() as db:
             cursor = await db.execute(query, params)
             return [dict(row) for row in await cursor.fetchall()]
 
-    async def init(self):
-        async with aiosqlite.connect(self.path) as db:
+    async def init(self, migrate: bool = True):
+        async with self.pool.connection() as db:
             await db.executescript(SCHEMA)
             await db.commit()
+        if migrate:
+            await self.migrate()
         log.info(f"Database initialized: {self.path}")
 
+    @asynccontextmanager
+    async def bulk_load(self, batch_size: int = None):
+        """Single-transaction bulk insert session with load-tuned PRAGMAs.
+
+        The connection goes back to the pool afterwards, so the previous
+        PRAGMA values are restored on the way out.
+        """
+        tuned = {
+            "synchronous": "OFF",
+            "temp_store": "MEMORY",
+            "cache_size": f"-{Config.DB_BULK_CACHE_KB}",
+        }
+        async with self.pool.connection() as db:
+            previous = {}
+            for pragma in tuned:
+                cursor = await db.execute(f"PRAGMA {pragma}")
+                previous[pragma] = (await cursor.fetchone())[0]
+            try:
+                for pragma, value in tuned.items():
+                    await db.execute(f"PRAGMA {pragma}={value}")
+                await db.execute("BEGIN")
+                try:
+                    yield BulkWriter(db, batch_size or Config.DB_BULK_BATCH_SIZE)
+                    await db.commit()
+                except BaseException:
+                    await db.rollback()
+                    raise
+            finally:
+                for pragma, value in previous.items():
+                    await db.execute(f"PRAGMA {pragma}={value}")
+                await db.execute("PRAGMA cache_size=-2000")
+
+    async def merge_sales_shards(self, shard_paths: list[str]) -> int:
+        """Append shard files (each with a bare `sales` table) into sales.
+
+        Secondary indexes and rollup triggers on sales are dropped for the merge
+        and recreated afterwards; sales_daily is then rebuilt in one pass.
+        """
+        total = 0
+        async with self.pool.connection() as db:
+            await db.execute("PRAGMA synchronous=OFF")
+            cursor = await db.execute(
+                "SELECT type, name, sql FROM sqlite_master "
+                "WHERE tbl_name = 'sales' AND type IN ('index', 'trigger') "
+                "AND sql IS NOT NULL"
+            )
+            deferred = await cursor.fetchall()
+            for obj_type, name, _ in deferred:
+                await db.execute(f"DROP {obj_type.upper()} IF EXISTS {name}")
+
+            try:
+                for path in shard_paths:
+                    # ATTACH is not allowed inside a transaction, so each shard
+                    # is its own transaction.
+                    await db.execute("ATTACH DATABASE ? AS shard", (path,))
+                    try:
+                        cursor = await db.execute(
+                            "INSERT INTO sales (product_id, quantity, amount, sale_date, region) "
+                            "SELECT product_id, quantity, amount, sale_date, region "
+                            "FROM shard.sales ORDER BY rowid"
+                        )
+                        total += cursor.rowcount
+                        await db.commit()
+                    finally:
+                        await db.execute("DETACH DATABASE shard")
+            finally:
+                for _, _, sql in deferred:
+                    await db.execute(sql)
+                await db.commit()
+                await db.executescript(f"BEGIN;\n{SALES_DAILY_REBUILD}\nCOMMIT;")
+                await db.execute("PRAGMA synchronous=NORMAL")
+        return total
+
+    async def schema_version(self) -> int:
+        async with self.pool.connection() as db:
+            cursor = await db.execute("PRAGMA user_version")
+            return (await cursor.fetchone())[0]
+
+    async def migrate(self, target: int = None):
+        current = await self.schema_version()
+        pending = [
+            m
+            for m in MIGRATIONS
+            if m[0] > current and (target is None or m[0] <= target)
+        ]
+        if not pending:
+            return
+
+        async with self.pool.connection() as db:
+            for version, name, sql in pending:
+                log.info(f"Database migration {version}: {name}")
+                await db.executescript(
+                    f"BEGIN;\n{sql}\nPRAGMA user_version = {version};\nCOMMIT;"
+                )
+            await db.execute("PRAGMA optimize")
+
     # Sales / Products
 
     async def get_product(self, product_id: int) -> dict | None:
@@ -94,10 +403,12 @@ class Database:
     async def get_all_products(self) -> list[dict]:
         return await self._fetch("SELECT * FROM products ORDER BY name")
 
+    # Date-range aggregates read the sales_daily rollup, so cost scales with
+    # the number of days in range rather than the number of orders.
     async def get_sales(self, start: str, end: str) -> list[dict]:
         return await self._fetch(
-            "SELECT sale_date, SUM(amount) as revenue, SUM(quantity) as orders "
-            "FROM sales WHERE sale_date BETWEEN ? AND ? GROUP BY sale_date",
+            "SELECT sale_date, SUM(revenue) as revenue, SUM(units) as orders "
+            "FROM sales_daily WHERE sale_date BETWEEN ? AND ? GROUP BY sale_date",
             (start, end),
         )
 
@@ -105,19 +416,23 @@ class Database:
         self, start: str, end: str, limit: int = 5
     ) -> list[dict]:
         return await self._fetch(
-            "SELECT p.id, p.name, SUM(s.amount) as revenue, SUM(s.quantity) as units "
-            "FROM sales s JOIN products p ON s.product_id = p.id "
-            "WHERE s.sale_date BETWEEN ? AND ? GROUP BY p.id ORDER BY revenue DESC LIMIT ?",
+            "SELECT p.id, p.name, SUM(d.revenue) as revenue, SUM(d.units) as units "
+            "FROM sales_daily d JOIN products p ON d.product_id = p.id "
+            "WHERE d.sale_date BETWEEN ? AND ? GROUP BY p.id ORDER BY revenue DESC LIMIT ?",
             (start, end, limit),
         )
 
     async def get_sales_by_region(self, start: str, end: str) -> list[dict]:
         return await self._fetch(
-            "SELECT region, SUM(amount) as revenue, SUM(quantity) as orders "
-            "FROM sales WHERE sale_date BETWEEN ? AND ? GROUP BY region",
+            "SELECT NULLIF(region, '') as region, SUM(revenue) as revenue, SUM(units) as orders "
+            "FROM sales_daily WHERE sale_date BETWEEN ? AND ? GROUP BY region",
             (start, end),
         )
 
+    async def rebuild_sales_daily(self):
+        async with self.pool.connection() as db:
+            await db.executescript(f"BEGIN;\n{SALES_DAILY_REBUILD}\nCOMMIT;")
+
     async def get_product_sales(
         self, product_id: int, start: str, end: str
     ) -> list[dict]:
@@ -208,6 +523,53 @@ class Database:
             )
         return await self._fetch("SELECT * FROM incidents ORDER BY occurred_at DESC")
 
+    # Vector sync
+    async def get_vector_changes(self, limit: int = 256) -> list[dict]:
+        return await self._fetch(
+            "SELECT seq, table_name, row_id FROM vector_changes ORDER BY seq LIMIT ?",
+            (limit,),
+        )
+
+    async def clear_vector_changes(self, upto_seq: int = None):
+        if upto_seq is None:
+            await self._execute("DELETE FROM vector_changes")
+        else:
+            await self._execute(
+                "DELETE FROM vector_changes WHERE seq <= ?", (upto_seq,)
+            )
+
+    async def mark_vector_synced(
+        self, table: str, upserted: list[int], deleted: list[int] = ()
+    ):
+        async with self.pool.connection() as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO vector_synced VALUES (?, ?)",
+                [(table, i) for i in upserted],
+            )
+            await db.executemany(
+                "DELETE FROM vector_synced WHERE table_name = ? AND row_id = ?",
+                [(table, i) for i in deleted],
+            )
+            await db.commit()
+
+    async def requeue_vector_synced(self) -> int:
+        """Re-log every previously synced row so the next sync rewrites it."""
+        async with self.pool.connection() as db:
+            cursor = await db.execute(
+                "INSERT INTO vector_changes (table_name, row_id) "
+                "SELECT table_name, row_id FROM vector_synced"
+            )
+            await db.commit()
+            return cursor.rowcount
+
+    async def get_rows_by_id(self, table: str, ids: list[int]) -> list[dict]:
+        if table not in ("tickets", "incidents"):
+            raise ValueError(f"Unsupported table: {table}")
+        placeholders = ",".join("?" * len(ids))
+        return await self._fetch(
+            f"SELECT * FROM {table} WHERE id IN ({placeholders})", tuple(ids)
+        )
+
     # Actions
     async def apply_discount(self, product_id: int, percent: float):
         before = await self._fetch(
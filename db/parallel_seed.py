@@ -0,0 +1,181 @@
+import asyncio
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+import numpy as np
+from .database import Database
+from .seed import (
+    BASE_PRICES,
+    BASE_PRODUCTS,
+    PRODUCT_SEASONAL,
+    PRODUCT_WEIGHTS,
+    QUANTITY_WEIGHTS,
+    REGION_WEIGHTS,
+    REGIONS,
+    STOCKOUTS,
+    _anomaly_days,
+    _daily_orders,
+    _variant_price,
+)
+from logger import log
+
+# Days generated per vectorised block; bounds worker memory at large scale factors.
+BLOCK_DAYS = 16
+
+SHARD_SCHEMA = """
+CREATE TABLE sales (
+    product_id INTEGER,
+    quantity INTEGER,
+    amount REAL,
+    sale_date TEXT,
+    region TEXT
+);
+"""
+
+
+def _partition(days: int, workers: int) -> list[tuple[int, int]]:
+    bounds = np.linspace(0, days, workers + 1).astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def _generate_shard(task: dict) -> tuple[str, int]:
+    """Worker: generate sales for days_ago in [start, end) into a shard file."""
+    rng = np.random.default_rng(task["seed_seq"])
+    scale_factor = task["scale_factor"]
+    today = task["today"]
+    anomalies = task["anomalies"]
+
+    product_p = np.array(PRODUCT_WEIGHTS, dtype=float)
+    product_p /= product_p.sum()
+    quantity_p = np.array(QUANTITY_WEIGHTS, dtype=float)
+    quantity_p /= quantity_p.sum()
+    region_p = np.array(REGION_WEIGHTS, dtype=float)
+    region_p /= region_p.sum()
+    regions = np.array(REGIONS, dtype=object)
+
+    # price[variant, base] with base 0-indexed
+    price = np.array(
+        [
+            [_variant_price(BASE_PRICES[b + 1], v) for b in range(BASE_PRODUCTS)]
+            for v in range(scale_factor)
+        ]
+    )
+
+    conn = sqlite3.connect(task["path"])
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.executescript(SHARD_SCHEMA)
+
+    total = 0
+    for block_start in range(task["start"], task["end"], BLOCK_DAYS):
+        days_ago = np.arange(block_start, min(block_start + BLOCK_DAYS, task["end"]))
+        dates = [today - timedelta(days=int(d)) for d in days_ago]
+        counts = [
+            _daily_orders(dt, int(d), anomalies, scale_factor)
+            for dt, d in zip(dates, days_ago)
+        ]
+
+        # Per-(day, base product) stockout mask and seasonal multiplier
+        stocked_out = np.zeros((len(days_ago), BASE_PRODUCTS), dtype=bool)
+        for pid, windows in STOCKOUTS.items():
+            for lo, hi in windows:
+                stocked_out[:, pid - 1] |= (days_ago >= lo) & (days_ago <= hi)
+        multiplier = np.ones((len(days_ago), BASE_PRODUCTS))
+        for i, dt in enumerate(dates):
+            for pid, by_month in PRODUCT_SEASONAL.items():
+                multiplier[i, pid - 1] = by_month.get(dt.month, 1.0)
+
+        day = np.repeat(np.arange(len(days_ago)), counts)
+        base = rng.choice(BASE_PRODUCTS, size=len(day), p=product_p)
+        keep = ~stocked_out[day, base]
+        day, base = day[keep], base[keep]
+
+        n = len(day)
+        quantity = rng.choice(np.arange(1, 5), size=n, p=quantity_p)
+        region = rng.choice(len(REGIONS), size=n, p=region_p)
+        if scale_factor > 1:
+            variant = rng.integers(scale_factor, size=n)
+        else:
+            variant = np.zeros(n, dtype=int)
+        amount = price[variant, base] * multiplier[day, base] * quantity
+        product_id = base + 1 + variant * BASE_PRODUCTS
+
+        iso_dates = np.array([dt.isoformat() for dt in dates], dtype=object)
+        conn.executemany(
+            "INSERT INTO sales (product_id, quantity, amount, sale_date, region) "
+            "VALUES (?, ?, ?, ?, ?)",
+            zip(
+                product_id.tolist(),
+                quantity.tolist(),
+                amount.tolist(),
+                iso_dates[day].tolist(),
+                regions[region].tolist(),
+            ),
+        )
+        total += n
+
+    conn.commit()
+    conn.close()
+    return task["path"], total
+
+
+def generate_sales_shards(
+    shard_dir: str,
+    scale_factor: int,
+    seed: int,
+    workers: int,
+    days: int = 365,
+) -> list[str]:
+    """Generate sales in parallel, one shard file per worker, in partition order.
+
+    Output depends only on (seed, workers, scale_factor, today): each partition
+    gets its own child SeedSequence, and anomaly days match the serial seeder.
+    """
+    today = datetime.now().date()
+    anomalies = _anomaly_days(random.Random(seed), today)
+    seed_seqs = np.random.SeedSequence(seed).spawn(workers)
+
+    tasks = [
+        {
+            "path": os.path.join(shard_dir, f"sales_{i:04d}.db"),
+            "start": start,
+            "end": end,
+            "seed_seq": seed_seqs[i],
+            "scale_factor": scale_factor,
+            "today": today,
+            "anomalies": anomalies,
+        }
+        for i, (start, end) in enumerate(_partition(days, workers))
+    ]
+
+    # spawn, not fork: the parent has live event-loop and aiosqlite threads.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        results = list(pool.map(_generate_shard, tasks))
+
+    log.debug(f"Generated {sum(n for _, n in results)} sales rows in {workers} shards")
+    return [path for path, _ in results]
+
+
+async def seed_sales_parallel(
+    db: Database, scale_factor: int, seed: int, workers: int
+) -> int:
+    start = time.perf_counter()
+    shard_root = os.path.dirname(os.path.abspath(db.path))
+    with tempfile.TemporaryDirectory(prefix="sales_shards_", dir=shard_root) as tmp:
+        shards = await asyncio.to_thread(
+            generate_sales_shards, tmp, scale_factor, seed, workers
+        )
+        generated = time.perf_counter()
+        count = await db.merge_sales_shards(shards)
+
+    log.info(
+        f"Seeded {count} sales rows with {workers} workers "
+        f"(generate {generated - start:.1f}s, merge {time.perf_counter() - generated:.1f}s)"
+    )
+    return count
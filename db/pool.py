@@ -0,0 +1,191 @@
+import asyncio
+import atexit
+import threading
+import time
+import weakref
+import aiosqlite
+from contextlib import asynccontextmanager
+from logger import log
+
+
+class PoolClosedError(RuntimeError):
+    pass
+
+
+class PoolTimeoutError(TimeoutError):
+    pass
+
+
+# One atexit hook for every pool, so recreated pools do not pile up hooks
+_pools: "weakref.WeakSet[ConnectionPool]" = weakref.WeakSet()
+
+
+@atexit.register
+def _terminate_pools():
+    for pool in list(_pools):
+        pool.terminate()
+
+
+class ConnectionPool:
+    """Bounded pool of long-lived aiosqlite connections for one database file.
+
+    The pool only uses thread primitives, so it can be shared by callers running
+    on different event loops (Streamlit reruns, tool threads, tests).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int = 5,
+        timeout: float = 30.0,
+        ping_interval: float = 60.0,
+    ):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[tuple[aiosqlite.Connection, float]] = []
+        self._open = 0
+        self._closed = False
+
+        _pools.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "closed": self._closed,
+            }
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = aiosqlite.connect(self.path)
+        # Idle pooled connections must never keep the interpreter alive at exit.
+        thread = getattr(conn, "_thread", None)
+        if thread is not None:
+            thread.daemon = True
+        conn = await conn
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA busy_timeout=5000")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._open += 1
+        log.debug(f"DB pool: opened connection ({self._open}/{self.size})")
+        return conn
+
+    async def _discard(self, conn: aiosqlite.Connection):
+        with self._lock:
+            self._open -= 1
+        try:
+            await conn.close()
+        except Exception as e:
+            log.debug(f"DB pool: error closing connection: {e}")
+
+    async def _ping(self, conn: aiosqlite.Connection) -> bool:
+        try:
+            await conn.execute("SELECT 1")
+            return True
+        except Exception as e:
+            log.warning(f"DB pool: dropping unhealthy connection: {e}")
+            return False
+
+    def _release_abandoned(self, future: asyncio.Future):
+        # The waiter was cancelled but the thread still took a slot; hand it back
+        if not future.cancelled() and future.exception() is None and future.result():
+            self._slots.release()
+
+    async def _acquire_slot(self):
+        if self._slots.acquire(blocking=False):
+            return
+        future = asyncio.get_running_loop().run_in_executor(
+            None, self._slots.acquire, True, self.timeout
+        )
+        try:
+            # Shielded so cancelling the caller cannot orphan a granted slot
+            acquired = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self._release_abandoned)
+            raise
+        if not acquired:
+            raise PoolTimeoutError(
+                f"Timed out after {self.timeout}s waiting for a DB connection"
+            )
+
+    async def acquire(self) -> aiosqlite.Connection:
+        if self._closed:
+            raise PoolClosedError("Connection pool is closed")
+
+        await self._acquire_slot()
+        try:
+            while True:
+                with self._lock:
+                    entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    return await self._connect()
+                conn, idle_since = entry
+                fresh = time.monotonic() - idle_since < self.ping_interval
+                if fresh or await self._ping(conn):
+                    return conn
+                await self._discard(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, conn: aiosqlite.Connection, discard: bool = False):
+        try:
+            if not discard and not self._closed:
+                try:
+                    if conn.in_transaction:
+                        await conn.rollback()
+                except Exception:
+                    discard = True
+
+            if discard or self._closed:
+                await self._discard(conn)
+            else:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        conn = await self.acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            broken = not await self._ping(conn)
+            raise
+        finally:
+            await self.release(conn, discard=broken)
+
+    async def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            await self._discard(conn)
+        log.info(f"DB pool closed: {self.path}")
+
+    def terminate(self):
+        """Synchronous shutdown for atexit: stop idle connection worker threads."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for conn, _ in idle:
+            try:
+                conn.stop()
+            except Exception:
+                pass
@@ -0,0 +1,69 @@
+import asyncio
+import atexit
+import threading
+from logger import log
+
+
+class AsyncRunner:
+    """Long-lived event loop on a daemon thread with a sync bridge.
+
+    Sync code (tools, actions, the dashboard) submits coroutines here instead of
+    spinning up a fresh loop or thread pool per call.
+    """
+
+    def __init__(self, name: str = "ecomx-async"):
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _serve():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._loop = loop
+        self._thread = threading.Thread(target=_serve, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        log.debug(f"Async runner started: {self.name}")
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: float | None = None):
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run_async() cannot be called from the runner loop")
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+
+runner = AsyncRunner()
+atexit.register(runner.stop)
+
+
+def run_async(coro, timeout: float | None = None):
+    return runner.run(coro, timeout)
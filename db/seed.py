@@ -1,13 +1,112 @@
+import argparse
 import asyncio
 import random
 from datetime import datetime, timedelta
-from .database import Database
+from itertools import accumulate
+from .database import Database, BulkWriter
 from logger import log
 
-random.seed(42)
+# The hand-written catalogue. A scale factor of N adds N-1 variants of each
+# base product (ids offset by BASE_PRODUCTS) and scales every other table to
+# match, keeping the seasonal, anomaly and stockout structure intact.
+BASE_PRODUCTS = 15
+
+BASE_PRICES = {
+    1: 79.99,
+    2: 129.99,
+    3: 149.99,
+    4: 29.99,
+    5: 59.99,
+    6: 199.99,
+    7: 89.99,
+    8: 34.99,
+    9: 49.99,
+    10: 34.99,
+    11: 44.99,
+    12: 29.99,
+    13: 24.99,
+    14: 89.99,
+    15: 159.99,
+}
+REGIONS = ["North", "South", "East", "West"]
+
+# Order mix: base product, quantity and region weights
+PRODUCT_WEIGHTS = [15, 12, 10, 8, 10, 8, 7, 6, 9, 7, 10, 8, 12, 6, 5]
+QUANTITY_WEIGHTS = [55, 30, 12, 3]
+REGION_WEIGHTS = [30, 25, 25, 20]
+
+# Seasonal multipliers by month
+SEASONAL = {
+    1: 0.7,  # Jan - post-holiday slump
+    2: 0.75,  # Feb
+    3: 0.85,  # Mar - recovery
+    4: 0.9,  # Apr
+    5: 0.95,  # May
+    6: 1.0,  # Jun
+    7: 0.9,  # Jul - summer lull
+    8: 1.1,  # Aug - back to school
+    9: 1.0,  # Sep
+    10: 1.1,  # Oct - pre-holiday
+    11: 1.4,  # Nov - Black Friday
+    12: 1.5,  # Dec - Holiday peak
+}
+
+# Product seasonality
+PRODUCT_SEASONAL = {
+    3: {11: 1.8, 12: 2.0, 1: 1.5, 2: 1.3},  # Winter Jacket
+    2: {3: 1.3, 4: 1.4, 5: 1.5, 9: 1.3},  # Running Shoes
+    14: {5: 1.5, 6: 1.8, 7: 1.8, 8: 1.5},  # Sunglasses
+    15: {4: 1.3, 5: 1.5, 6: 1.4, 9: 1.3},  # Hiking Boots
+}
+
+# Stockout periods in days ago (no sales for specific products)
+STOCKOUTS = {
+    1: [(30, 35), (120, 125), (250, 255)],  # Wireless Headphones
+    4: [(45, 50), (180, 185)],  # Yoga Mat
+    11: [(60, 68), (200, 210)],  # Protein Powder
+    6: [(90, 95)],  # Smart Watch
+}
+
+
+def _anomaly_days(rng: random.Random, today) -> dict:
+    # Anomaly days (sales drops/spikes)
+    anomalies = {}
+    for _ in range(20):
+        day_offset = rng.randint(7, 365)
+        anomaly_date = today - timedelta(days=day_offset)
+        anomalies[anomaly_date] = rng.choice([0.3, 0.4, 0.5, 1.5, 1.8, 2.0])
+    return anomalies
+
+
+def _daily_orders(date, days_ago: int, anomalies: dict, scale_factor: int) -> int:
+    # Base orders
+    base_orders = 12 if date.weekday() < 5 else 18
+    base_orders = int(base_orders * scale_factor * SEASONAL.get(date.month, 1.0))
+
+    # Apply anomaly
+    if date in anomalies:
+        base_orders = int(base_orders * anomalies[date])
+
+    # Yesterday specific drop for demo
+    if days_ago == 1:
+        base_orders = int(base_orders * 0.35)
+    elif days_ago == 2:
+        base_orders = int(base_orders * 0.5)
+    return base_orders
+
+
+def _scaled_id(base_id: int, variant: int) -> int:
+    return base_id + variant * BASE_PRODUCTS
+
+
+def _variant_price(price: float, variant: int) -> float:
+    # Deterministic +/-15% spread so variants don't all share one price point.
+    if variant == 0:
+        return price
+    return round(price * (0.85 + ((variant * 37) % 31) / 100), 2)
 
 
-async def seed_database():
+async def seed_database(scale_factor: int = 1, seed: int = 42, workers: int = 1):
     db = Database()
     await db.init()
 
@@ -16,17 +115,31 @@ async def seed_database():
         log.info("Database already seeded")
         return
 
-    await seed_products(db)
-    await seed_inventory(db)
-    await seed_sales(db)
-    await seed_tickets(db)
-    await seed_campaigns(db)
-    await seed_incidents(db)
+    rng = random.Random(seed)
+    async with db.bulk_load() as writer:
+        await seed_products(writer, scale_factor)
+        await seed_inventory(writer, scale_factor)
+        if workers <= 1:
+            await seed_sales(writer, rng, scale_factor)
+        await seed_tickets(writer, rng, scale_factor)
+        await seed_campaigns(writer, rng, scale_factor)
+        await seed_incidents(writer, rng, scale_factor)
 
-    log.info("Database seeded successfully")
+    if workers > 1:
+        # Sales dominate at large scale factors: generate them with NumPy in a
+        # process pool and merge the shards (requires numpy).
+        from .parallel_seed import seed_sales_parallel
 
+        await seed_sales_parallel(db, scale_factor, seed, workers)
 
-async def seed_products(db: Database):
+    # The vector store is seeded from its own curated tickets and incidents
+    # (vectorstore/seed.py); these generated rows are deliberately kept out of
+    # it, so drop their change-log entries. Later inserts and updates sync.
+    await db.clear_vector_changes()
+    log.info(f"Database seeded successfully (scale factor {scale_factor})")
+
+
+async def seed_products(writer: BulkWriter, scale_factor: int = 1):
     products = [
         (
             1,
@@ -74,15 +187,27 @@ async def seed_products(db: Database):
         (14, "Sunglasses", "Accessories", 89.99, "Polarized UV protection sunglasses"),
         (15, "Hiking Boots", "Footwear", 159.99, "Waterproof trail hiking boots"),
     ]
-    for p in products:
-        await db._execute(
-            "INSERT INTO products (id, name, category, price, description) VALUES (?, ?, ?, ?, ?)",
-            p,
-        )
-    log.debug(f"Added {len(products)} products")
+
+    def generate():
+        yield from products
+        for variant in range(1, scale_factor):
+            for pid, name, category, price, description in products:
+                yield (
+                    _scaled_id(pid, variant),
+                    f"{name} #{variant + 1}",
+                    category,
+                    _variant_price(price, variant),
+                    description,
+                )
+
+    count = await writer.insert(
+        "INSERT INTO products (id, name, category, price, description) VALUES (?, ?, ?, ?, ?)",
+        generate(),
+    )
+    log.debug(f"Added {count} products")
 
 
-async def seed_inventory(db: Database):
+async def seed_inventory(writer: BulkWriter, scale_factor: int = 1):
     inventory = [
         (1, 0, 15),  # OUT OF STOCK - Wireless Headphones
         (2, 8, 20),  # LOW - Running Shoes
@@ -100,127 +225,70 @@ async def seed_inventory(db: Database):
         (14, 15, 10),  # OK - Sunglasses
         (15, 7, 12),  # LOW - Hiking Boots
     ]
-    for i in inventory:
-        await db._execute(
-            "INSERT INTO inventory (product_id, stock, reorder_level) VALUES (?, ?, ?)",
-            i,
-        )
-        log.debug(f"Added {len(inventory)} inventory records")
+    count = await writer.insert(
+        "INSERT INTO inventory (product_id, stock, reorder_level) VALUES (?, ?, ?)",
+        (
+            (_scaled_id(pid, variant), stock, reorder)
+            for variant in range(scale_factor)
+            for pid, stock, reorder in inventory
+        ),
+    )
+    log.debug(f"Added {count} inventory records")
 
 
-async def seed_sales(db: Database):
+async def seed_sales(writer: BulkWriter, rng: random.Random, scale_factor: int = 1):
     today = datetime.now().date()
-    products = list(range(1, 16))
-    prices = {
-        1: 79.99,
-        2: 129.99,
-        3: 149.99,
-        4: 29.99,
-        5: 59.99,
-        6: 199.99,
-        7: 89.99,
-        8: 34.99,
-        9: 49.99,
-        10: 34.99,
-        11: 44.99,
-        12: 29.99,
-        13: 24.99,
-        14: 89.99,
-        15: 159.99,
-    }
-    regions = ["North", "South", "East", "West"]
-
-    # Seasonal multipliers by month
-    seasonal = {
-        1: 0.7,  # Jan - post-holiday slump
-        2: 0.75,  # Feb
-        3: 0.85,  # Mar - recovery
-        4: 0.9,  # Apr
-        5: 0.95,  # May
-        6: 1.0,  # Jun
-        7: 0.9,  # Jul - summer lull
-        8: 1.1,  # Aug - back to school
-        9: 1.0,  # Sep
-        10: 1.1,  # Oct - pre-holiday
-        11: 1.4,  # Nov - Black Friday
-        12: 1.5,  # Dec - Holiday peak
-    }
-
-    # Product seasonality
-    product_seasonal = {
-        3: {11: 1.8, 12: 2.0, 1: 1.5, 2: 1.3},  # Winter Jacket
-        2: {3: 1.3, 4: 1.4, 5: 1.5, 9: 1.3},  # Running Shoes
-        14: {5: 1.5, 6: 1.8, 7: 1.8, 8: 1.5},  # Sunglasses
-        15: {4: 1.3, 5: 1.5, 6: 1.4, 9: 1.3},  # Hiking Boots
-    }
-
-    # Anomaly days (sales drops/spikes)
-    anomalies = {}
-    for _ in range(20):
-        day_offset = random.randint(7, 365)
-        anomaly_date = today - timedelta(days=day_offset)
-        anomalies[anomaly_date] = random.choice([0.3, 0.4, 0.5, 1.5, 1.8, 2.0])
-
-    # Stockout periods (no sales for specific products)
-    stockouts = {
-        1: [(30, 35), (120, 125), (250, 255)],  # Wireless Headphones
-        4: [(45, 50), (180, 185)],  # Yoga Mat
-        11: [(60, 68), (200, 210)],  # Protein Powder
-        6: [(90, 95)],  # Smart Watch
-    }
-
-    sales_count = 0
-    for days_ago in range(365):
-        date = today - timedelta(days=days_ago)
-        month = date.month
-        weekday = date.weekday()
-
-        # Base orders
-        base_orders = 12 if weekday < 5 else 18
-        base_orders = int(base_orders * seasonal.get(month, 1.0))
-
-        # Apply anomaly
-        if date in anomalies:
-            base_orders = int(base_orders * anomalies[date])
-
-        # Yesterday specific drop for demo
-        if days_ago == 1:
-            base_orders = int(base_orders * 0.35)
-        elif days_ago == 2:
-            base_orders = int(base_orders * 0.5)
-
-        for _ in range(base_orders):
-            product_id = random.choices(
-                products,
-                weights=[15, 12, 10, 8, 10, 8, 7, 6, 9, 7, 10, 8, 12, 6, 5],
-            )[0]
-
-            # Check stockout
-            is_stockout = False
-            for start, end in stockouts.get(product_id, []):
-                if start <= days_ago <= end:
-                    is_stockout = True
-                    break
-            if is_stockout:
-                continue
-
-            # Product seasonality
-            prod_mult = product_seasonal.get(product_id, {}).get(month, 1.0)
-
-            quantity = random.choices([1, 2, 3, 4], [55, 30, 12, 3])[0]
-            price = prices[product_id] * prod_mult
-            region = random.choices(regions, [30, 25, 25, 20])[0]
-
-            await db._execute(
-                "INSERT INTO sales (product_id, quantity, amount, sale_date, region) VALUES (?, ?, ?, ?, ?)",
-                (product_id, quantity, price * quantity, date.isoformat(), region),
-            )
-            sales_count += 1
-
+    products = list(range(1, BASE_PRODUCTS + 1))
+    anomalies = _anomaly_days(rng, today)
+
+    # Precomputed cumulative weights: same draws as weights=, without
+    # re-accumulating per order.
+    product_cum = list(accumulate(PRODUCT_WEIGHTS))
+    quantity_cum = list(accumulate(QUANTITY_WEIGHTS))
+    region_cum = list(accumulate(REGION_WEIGHTS))
+
+    def generate():
+        for days_ago in range(365):
+            date = today - timedelta(days=days_ago)
+            month = date.month
+            base_orders = _daily_orders(date, days_ago, anomalies, scale_factor)
+
+            for _ in range(base_orders):
+                product_id = rng.choices(products, cum_weights=product_cum)[0]
+
+                # Check stockout
+                is_stockout = False
+                for start, end in STOCKOUTS.get(product_id, []):
+                    if start <= days_ago <= end:
+                        is_stockout = True
+                        break
+                if is_stockout:
+                    continue
+
+                # Product seasonality
+                prod_mult = PRODUCT_SEASONAL.get(product_id, {}).get(month, 1.0)
+
+                quantity = rng.choices([1, 2, 3, 4], cum_weights=quantity_cum)[0]
+                region = rng.choices(REGIONS, cum_weights=region_cum)[0]
+                variant = rng.randrange(scale_factor) if scale_factor > 1 else 0
+                price = _variant_price(BASE_PRICES[product_id], variant) * prod_mult
+
+                yield (
+                    _scaled_id(product_id, variant),
+                    quantity,
+                    price * quantity,
+                    date.isoformat(),
+                    region,
+                )
+
+    sales_count = await writer.insert(
+        "INSERT INTO sales (product_id, quantity, amount, sale_date, region) VALUES (?, ?, ?, ?, ?)",
+        generate(),
+    )
     log.debug(f"Added {sales_count} sales records")
 
 
-async def seed_tickets(db: Database):
+async def seed_tickets(writer: BulkWriter, rng: random.Random, scale_factor: int = 1):
     today = datetime.now()
     categories = ["shipping", "order", "refund", "technical", "billing", "product"]
     priorities = ["high", "medium", "low"]
@@ -311,73 +379,77 @@ async def seed_tickets(db: Database):
 
     # Generate open tickets (recent)
     open_tickets = []
-    for i in range(15):
-        template = random.choice(ticket_templates)
+    for i in range(15 * scale_factor):
+        template = rng.choice(ticket_templates)
         subject = template[0]
         desc = template[1].format(
-            order=random.randint(10000, 99999),
-            days=random.randint(3, 14),
-            wrong=random.choice(products),
-            right=random.choice(products),
-            code=random.choice(codes),
-            product=random.choice(products),
-            size=random.choice(sizes),
-            received=random.randint(1, 2),
-            total=random.randint(3, 5),
-            issue=random.choice(issues),
+            order=rng.randint(10000, 99999),
+            days=rng.randint(3, 14),
+            wrong=rng.choice(products),
+            right=rng.choice(products),
+            code=rng.choice(codes),
+            product=rng.choice(products),
+            size=rng.choice(sizes),
+            received=rng.randint(1, 2),
+            total=rng.randint(3, 5),
+            issue=rng.choice(issues),
             ordered="M",
-            damage=random.choice(["crushed", "wet", "torn"]),
-            competitor=random.choice(["Amazon", "Walmart", "Target"]),
+            damage=rng.choice(["crushed", "wet", "torn"]),
+            competitor=rng.choice(["Amazon", "Walmart", "Target"]),
         )
-        created = today - timedelta(hours=random.randint(1, 72))
+        created = today - timedelta(hours=rng.randint(1, 72))
         open_tickets.append(
             (subject, desc, template[2], template[3], "open", created.isoformat())
         )
 
-    for t in open_tickets:
-        await db._execute(
-            "INSERT INTO tickets (subject, description, category, priority, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            t,
-        )
+    insert = (
+        "INSERT INTO tickets (subject, description, category, priority, status, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+    await writer.insert(insert, open_tickets)
 
     # Generate resolved tickets (historical)
-    resolved_count = 0
-    for days_ago in range(365):
-        date = today - timedelta(days=days_ago)
-        month = date.month
-
-        # More tickets during holiday season
-        base_tickets = 3 if month in [11, 12, 1] else 2
-        num_tickets = random.randint(1, base_tickets)
-
-        for _ in range(num_tickets):
-            template = random.choice(ticket_templates)
-            subject = template[0]
-            desc = template[1].format(
-                order=random.randint(10000, 99999),
-                days=random.randint(3, 14),
-                wrong=random.choice(products),
-                right=random.choice(products),
-                code=random.choice(codes),
-                product=random.choice(products),
-                size=random.choice(sizes),
-                received=random.randint(1, 2),
-                total=random.randint(3, 5),
-                issue=random.choice(issues),
-                ordered="M",
-                damage=random.choice(["crushed", "wet", "torn"]),
-                competitor=random.choice(["Amazon", "Walmart", "Target"]),
-            )
-            await db._execute(
-                "INSERT INTO tickets (subject, description, category, priority, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (subject, desc, template[2], template[3], "resolved", date.isoformat()),
-            )
-            resolved_count += 1
-
+    def generate_resolved():
+        for days_ago in range(365):
+            date = today - timedelta(days=days_ago)
+            month = date.month
+
+            # More tickets during holiday season
+            base_tickets = 3 if month in [11, 12, 1] else 2
+            num_tickets = sum(rng.randint(1, base_tickets) for _ in range(scale_factor))
+
+            for _ in range(num_tickets):
+                template = rng.choice(ticket_templates)
+                subject = template[0]
+                desc = template[1].format(
+                    order=rng.randint(10000, 99999),
+                    days=rng.randint(3, 14),
+                    wrong=rng.choice(products),
+                    right=rng.choice(products),
+                    code=rng.choice(codes),
+                    product=rng.choice(products),
+                    size=rng.choice(sizes),
+                    received=rng.randint(1, 2),
+                    total=rng.randint(3, 5),
+                    issue=rng.choice(issues),
+                    ordered="M",
+                    damage=rng.choice(["crushed", "wet", "torn"]),
+                    competitor=rng.choice(["Amazon", "Walmart", "Target"]),
+                )
+                yield (
+                    subject,
+                    desc,
+                    template[2],
+                    template[3],
+                    "resolved",
+                    date.isoformat(),
+                )
+
+    resolved_count = await writer.insert(insert, generate_resolved())
     log.debug(f"Added {len(open_tickets)} open + {resolved_count} resolved tickets")
 
 
-async def seed_campaigns(db: Database):
+async def seed_campaigns(writer: BulkWriter, rng: random.Random, scale_factor: int = 1):
     today = datetime.now().date()
 
     # Active campaigns
@@ -390,11 +462,11 @@ async def seed_campaigns(db: Database):
         ("Email Newsletter", "email", 1500, 1200, "active", 25000, 750, 40),
     ]
 
-    for c in active_campaigns:
-        await db._execute(
-            "INSERT INTO campaigns (name, channel, budget, spent, status, impressions, clicks, conversions) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            c,
-        )
+    insert = (
+        "INSERT INTO campaigns (name, channel, budget, spent, status, impressions, clicks, conversions) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    await writer.insert(insert, _scale_campaigns(active_campaigns, rng, scale_factor))
 
     # Historical campaigns (completed)
     historical_campaigns = [
@@ -417,18 +489,44 @@ async def seed_campaigns(db: Database):
         ("Fall Fashion", "social", 4500, 4500, "completed", 200000, 4000, 200),
     ]
 
-    for c in historical_campaigns:
-        await db._execute(
-            "INSERT INTO campaigns (name, channel, budget, spent, status, impressions, clicks, conversions) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-            c,
-        )
+    await writer.insert(
+        insert, _scale_campaigns(historical_campaigns, rng, scale_factor)
+    )
 
     log.debug(
-        f"Added {len(active_campaigns)} active + {len(historical_campaigns)} historical campaigns"
+        f"Added {len(active_campaigns) * scale_factor} active + "
+        f"{len(historical_campaigns) * scale_factor} historical campaigns"
     )
 
 
-async def seed_incidents(db: Database):
+def _scale_campaigns(campaigns: list[tuple], rng: random.Random, scale_factor: int):
+    yield from campaigns
+    for variant in range(1, scale_factor):
+        for (
+            name,
+            channel,
+            budget,
+            spent,
+            status,
+            impressions,
+            clicks,
+            conv,
+        ) in campaigns:
+            # Jitter volume but keep each campaign's CTR/conversion profile.
+            volume = rng.uniform(0.7, 1.3)
+            yield (
+                f"{name} #{variant + 1}",
+                channel,
+                round(budget * volume, 2),
+                round(spent * volume, 2),
+                status,
+                int(impressions * volume),
+                int(clicks * volume),
+                int(conv * volume),
+            )
+
+
+async def seed_incidents(writer: BulkWriter, rng: random.Random, scale_factor: int = 1):
     today = datetime.now()
 
     incidents = [
@@ -575,14 +673,43 @@ async def seed_incidents(db: Database):
         ),
     ]
 
-    for inc in incidents:
-        await db._execute(
-            "INSERT INTO incidents (type, description, root_cause, action_taken, outcome, occurred_at) VALUES (?, ?, ?, ?, ?, ?)",
-            inc,
-        )
+    def generate():
+        yield from incidents
+        for _ in range(1, scale_factor):
+            for inc_type, desc, cause, action, outcome, occurred_at in incidents:
+                shift = timedelta(days=rng.randint(-10, 10))
+                occurred = datetime.fromisoformat(occurred_at) + shift
+                yield (
+                    inc_type,
+                    desc,
+                    cause,
+                    action,
+                    outcome,
+                    min(occurred, today).isoformat(),
+                )
+
+    count = await writer.insert(
+        "INSERT INTO incidents (type, description, root_cause, action_taken, outcome, occurred_at) VALUES (?, ?, ?, ?, ?, ?)",
+        generate(),
+    )
 
-    log.debug(f"Added {len(incidents)} incidents")
+    log.debug(f"Added {count} incidents")
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    parser = argparse.ArgumentParser(description="Seed the SQLite database")
+    parser.add_argument(
+        "--scale-factor",
+        type=int,
+        default=1,
+        help="Multiply catalogue and data volume (e.g. 10, 100, 1000)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Generate sales in a NumPy process pool with this many workers",
+    )
+    args = parser.parse_args()
+    asyncio.run(seed_database(args.scale_factor, args.seed, args.workers))
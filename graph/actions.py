@@ -1,24 +1,11 @@
 import json
 import uuid
-import asyncio
-from db import Database
+from db import Database, run_async
+from vectorstore import request_sync
 
 db = Database()
 
 
-def run_async(coro):
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 def build_action_context(query: str, synthesis: str) -> str:
     # ctx = fetch_action_context()
     return f"""
@@ -93,9 +80,11 @@ def _handle_create_ticket(params: dict) -> str:
             params.get("priority", "medium"),
         )
     )
+    request_sync()
     return f"✓ Created ticket: {params.get('subject', 'New Ticket')}"
 
 
 def _handle_resolve_ticket(params: dict) -> str:
     run_async(db.resolve_ticket(params["ticket_id"]))
+    request_sync()
     return f"✓ Resolved ticket #{params['ticket_id']}"
@@ -1,12 +1,38 @@
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage
-from config import get_callbacks
+from config import Config, get_callbacks
+from graph.usage import record_usage
 from datetime import datetime
 
+# Shared by every agent; per-agent semaphores cap how much of it each one uses
+_tool_pool = ThreadPoolExecutor(
+    max_workers=Config.TOOL_POOL_SIZE, thread_name_prefix="tool"
+)
+
+
+def tool_concurrency(agent: str) -> int:
+    """Max parallel tool calls for an agent, from TOOL_CONCURRENCY.
+
+    Accepts one limit for every agent ("4") or a per-agent list
+    ("sales=4,memory=2"); agents not listed run tools sequentially.
+    """
+    spec = str(Config.TOOL_CONCURRENCY or "1").replace(" ", "")
+    if "=" in spec:
+        limits = dict(item.split("=", 1) for item in spec.split(",") if item)
+        spec = limits.get(agent, "1")
+    return max(1, int(spec))
+
 
 class BaseAgent(ABC):
     name: str = "base"
 
+    def __init__(self):
+        self._tool_slots = threading.BoundedSemaphore(tool_concurrency(self.name))
+        self._prepared = None
+        self._prepare_lock = threading.Lock()
+
     @abstractmethod
     def get_llm(self):
         pass
@@ -19,17 +45,41 @@ class BaseAgent(ABC):
     def get_tools(self) -> list:
         pass
 
-    def run(self, query: str) -> str:
+    def _call_tool(self, tool_map: dict, tc: dict) -> str:
+        tool = tool_map.get(tc["name"])
+        if not tool:
+            return f"Unknown tool: {tc['name']}"
+        try:
+            return str(tool.invoke(tc["args"]))
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    def _run_tools(self, tool_map: dict, tool_calls: list) -> list[str]:
+        """Run one turn's tool calls concurrently; results keep call order."""
+        if len(tool_calls) == 1:
+            return [self._call_tool(tool_map, tool_calls[0])]
+
+        def call(tc):
+            try:
+                return self._call_tool(tool_map, tc)
+            finally:
+                self._tool_slots.release()
+
+        futures = []
+        for tc in tool_calls:
+            # Acquired here, not in the worker, so waiting never ties up the pool
+            self._tool_slots.acquire()
+            futures.append(_tool_pool.submit(call, tc))
+        return [f.result() for f in futures]
+
+    def _build(self) -> tuple:
         llm = self.get_llm()
         tools = self.get_tools()
         tool_map = {t.name: t for t in tools} if tools else {}
-        callbacks = get_callbacks()
 
         if tools:
             llm = llm.bind_tools(tools)
 
-        today = datetime.now().strftime("%Y-%m-%d")
-
         tool_descriptions = ""
         if tools:
             tool_descriptions = (
@@ -38,34 +88,39 @@ class BaseAgent(ABC):
             for t in tools:
                 tool_descriptions += f"- {t.name}: {t.description}\n"
 
-        system_content = (
-            f"Today's date is {today}.\n\n{self.get_prompt()}{tool_descriptions}"
-        )
+        return llm, tool_map, f"{self.get_prompt()}{tool_descriptions}"
 
+    def _prepare(self) -> tuple:
+        """Bound LLM, tool map and static prompt, built once per agent."""
+        if self._prepared is None:
+            with self._prepare_lock:
+                if self._prepared is None:
+                    self._prepared = self._build()
+        return self._prepared
+
+    def run(self, query: str) -> str:
+        llm, tool_map, prompt = self._prepare()
+        callbacks = get_callbacks()
+
+        # Static prompt first so the provider can cache it; the date goes last
+        today = datetime.now().strftime("%Y-%m-%d")
         messages = [
-            SystemMessage(content=system_content),
-            HumanMessage(content=query),
+            SystemMessage(content=prompt),
+            HumanMessage(content=f"Today's date is {today}.\n\n{query}"),
         ]
 
         max_iterations = 10
         for _ in range(max_iterations):
             response = llm.invoke(messages, config={"callbacks": callbacks})
+            record_usage(self.name, response)
 
             if not hasattr(response, "tool_calls") or not response.tool_calls:
                 return response.content or "No response generated."
 
             messages.append(response)
 
-            for tc in response.tool_calls:
-                tool = tool_map.get(tc["name"])
-                if tool:
-                    try:
-                        result = tool.invoke(tc["args"])
-                    except Exception as e:
-                        result = f"Error: {str(e)}"
-                else:
-                    result = f"Unknown tool: {tc['name']}"
-
-                messages.append(ToolMessage(content=str(result), tool_call_id=tc["id"]))
+            results = self._run_tools(tool_map, response.tool_calls)
+            for tc, result in zip(response.tool_calls, results):
+                messages.append(ToolMessage(content=result, tool_call_id=tc["id"]))
 
         return messages[-1].content if messages else "Max iterations reached."
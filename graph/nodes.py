@@ -5,14 +5,35 @@ from .state import AgentState
 from .prompts import ROUTER_PROMPT, SYNTHESIS_PROMPT, ACTION_PROMPT
 from .agents import AGENTS
 from .actions import build_action_context, parse_actions, execute_action
+from .usage import record_usage
+from .routing import local_route, log_decision, record_route, route_cache
 from logger import log
 from datetime import datetime
 
 VALID_AGENTS = {"sales", "inventory", "support", "marketing", "memory"}
 
 
+def _apply_route(state: AgentState, agents: list[str], source: str) -> AgentState:
+    state["agents_to_call"] = agents
+    state["direct_response"] = not agents
+    if not agents:
+        state["agent_outputs"] = {}
+    log.info(f"Router: {source} {agents or 'none'}")
+    return state
+
+
 def router_node(state: AgentState) -> AgentState:
     log.info("Router: analyzing query")
+
+    agents = local_route(state["query"])
+    if agents is not None:
+        return _apply_route(state, agents, "local match")
+
+    agents, vector = route_cache.get(state["query"], state["chat_history"])
+    if agents is not None:
+        record_route("cache")
+        return _apply_route(state, agents, "cached decision")
+
     llm = get_supervisor_llm()
     callbacks = get_callbacks()
 
@@ -23,19 +44,25 @@ def router_node(state: AgentState) -> AgentState:
         ),
     ]
 
-    response = (
-        llm.invoke(messages, config={"callbacks": callbacks}).content.strip().lower()
-    )
+    record_route("llm")
+    response = llm.invoke(messages, config={"callbacks": callbacks})
+    record_usage("router", response)
+    response = response.content.strip().lower()
 
     if response in ("none", "none."):
         state["agents_to_call"] = []
         state["agent_outputs"] = {}
         state["direct_response"] = True
+        log_decision(state["query"], [])
+        route_cache.put(state["query"], [], vector, state["chat_history"])
         log.info("Router: no agents needed")
     else:
         agents = [a.strip() for a in response.split(",") if a.strip() in VALID_AGENTS]
         state["agents_to_call"] = agents or ["sales", "memory"]
         state["direct_response"] = False
+        if agents:
+            log_decision(state["query"], agents)
+            route_cache.put(state["query"], agents, vector, state["chat_history"])
         log.info(f"Router: calling agents {state['agents_to_call']}")
 
     return state
@@ -81,16 +108,19 @@ def synthesis_node(state: AgentState) -> AgentState:
         findings = "\n\n---\n\n".join(
             [f"## {k.upper()} Agent\n\n{v}" for k, v in outputs.items()]
         )
-        content = f"Context:\n{state['chat_history']}\n\nUser Question: {query}\n\n# Agent Findings\n\n{findings}"
+        content = f"Today's date is {today}.\n\nContext:\n{state['chat_history']}\n\nUser Question: {query}\n\n# Agent Findings\n\n{findings}"
     else:
-        content = f"Context:\n{state['chat_history']}\n\nUser Question: {query}"
+        content = f"Today's date is {today}.\n\nContext:\n{state['chat_history']}\n\nUser Question: {query}"
 
+    # SYNTHESIS_PROMPT alone is the system message so it stays a cacheable prefix
     messages = [
-        SystemMessage(content=f"Today's date is {today}.\n\n{SYNTHESIS_PROMPT}"),
+        SystemMessage(content=SYNTHESIS_PROMPT),
         HumanMessage(content=content),
     ]
 
-    response = llm.invoke(messages, config={"callbacks": callbacks}).content
+    response = llm.invoke(messages, config={"callbacks": callbacks})
+    record_usage("synthesis", response)
+    response = response.content
     state["synthesis"] = response
     state["response"] = response
     log.info("Synthesis: completed")
@@ -109,6 +139,7 @@ def action_node(state: AgentState) -> AgentState:
     ]
 
     response = llm.invoke(messages, config={"callbacks": callbacks})
+    record_usage("action", response)
     state["proposed_actions"] = parse_actions(response.content)
     log.info(f"Action: found {len(state['proposed_actions'])} proposed actions")
     return state
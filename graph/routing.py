@@ -0,0 +1,419 @@
+"""Local routing stage in front of the LLM router.
+
+Keyword rules answer obvious single-topic queries, then a small one-vs-rest
+logistic model over hashed word features (trained from logged LLM router
+decisions) answers anything it is confident about. Everything else falls
+back to the LLM.
+
+Train from the decision log:
+    python -m graph.routing train --log data/router_decisions.jsonl
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+import numpy as np
+from config import Config
+from logger import log
+
+AGENT_NAMES = ("sales", "inventory", "support", "marketing", "memory")
+
+RULES = {
+    "sales": r"\b(sales|revenue|orders?|sold|aov|selling|best[- ]?sellers?)\b",
+    "inventory": r"\b(stock|stockouts?|inventory|restock|reorder|out[- ]of[- ]stock)\b",
+    "support": r"\b(tickets?|complaints?|support|refunds?|returns?|csat)\b",
+    "marketing": r"\b(campaigns?|ads?|marketing|ctr|promotions?|ad[- ]spend|roi)\b",
+    # "past"/"before" alone are time ranges ("past 7 days"), not history lookups
+    "memory": r"\b(incidents?|last time|happened before|history|historical|"
+    r"previous(ly)?|precedents?)\b",
+}
+RULES = {agent: re.compile(pattern, re.I) for agent, pattern in RULES.items()}
+
+GREETING = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|good (morning|afternoon|evening)|bye)"
+    r"[\s!.,]*$",
+    re.I,
+)
+# Diagnostic or summary questions usually need several agents; keyword
+# rules leave them to the model or the LLM.
+DIAGNOSTIC = re.compile(
+    r"\b(why|cause[sd]?|drop(ped)?|declin\w*|health|summary|overview)\b", re.I
+)
+# Pronouns point at earlier turns that only the LLM router sees
+FOLLOW_UP = re.compile(r"\b(it|that|this|those|them|same)\b", re.I)
+TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def features(text: str, dim: int) -> np.ndarray:
+    """L2-normalised hashed unigrams and bigrams; crc32 keeps hashes stable."""
+    tokens = TOKEN.findall(text.lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    x = np.zeros(dim, dtype=np.float32)
+    for g in grams:
+        x[zlib.crc32(g.encode()) % dim] = 1.0
+    norm = np.linalg.norm(x)
+    return x / norm if norm else x
+
+
+def route_by_rules(query: str) -> list[str] | None:
+    if GREETING.match(query):
+        return []
+    if DIAGNOSTIC.search(query) or FOLLOW_UP.search(query):
+        return None
+    agents = [agent for agent, pattern in RULES.items() if pattern.search(query)]
+    # Multi-topic queries are left to the model or the LLM
+    return agents if len(agents) == 1 else None
+
+
+class RouterModel:
+    """One-vs-rest logistic regression, one sigmoid per agent."""
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray, labels: list[str]):
+        self.weights = weights
+        self.bias = bias
+        self.labels = list(labels)
+        self.dim = weights.shape[1]
+
+    def predict(self, query: str) -> tuple[list[str], float]:
+        """Selected agents and a confidence: the least certain label's margin."""
+        logits = self.weights @ features(query, self.dim) + self.bias
+        probs = 1 / (1 + np.exp(-logits))
+        agents = [label for label, p in zip(self.labels, probs) if p >= 0.5]
+        return agents, float(np.min(np.maximum(probs, 1 - probs)))
+
+    @classmethod
+    def train(
+        cls,
+        examples: list[dict],
+        dim: int = 4096,
+        epochs: int = 300,
+        lr: float = 2.0,
+        l2: float = 1e-4,
+    ) -> "RouterModel":
+        labels = list(AGENT_NAMES)
+        X = np.stack([features(e["query"], dim) for e in examples])
+        Y = np.array(
+            [[label in e["agents"] for label in labels] for e in examples],
+            dtype=np.float32,
+        )
+        W = np.zeros((len(labels), dim), dtype=np.float32)
+        b = np.zeros(len(labels), dtype=np.float32)
+        for _ in range(epochs):
+            P = 1 / (1 + np.exp(-(X @ W.T + b)))
+            grad = (P - Y) / len(X)
+            W -= lr * (grad.T @ X + l2 * W)
+            b -= lr * grad.sum(axis=0)
+        return cls(W, b, labels)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                weights=self.weights,
+                bias=self.bias,
+                labels=np.array(self.labels),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "RouterModel":
+        data = np.load(path)
+        return cls(data["weights"], data["bias"], data["labels"].tolist())
+
+
+class LocalRouter:
+    """Rules, then model, with per-stage counters for the fallback rate.
+
+    route() only counts the local stages; router_node records "cache" and
+    "llm" itself, so a decision is counted once by the stage that made it.
+    """
+
+    def __init__(self, model_path: str = None, threshold: float = None):
+        self.model_path = model_path or Config.ROUTER_MODEL_PATH
+        self.threshold = (
+            threshold if threshold is not None else Config.ROUTER_CONFIDENCE
+        )
+        self._model: RouterModel | None = None
+        self._model_loaded = False
+        self._lock = threading.Lock()
+        self._counts = {"rules": 0, "model": 0, "cache": 0, "llm": 0}
+
+    @property
+    def model(self) -> RouterModel | None:
+        if not self._model_loaded:
+            with self._lock:
+                if not self._model_loaded:
+                    if self.model_path and os.path.exists(self.model_path):
+                        self._model = RouterModel.load(self.model_path)
+                        log.info(f"Router model loaded from {self.model_path}")
+                    self._model_loaded = True
+        return self._model
+
+    def route(self, query: str) -> tuple[list[str] | None, str | None]:
+        """(agents, stage); (None, None) when the query has to go further."""
+        agents, stage = route_by_rules(query), "rules"
+        if agents is None and self.model is not None and not FOLLOW_UP.search(query):
+            predicted, confidence = self.model.predict(query)
+            if confidence >= self.threshold:
+                agents, stage = predicted, "model"
+        if agents is None:
+            return None, None
+        self.record(stage)
+        return agents, stage
+
+    def record(self, stage: str):
+        with self._lock:
+            self._counts[stage] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        counts["fallback_rate"] = counts["llm"] / total if total else 0.0
+        return counts
+
+
+router = LocalRouter()
+_log_lock = threading.Lock()
+
+
+def local_route(query: str) -> list[str] | None:
+    if not Config.ROUTER_LOCAL:
+        return None
+    start = time.perf_counter()
+    agents, stage = router.route(query)
+    if agents is not None:
+        log.debug(
+            f"Router: {stage} answered in {(time.perf_counter() - start) * 1e6:.0f}us"
+        )
+    return agents
+
+
+def record_route(stage: str):
+    """Count a decision made outside the local stages ("cache" or "llm")."""
+    router.record(stage)
+
+
+def routing_stats() -> dict:
+    return {**router.stats(), "route_cache": route_cache.stats()}
+
+
+def log_decision(query: str, agents: list[str]):
+    """Append an LLM router decision to ROUTER_LOG_PATH as training data."""
+    path = Config.ROUTER_LOG_PATH
+    if not path:
+        return
+    line = json.dumps({"query": query, "agents": agents}) + "\n"
+    try:
+        with _log_lock:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+    except OSError as e:
+        log.warning(f"Router decision log failed: {e}")
+
+
+def normalize(query: str) -> str:
+    return " ".join(TOKEN.findall(query.lower()))
+
+
+def history_digest(chat_history: list = None, turns: int = None) -> str:
+    """Short digest of the last few chat messages, so a query only reuses
+    decisions made in the same conversational context."""
+    turns = Config.ROUTER_CACHE_HISTORY if turns is None else turns
+    recent = (chat_history or [])[-turns:] if turns > 0 else []
+    if not recent:
+        return ""
+    text = "\n".join(normalize(str(getattr(m, "content", m))) for m in recent)
+    return f"{zlib.crc32(text.encode()):08x}"
+
+
+class RouterCache:
+    """LRU cache of LLM routing decisions for repeated and paraphrased queries.
+
+    Lookups try the normalised query first, then the nearest cached query by
+    cosine similarity. Both are scoped to a digest of the recent chat history,
+    since the same words can route differently mid-conversation. Embeddings
+    live in a fixed matrix whose slots are reused on eviction, so a lookup is
+    one matmul over at most max_size rows.
+    """
+
+    def __init__(self, max_size: int = None, threshold: float = None, embed=None):
+        self.max_size = max_size if max_size is not None else Config.ROUTER_CACHE_SIZE
+        self.threshold = (
+            threshold if threshold is not None else Config.ROUTER_CACHE_SIMILARITY
+        )
+        self._embed_fn = embed
+        self._lock = threading.Lock()
+        # "history digest|normalised query" -> (agents, slot)
+        self._entries: OrderedDict[str, tuple[list[str], int]] = OrderedDict()
+        self._slots: list[str | None] = []
+        self._matrix: np.ndarray | None = None
+        self.hits = {"exact": 0, "semantic": 0}
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def _embed(self, text: str) -> np.ndarray | None:
+        if self._embed_fn is None:
+            from vectorstore import VectorStore
+
+            self._embed_fn = VectorStore().embed
+        try:
+            vector = np.asarray(self._embed_fn(text), dtype=np.float32)
+        except Exception as e:
+            log.warning(f"Router cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(
+        self, query: str, chat_history: list = None
+    ) -> tuple[list[str] | None, np.ndarray | None]:
+        """(agents, query vector); agents is None on a miss. Pass the vector
+        back to put() so a miss is only embedded once."""
+        if not self.enabled or FOLLOW_UP.search(query):
+            return None, None
+        text = normalize(query)
+        scope = history_digest(chat_history) + "|"
+        key = scope + text
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits["exact"] += 1
+                return list(entry[0]), None
+            empty = not self._entries
+
+        vector = None if empty else self._embed(text)
+        if vector is not None:
+            with self._lock:
+                occupied = [
+                    i
+                    for i, k in enumerate(self._slots)
+                    if k is not None and k.startswith(scope)
+                ]
+                if occupied and self._matrix.shape[1] == len(vector):
+                    scores = self._matrix[occupied] @ vector
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        match = self._slots[occupied[best]]
+                        self._entries.move_to_end(match)
+                        self.hits["semantic"] += 1
+                        return list(self._entries[match][0]), vector
+        with self._lock:
+            self.misses += 1
+        return None, vector
+
+    def put(
+        self,
+        query: str,
+        agents: list[str],
+        vector: np.ndarray = None,
+        chat_history: list = None,
+    ):
+        if not self.enabled or FOLLOW_UP.search(query):
+            return
+        text = normalize(query)
+        key = history_digest(chat_history) + "|" + text
+        if vector is None:
+            vector = self._embed(text)
+            if vector is None:
+                return
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != len(vector):
+                self._matrix = np.zeros((self.max_size, len(vector)), np.float32)
+                self._slots = [None] * self.max_size
+                self._entries.clear()
+
+            if key in self._entries:
+                slot = self._entries.pop(key)[1]
+            elif len(self._entries) >= self.max_size:
+                _, (_, slot) = self._entries.popitem(last=False)
+            else:
+                slot = self._slots.index(None)
+            self._slots[slot] = key
+            self._matrix[slot] = vector
+            self._entries[key] = (list(agents), slot)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = sum(self.hits.values()) + self.misses
+            return {
+                "size": len(self._entries),
+                **self.hits,
+                "misses": self.misses,
+                "hit_rate": sum(self.hits.values()) / total if total else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._slots = [None] * len(self._slots)
+
+
+route_cache = RouterCache()
+
+
+def load_decisions(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        examples = [json.loads(line) for line in f if line.strip()]
+    # Latest decision wins when a query was logged more than once
+    latest = {e["query"].strip().lower(): e for e in examples}
+    return list(latest.values())
+
+
+def _evaluate(model: RouterModel, examples: list[dict], threshold: float) -> str:
+    answered = correct = 0
+    for e in examples:
+        agents, confidence = model.predict(e["query"])
+        if confidence >= threshold:
+            answered += 1
+            correct += set(agents) == set(e["agents"])
+    coverage = answered / len(examples) if examples else 0.0
+    accuracy = correct / answered if answered else 0.0
+    return f"coverage {coverage:.1%}, accuracy when answered {accuracy:.1%}"
+
+
+def main(args):
+    examples = load_decisions(args.log)
+    if len(examples) < 10:
+        raise SystemExit(f"Need at least 10 logged decisions, found {len(examples)}")
+
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(examples))
+    split = int(len(examples) * (1 - args.holdout))
+    train = [examples[i] for i in order[:split]]
+    holdout = [examples[i] for i in order[split:]]
+
+    model = RouterModel.train(train, dim=args.dim, epochs=args.epochs)
+    print(f"Trained on {len(train)} decisions")
+    print(f"train:   {_evaluate(model, train, args.threshold)}")
+    if holdout:
+        print(f"holdout: {_evaluate(model, holdout, args.threshold)}")
+
+    # Ship a model that has seen every decision
+    model = RouterModel.train(examples, dim=args.dim, epochs=args.epochs)
+    model.save(args.out)
+    print(f"Saved to {args.out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    sub = parser.add_subparsers(dest="command", required=True)
+    train = sub.add_parser("train", help="train the router model from logged decisions")
+    train.add_argument("--log", default=Config.ROUTER_LOG_PATH)
+    train.add_argument("--out", default=Config.ROUTER_MODEL_PATH)
+    train.add_argument("--dim", type=int, default=4096)
+    train.add_argument("--epochs", type=int, default=300)
+    train.add_argument("--threshold", type=float, default=Config.ROUTER_CONFIDENCE)
+    train.add_argument("--holdout", type=float, default=0.2)
+    train.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
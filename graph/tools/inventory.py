@@ -1,28 +1,13 @@
 from langchain_core.tools import tool
-from db import Database
+from db import Database, run_async
 
 db = Database()
 
 
-def _run_async(coro):
-    import asyncio
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 @tool
 def get_inventory_status() -> str:
     """Get current inventory status for all products including stock levels and reorder points."""
-    inventory = _run_async(db.get_inventory())
+    inventory = run_async(db.get_inventory())
 
     if not inventory:
         return "No inventory data available"
@@ -64,7 +49,7 @@ def get_inventory_status() -> str:
 @tool
 def get_out_of_stock_products() -> str:
     """Get list of products that are currently out of stock (zero inventory)."""
-    products = _run_async(db.get_out_of_stock())
+    products = run_async(db.get_out_of_stock())
 
     if not products:
         return "No products are currently out of stock."
@@ -79,7 +64,7 @@ def get_out_of_stock_products() -> str:
 @tool
 def get_low_stock_products() -> str:
     """Get list of products with stock at or below reorder level but not zero."""
-    products = _run_async(db.get_low_stock())
+    products = run_async(db.get_low_stock())
 
     if not products:
         return "No products are currently low on stock."
@@ -98,7 +83,7 @@ def get_product_inventory(product_id: int) -> str:
     Args:
         product_id: The product ID to look up.
     """
-    inventory = _run_async(db.get_inventory())
+    inventory = run_async(db.get_inventory())
 
     for item in inventory:
         if item["id"] == product_id:
@@ -125,7 +110,7 @@ def check_stock_for_products(product_ids: list[int]) -> str:
     Args:
         product_ids: List of product IDs to check.
     """
-    inventory = _run_async(db.get_inventory())
+    inventory = run_async(db.get_inventory())
     inv_map = {item["id"]: item for item in inventory}
 
     lines = ["Stock Check Results:", ""]
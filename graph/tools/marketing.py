@@ -1,28 +1,13 @@
 from langchain_core.tools import tool
-from db import Database
+from db import Database, run_async
 
 db = Database()
 
 
-def _run_async(coro):
-    import asyncio
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 @tool
 def get_active_campaigns() -> str:
     """Get all currently active marketing campaigns with performance metrics."""
-    campaigns = _run_async(db.get_campaigns())
+    campaigns = run_async(db.get_campaigns())
 
     if not campaigns:
         return "No active campaigns."
@@ -61,7 +46,7 @@ def get_campaign_details(campaign_id: int) -> str:
     Args:
         campaign_id: The campaign ID to look up.
     """
-    campaigns = _run_async(db.get_campaigns())
+    campaigns = run_async(db.get_campaigns())
 
     for c in campaigns:
         if c["id"] == campaign_id:
@@ -98,7 +83,7 @@ def get_campaigns_by_channel(channel: str) -> str:
     Args:
         channel: Channel to filter by (email, social, search, display).
     """
-    campaigns = _run_async(db.get_campaigns())
+    campaigns = run_async(db.get_campaigns())
     filtered = [c for c in campaigns if c["channel"].lower() == channel.lower()]
 
     if not filtered:
@@ -123,7 +108,7 @@ def get_underperforming_campaigns(ctr_threshold: float = 1.0) -> str:
     Args:
         ctr_threshold: Minimum acceptable CTR percentage. Defaults to 1.0%.
     """
-    campaigns = _run_async(db.get_campaigns())
+    campaigns = run_async(db.get_campaigns())
     poor = [c for c in campaigns if (c["ctr"] or 0) < ctr_threshold]
 
     if not poor:
@@ -148,7 +133,7 @@ def get_underperforming_campaigns(ctr_threshold: float = 1.0) -> str:
 @tool
 def get_campaign_roi_analysis() -> str:
     """Analyze ROI across all active campaigns."""
-    campaigns = _run_async(db.get_campaigns())
+    campaigns = run_async(db.get_campaigns())
 
     if not campaigns:
         return "No campaigns to analyze."
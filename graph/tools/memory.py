@@ -1,24 +1,15 @@
 from datetime import datetime, timedelta
 from langchain_core.tools import tool
-from db import Database
+from db import Database, run_async
 from vectorstore import VectorStore
 
 db = Database()
 
 
-def _run_async(coro):
-    import asyncio
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
+def _relevance(hit: dict) -> str:
+    """Dense cosine similarity; BM25-only hits have no comparable score."""
+    score = hit.get("score")
+    return f" (Relevance: {score:.0%})" if score is not None else ""
 
 
 @tool
@@ -38,8 +29,7 @@ def search_similar_incidents(query: str, limit: int = 5) -> str:
     lines = [f"Similar Historical Incidents ({len(results)} found):", ""]
 
     for i, inc in enumerate(results, 1):
-        score = inc.get("score", 0)
-        lines.append(f"{i}. [{inc['incident_type'].upper()}] (Relevance: {score:.0%})")
+        lines.append(f"{i}. [{inc['incident_type'].upper()}]{_relevance(inc)}")
         lines.append(f"   What happened: {inc['description']}")
         lines.append(f"   Root cause: {inc['root_cause']}")
         lines.append(f"   Action taken: {inc['action_taken']}")
@@ -80,6 +70,46 @@ def search_incidents_by_type(
     return "\n".join(lines)
 
 
+@tool
+def search_incidents_batch(
+    queries: list[str], incident_types: list[str] = None, limit: int = 3
+) -> str:
+    """Search past incidents for several hypotheses at once, in a single call.
+
+    Args:
+        queries: One description per hypothesis, e.g. ["sales drop after price change", "stockout of top products"].
+        incident_types: Optional type per query (sales_drop, stockout, campaign_failure, support_spike, pricing_error); use "" for no filter. A single type applies to every query.
+        limit: Maximum results per query. Defaults to 3.
+    """
+    vs = VectorStore()
+
+    types = incident_types or []
+    if len(types) == 1:
+        types = types * len(queries)
+    types = (types + [""] * len(queries))[: len(queries)]
+    filters = [vs.field_filter("incident_type", t) if t else None for t in types]
+    batches = vs.search_batch("incidents", queries, limit=limit, filters=filters)
+
+    lines = [f"Incident Search ({len(queries)} queries):", ""]
+
+    for query, incident_type, results in zip(queries, types, batches):
+        label = f"{query} [{incident_type}]" if incident_type else query
+        lines.append(f"Query: {label}")
+        if not results:
+            lines.append("   No matching incidents.")
+        for i, inc in enumerate(results, 1):
+            lines.append(
+                f"{i}. [{inc['incident_type'].upper()}] {inc['description']}"
+                f"{_relevance(inc)}"
+            )
+            lines.append(f"   Cause: {inc['root_cause']}")
+            lines.append(f"   Action: {inc['action_taken']}")
+            lines.append(f"   Result: {inc['outcome']}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
 @tool
 def get_recent_incidents(days: int = 30, incident_type: str = None) -> str:
     """Get recent incidents from the database.
@@ -88,7 +118,7 @@ def get_recent_incidents(days: int = 30, incident_type: str = None) -> str:
         days: Number of days to look back. Defaults to 30.
         incident_type: Optional filter by type (sales_drop, stockout, campaign_failure, support_spike).
     """
-    incidents = _run_async(db.get_incidents(incident_type))
+    incidents = run_async(db.get_incidents(incident_type))
 
     if not incidents:
         type_filter = f" of type '{incident_type}'" if incident_type else ""
@@ -129,7 +159,7 @@ def search_resolved_tickets(query: str, limit: int = 5) -> str:
         limit: Maximum results to return. Defaults to 5.
     """
     vs = VectorStore()
-    results = vs.search_tickets(query, limit=limit)
+    results = vs.search_resolved_tickets(query, limit=limit)
 
     if not results:
         return "No similar resolved tickets found."
@@ -137,12 +167,12 @@ def search_resolved_tickets(query: str, limit: int = 5) -> str:
     lines = [f"Similar Resolved Tickets ({len(results)} found):", ""]
 
     for i, t in enumerate(results, 1):
-        score = t.get("score", 0)
-        lines.append(
-            f"{i}. [{t['category'].upper()}] {t['subject']} (Relevance: {score:.0%})"
-        )
+        lines.append(f"{i}. [{t['category'].upper()}] {t['subject']}{_relevance(t)}")
         lines.append(f"   Issue: {t['description']}")
-        lines.append(f"   Resolution: {t['resolution']}")
+        if t.get("resolution"):
+            lines.append(f"   Resolution: {t['resolution']}")
+        else:
+            lines.append(f"   Status: {t.get('status', 'unknown')}")
         lines.append("")
 
     return "\n".join(lines)
@@ -155,7 +185,7 @@ def get_incident_patterns(incident_type: str = None) -> str:
     Args:
         incident_type: Optional filter by type. If not provided, analyzes all types.
     """
-    incidents = _run_async(db.get_incidents(incident_type))
+    incidents = run_async(db.get_incidents(incident_type))
 
     if not incidents:
         return "No incidents available for pattern analysis."
@@ -188,6 +218,7 @@ def get_incident_patterns(incident_type: str = None) -> str:
 MEMORY_TOOLS = [
     search_similar_incidents,
     search_incidents_by_type,
+    search_incidents_batch,
     get_recent_incidents,
     search_resolved_tickets,
     get_incident_patterns,
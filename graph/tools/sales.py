@@ -1,25 +1,10 @@
 from datetime import datetime, timedelta
 from langchain_core.tools import tool
-from db import Database
+from db import Database, run_async
 
 db = Database()
 
 
-def _run_async(coro):
-    import asyncio
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 def _parse_date(date_str: str | None, default_days_ago: int = 0) -> str:
     if date_str:
         try:
@@ -40,7 +25,7 @@ def get_sales_summary(start_date: str = None, end_date: str = None) -> str:
     start = _parse_date(start_date, default_days_ago=7)
     end = _parse_date(end_date, default_days_ago=0)
 
-    sales = _run_async(db.get_sales(start, end))
+    sales = run_async(db.get_sales(start, end))
 
     if not sales:
         return f"No sales data found between {start} and {end}"
@@ -77,7 +62,7 @@ def get_top_products(
     start = _parse_date(start_date, default_days_ago=7)
     end = _parse_date(end_date, default_days_ago=0)
 
-    products = _run_async(db.get_top_products(start, end, limit))
+    products = run_async(db.get_top_products(start, end, limit))
 
     if not products:
         return f"No product sales data found between {start} and {end}"
@@ -103,7 +88,7 @@ def get_sales_by_region(start_date: str = None, end_date: str = None) -> str:
     start = _parse_date(start_date, default_days_ago=7)
     end = _parse_date(end_date, default_days_ago=0)
 
-    regions = _run_async(db.get_sales_by_region(start, end))
+    regions = run_async(db.get_sales_by_region(start, end))
 
     if not regions:
         return f"No regional sales data found between {start} and {end}"
@@ -137,8 +122,8 @@ def compare_sales_periods(
     p2_start = _parse_date(period2_start)
     p2_end = _parse_date(period2_end)
 
-    sales1 = _run_async(db.get_sales(p1_start, p1_end))
-    sales2 = _run_async(db.get_sales(p2_start, p2_end))
+    sales1 = run_async(db.get_sales(p1_start, p1_end))
+    sales2 = run_async(db.get_sales(p2_start, p2_end))
 
     rev1 = sum(s["revenue"] or 0 for s in sales1) if sales1 else 0
     rev2 = sum(s["revenue"] or 0 for s in sales2) if sales2 else 0
@@ -181,7 +166,7 @@ def get_sales_for_product(
     start = _parse_date(start_date, default_days_ago=30)
     end = _parse_date(end_date, default_days_ago=0)
 
-    sales = _run_async(db.get_product_sales(product_id, start, end))
+    sales = run_async(db.get_product_sales(product_id, start, end))
 
     if not sales:
         return f"No sales found for product {product_id} between {start} and {end}"
@@ -206,7 +191,7 @@ def get_product_info(product_id: int) -> str:
     Args:
         product_id: The product ID to look up.
     """
-    product = _run_async(db.get_product(product_id))
+    product = run_async(db.get_product(product_id))
 
     if not product:
         return f"Product ID {product_id} not found."
@@ -222,7 +207,7 @@ def get_product_info(product_id: int) -> str:
 @tool
 def get_all_products_list() -> str:
     """Get list of all products with their IDs and prices."""
-    products = _run_async(db.get_all_products())
+    products = run_async(db.get_all_products())
 
     if not products:
         return "No products found."
@@ -1,25 +1,10 @@
 from datetime import datetime, timedelta
 from langchain_core.tools import tool
-from db import Database
+from db import Database, run_async
 
 db = Database()
 
 
-def _run_async(coro):
-    import asyncio
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, coro).result()
-        return loop.run_until_complete(coro)
-    except RuntimeError:
-        return asyncio.run(coro)
-
-
 def _parse_date(date_str: str | None, default_days_ago: int = 0) -> str:
     if date_str:
         try:
@@ -32,7 +17,7 @@ def _parse_date(date_str: str | None, default_days_ago: int = 0) -> str:
 @tool
 def get_open_tickets() -> str:
     """Get all currently open support tickets sorted by priority."""
-    tickets = _run_async(db.get_open_tickets())
+    tickets = run_async(db.get_open_tickets())
 
     if not tickets:
         return "No open support tickets."
@@ -67,7 +52,7 @@ def get_open_tickets() -> str:
 @tool
 def get_ticket_summary() -> str:
     """Get summary of open tickets grouped by category and priority."""
-    summary = _run_async(db.get_ticket_summary())
+    summary = run_async(db.get_ticket_summary())
 
     if not summary:
         return "No ticket summary available."
@@ -98,7 +83,7 @@ def get_ticket_details(ticket_id: int) -> str:
     Args:
         ticket_id: The ticket ID to look up.
     """
-    tickets = _run_async(db.get_open_tickets())
+    tickets = run_async(db.get_open_tickets())
 
     for t in tickets:
         if t["id"] == ticket_id:
@@ -122,7 +107,7 @@ def get_tickets_by_category(category: str) -> str:
     Args:
         category: Category to filter by (shipping, order, refund, technical, billing, product).
     """
-    tickets = _run_async(db.get_open_tickets())
+    tickets = run_async(db.get_open_tickets())
     filtered = [t for t in tickets if t["category"].lower() == category.lower()]
 
     if not filtered:
@@ -152,7 +137,7 @@ def get_ticket_trends(start_date: str = None, end_date: str = None) -> str:
     start = _parse_date(start_date, default_days_ago=7)
     end = _parse_date(end_date, default_days_ago=0)
 
-    stats = _run_async(db.get_ticket_stats(start, end))
+    stats = run_async(db.get_ticket_stats(start, end))
 
     if not stats:
         return f"No ticket data available for {start} to {end}."
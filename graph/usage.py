@@ -0,0 +1,65 @@
+import threading
+from logger import log
+
+
+class UsageTracker:
+    """Running token totals per caller, including provider prompt-cache hits.
+
+    Cached tokens come from usage_metadata.input_token_details.cache_read,
+    which Azure/OpenAI fill in when a request reuses a cached prompt prefix.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: dict[str, dict[str, int]] = {}
+
+    def record(self, source: str, response) -> dict | None:
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return None
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        cached = (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+
+        with self._lock:
+            totals = self._totals.setdefault(
+                source, {"calls": 0, "input": 0, "cached": 0, "output": 0}
+            )
+            totals["calls"] += 1
+            totals["input"] += input_tokens
+            totals["cached"] += cached
+            totals["output"] += output_tokens
+
+        log.debug(
+            f"Usage [{source}]: {input_tokens} in ({cached} cached), "
+            f"{output_tokens} out"
+        )
+        return usage
+
+    def stats(self) -> dict:
+        """Totals per source plus an "all" row, each with its cache hit rate."""
+        with self._lock:
+            rows = {name: dict(t) for name, t in self._totals.items()}
+        overall = {"calls": 0, "input": 0, "cached": 0, "output": 0}
+        for t in rows.values():
+            for k in overall:
+                overall[k] += t[k]
+        rows["all"] = overall
+        for t in rows.values():
+            t["cache_hit_rate"] = t["cached"] / t["input"] if t["input"] else 0.0
+        return rows
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+
+
+tracker = UsageTracker()
+
+
+def record_usage(source: str, response):
+    return tracker.record(source, response)
+
+
+def usage_stats() -> dict:
+    return tracker.stats()
@@ -1,11 +1,13 @@
 # tests/conftest.py
 import pytest
 import asyncio
+from pathlib import Path
 from db import seed_database
 from vectorstore import seed_vectors
 from graph import create_workflow
 
 _initialized = False
+UNIT_DIR = Path(__file__).parent / "unit"
 
 
 def _init_once():
@@ -18,12 +20,20 @@ def _init_once():
     print("\n✅ Test environment initialized")
 
 
-_init_once()
+def _needs_environment(items) -> bool:
+    # tests/unit runs offline; only the LLM evaluations need seeded data
+    return any(UNIT_DIR not in Path(item.path).parents for item in items)
+
+
+def pytest_collection_modifyitems(session, config, items):
+    if _needs_environment(items):
+        _init_once()
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_environment():
-    _init_once()
+def setup_environment(request):
+    if _needs_environment(request.session.items):
+        _init_once()
     yield
 
 
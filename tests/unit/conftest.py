@@ -0,0 +1,31 @@
+# tests/unit/conftest.py
+# Offline fixtures: temp SQLite files and an in-memory VectorStore with the
+# deterministic hash embeddings, so nothing here needs Azure or Qdrant.
+import pytest
+from config import Config
+from db import Database, run_async
+from vectorstore import VectorStore
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "unit.db"))
+    run_async(database.init())
+    yield database
+    run_async(database.close())
+
+
+@pytest.fixture
+def vs(monkeypatch):
+    monkeypatch.setattr(Config, "EMBEDDING_PROVIDER", "hash")
+    monkeypatch.setattr(Config, "EMBEDDING_CACHE_PATH", None)
+    monkeypatch.setattr(Config, "QDRANT_MODE", "memory")
+    monkeypatch.setattr(Config, "HYBRID_SEARCH", True)
+    monkeypatch.setattr(Config, "SEARCH_CACHE_SIZE", 128)
+    monkeypatch.setattr(Config, "SEARCH_CACHE_TTL", 300.0)
+
+    VectorStore._cleanup()
+    store = VectorStore()
+    store.init_collections()
+    yield store
+    VectorStore._cleanup()
@@ -0,0 +1,95 @@
+import threading
+import time
+import pytest
+from config import Config
+from graph.agents.base import BaseAgent, tool_concurrency
+
+
+class SleepTool:
+    """Sleeps, then echoes its label; records how many calls overlap."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def invoke(self, args: dict) -> str:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(args["seconds"])
+            if args.get("fail"):
+                raise RuntimeError("tool failed")
+            return args["label"]
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class StubAgent(BaseAgent):
+    name = "sales"
+
+    def get_llm(self):
+        return None
+
+    def get_prompt(self) -> str:
+        return ""
+
+    def get_tools(self) -> list:
+        return []
+
+
+def calls(*specs) -> list[dict]:
+    return [
+        {"id": str(i), "name": "sleep", "args": args} for i, args in enumerate(specs)
+    ]
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("4", {"sales": 4, "memory": 4}),
+        ("sales=3,memory=2", {"sales": 3, "inventory": 1}),
+    ],
+)
+def test_tool_concurrency(monkeypatch, spec, expected):
+    monkeypatch.setattr(Config, "TOOL_CONCURRENCY", spec)
+    assert {agent: tool_concurrency(agent) for agent in expected} == expected
+
+
+def test_results_keep_call_order_and_respect_the_limit(monkeypatch):
+    monkeypatch.setattr(Config, "TOOL_CONCURRENCY", "sales=2")
+    agent, tool = StubAgent(), SleepTool("sleep")
+    # Earlier calls sleep longest, so they finish last
+    tool_calls = calls(
+        *({"seconds": 0.05 * (6 - i), "label": f"call {i}"} for i in range(6))
+    )
+
+    results = agent._run_tools({"sleep": tool}, tool_calls)
+    assert results == [f"call {i}" for i in range(6)]
+    assert tool.peak == 2
+
+
+def test_calls_overlap_up_to_the_limit(monkeypatch):
+    monkeypatch.setattr(Config, "TOOL_CONCURRENCY", "4")
+    agent, tool = StubAgent(), SleepTool("sleep")
+
+    agent._run_tools({"sleep": tool}, calls(*[{"seconds": 0.1, "label": "x"}] * 4))
+    assert tool.peak == 4
+
+
+def test_failures_are_reported_in_place_and_free_their_slot(monkeypatch):
+    monkeypatch.setattr(Config, "TOOL_CONCURRENCY", "sales=1")
+    agent, tool = StubAgent(), SleepTool("sleep")
+    tool_calls = calls(
+        {"seconds": 0.01, "label": "a", "fail": True},
+        {"seconds": 0.01, "label": "b"},
+    ) + [{"id": "9", "name": "missing", "args": {}}]
+
+    results = agent._run_tools({"sleep": tool}, tool_calls)
+    assert results == ["Error: tool failed", "b", "Unknown tool: missing"]
+    assert tool.peak == 1
+    # Every slot was released: the semaphore can be taken again right away
+    assert agent._tool_slots.acquire(timeout=0)
@@ -0,0 +1,65 @@
+import pytest
+from config import Config
+from db import Database, run_async
+
+PRAGMAS = ("synchronous", "temp_store", "cache_size")
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # One pooled connection, so every call below sees the bulk-load connection
+    monkeypatch.setattr(Config, "DB_POOL_SIZE", 1)
+    database = Database(str(tmp_path / "bulk.db"))
+    run_async(database.init())
+    yield database
+    run_async(database.close())
+
+
+async def pragmas_of(conn) -> dict:
+    values = {}
+    for pragma in PRAGMAS:
+        cursor = await conn.execute(f"PRAGMA {pragma}")
+        values[pragma] = (await cursor.fetchone())[0]
+    return values
+
+
+async def pragmas(db) -> dict:
+    async with db.pool.connection() as conn:
+        return await pragmas_of(conn)
+
+
+async def load(db, rows, fail=False):
+    async with db.bulk_load() as writer:
+        await writer.insert(
+            "INSERT INTO products (id, name, price) VALUES (?, ?, ?)", rows
+        )
+        during = await pragmas_of(writer.conn)
+        if fail:
+            raise RuntimeError("load failed")
+    return during
+
+
+def count(db) -> int:
+    return run_async(db._fetch("SELECT COUNT(*) AS n FROM products"))[0]["n"]
+
+
+def test_pragmas_restored_after_load(db):
+    before = run_async(pragmas(db))
+    during = run_async(load(db, [(i, f"P{i}", 1.0) for i in range(10)]))
+
+    assert during == {
+        "synchronous": 0,
+        "temp_store": 2,
+        "cache_size": -Config.DB_BULK_CACHE_KB,
+    }
+    assert run_async(pragmas(db)) == before
+    assert count(db) == 10
+
+
+def test_pragmas_restored_after_failed_load(db):
+    before = run_async(pragmas(db))
+    with pytest.raises(RuntimeError):
+        run_async(load(db, [(1, "P1", 1.0)], fail=True))
+
+    assert run_async(pragmas(db)) == before
+    assert count(db) == 0
@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+from db.pool import ConnectionPool, PoolClosedError, PoolTimeoutError
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1, timeout=2.0)
+    yield pool
+    asyncio.run(pool.close())
+
+
+def free_slots(pool: ConnectionPool) -> int:
+    return pool._slots._value
+
+
+async def select_one(pool: ConnectionPool) -> int:
+    async with pool.connection() as conn:
+        cursor = await conn.execute("SELECT 1")
+        return (await cursor.fetchone())[0]
+
+
+def test_cancelled_waiter_does_not_leak_a_slot(pool):
+    async def scenario():
+        held = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)  # waiter is now blocked in the executor
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # The abandoned executor acquire gets this slot and must hand it back
+        await pool.release(held)
+        conn = await asyncio.wait_for(pool.acquire(), timeout=1.0)
+        await pool.release(conn)
+
+    asyncio.run(scenario())
+    assert free_slots(pool) == 1
+    assert pool.stats["open"] == 1
+
+
+def test_acquire_times_out(pool):
+    pool.timeout = 0.1
+
+    async def scenario():
+        held = await pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire()
+        await pool.release(held)
+        return await select_one(pool)
+
+    assert asyncio.run(scenario()) == 1
+    assert free_slots(pool) == 1
+
+
+def test_reuse_from_a_second_event_loop(pool):
+    assert asyncio.run(select_one(pool)) == 1
+    # A fresh loop (e.g. a Streamlit rerun) reuses the idle connection
+    assert asyncio.run(select_one(pool)) == 1
+    assert pool.stats == {"size": 1, "open": 1, "idle": 1, "closed": False}
+
+    pool.ping_interval = 0
+    assert asyncio.run(select_one(pool)) == 1
+    assert pool.stats["open"] == 1
+
+
+def test_closed_pool_rejects_acquire(pool):
+    asyncio.run(select_one(pool))
+    asyncio.run(pool.close())
+    assert pool.stats["open"] == 0
+    with pytest.raises(PoolClosedError):
+        asyncio.run(pool.acquire())
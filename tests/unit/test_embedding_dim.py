@@ -0,0 +1,35 @@
+import pytest
+from config import Config, embedding_dimensions
+
+
+@pytest.mark.parametrize(
+    "deployment, dim, expected",
+    [
+        ("text-embedding-3-small-1", 1536, 1536),
+        ("text-embedding-3-large", 3072, 3072),
+        ("text-embedding-3-large", 1536, 1536),
+        ("text-embedding-ada-002", 1536, None),
+    ],
+)
+def test_dimensions_sent_unless_ada(monkeypatch, deployment, dim, expected):
+    monkeypatch.setattr(Config, "MODEL_EMBEDDING", deployment)
+    monkeypatch.setattr(Config, "EMBEDDING_DIM", dim)
+    assert embedding_dimensions() == expected
+
+
+def test_wrong_embedding_size_is_rejected(vs, monkeypatch):
+    monkeypatch.setattr(vs.embeddings, "embed_query", lambda text: [0.1] * 3072)
+    monkeypatch.setattr(
+        vs.embeddings, "embed_documents", lambda texts: [[0.1] * 3072 for _ in texts]
+    )
+    with pytest.raises(ValueError, match="3072 dimensions"):
+        vs.embed("refund")
+    with pytest.raises(ValueError, match="EMBEDDING_DIM"):
+        vs.add_product(1, "Yoga Mat", "Fitness", "Non-slip mat")
+    # Nothing of the wrong size was cached
+    assert vs.embedding_cache.get("refund") is None
+
+
+def test_matching_embedding_size_passes(vs):
+    assert len(vs.embed("refund")) == Config.EMBEDDING_DIM
+    assert vs._dim_checked
@@ -0,0 +1,117 @@
+import pytest
+from config import Config
+from vectorstore import VectorStore
+from vectorstore.sparse import BM25Index, is_lexical, reciprocal_rank_fusion
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("where is order #10452", True),
+        ("customer used code SAVE20", True),
+        ('tickets mentioning "late delivery"', True),
+        ("sales drop during 2025 holiday season", False),
+        ("lost $45,000 in revenue", False),
+        ("why are refunds slow", False),
+    ],
+)
+def test_is_lexical(query, expected):
+    assert is_lexical(query) is expected
+
+
+def test_bm25_ranks_filters_and_removes():
+    index = BM25Index()
+    index.add_many(
+        [
+            (1, "refund delayed refund pending", {"category": "refund"}),
+            (2, "refund issued for damaged item", {"category": "product"}),
+            (3, "shipping label missing", {"category": "shipping"}),
+        ]
+    )
+    assert [hit[0] for hit in index.search("refund")] == [1, 2]
+    only_product = VectorStore.field_filter("category", "product")
+    assert [
+        hit[0] for hit in index.search("refund", filter_conditions=only_product)
+    ] == [2]
+
+    index.remove(1)
+    assert [hit[0] for hit in index.search("refund")] == [2]
+    # Re-adding an id replaces its document rather than duplicating it
+    index.add_many([(2, "shipping delayed", {"category": "shipping"})])
+    assert index.search("refund") == []
+    assert len(index) == 2
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["a", "c"]], k=60)
+    assert [point_id for point_id, _ in fused] == ["a", "c", "b"]
+    # First in every ranking normalises to 1.0
+    assert fused[0][1] == pytest.approx(1.0)
+
+
+def add_tickets(vs):
+    vs.add_tickets_batch(
+        [
+            {
+                "ticket_id": 1,
+                "subject": "Promo code SAVE20 rejected",
+                "description": "Checkout says the code is invalid",
+                "category": "billing",
+            },
+            {
+                "ticket_id": 2,
+                "subject": "Refund pending",
+                "description": "Refund not processed after return",
+                "category": "refund",
+                "status": "open",
+            },
+        ]
+    )
+
+
+def test_lexical_query_skips_embedding(vs, monkeypatch):
+    add_tickets(vs)
+
+    def fail(text):
+        raise AssertionError("lexical queries must not be embedded")
+
+    monkeypatch.setattr(vs.embeddings, "embed_query", fail)
+    results = vs.search_tickets("SAVE20", limit=3)
+    assert results[0]["ticket_id"] == 1
+    # BM25-only hits have a rank but no cosine similarity
+    assert "score" not in results[0] and results[0]["rank_score"] == 1.0
+
+
+def test_fused_results_keep_cosine_score(vs):
+    add_tickets(vs)
+    results = vs.search_tickets("refund not processed after return", limit=2)
+    assert results[0]["ticket_id"] == 2
+    assert 0 < results[0]["score"] <= 1
+    assert "rank_score" in results[0]
+
+
+def test_resolved_ticket_search_excludes_open(vs):
+    add_tickets(vs)
+    results = vs.search_resolved_tickets("refund not processed after return")
+    assert 2 not in [t["ticket_id"] for t in results]
+
+
+def test_sparse_index_untouched_when_hybrid_off(vs, monkeypatch):
+    monkeypatch.setattr(Config, "HYBRID_SEARCH", False)
+    add_tickets(vs)
+    vs.search_tickets("SAVE20")
+    vs.delete_points("tickets", [1])
+    assert vs._sparse == {}
+
+
+def test_writes_update_a_built_sparse_index(vs):
+    add_tickets(vs)
+    vs.search_tickets("SAVE20")  # builds the index
+    index = vs._sparse["tickets"]
+    assert len(index) == 2
+
+    vs.delete_points("tickets", [1])
+    vs.add_ticket(3, "Coupon WELCOME10 failed", "Code not applied", "billing")
+    assert len(index) == 2
+    assert index.search("SAVE20") == []
+    assert [hit[0] for hit in index.search("WELCOME10")] == [3]
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PointIdsList,
+    PointStruct,
+    QueryRequest,
+    VectorParams,
+)
+from vectorstore.numpy_backend import NumpyClient
+
+DIM = 16
+TYPES = ["stockout", "sales_drop", "support_spike"]
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((40, DIM)).astype(np.float32)
+    payloads = [{"incident_type": TYPES[i % 3], "n": i} for i in range(40)]
+    return vectors, payloads
+
+
+@pytest.fixture
+def client(points):
+    vectors, payloads = points
+    client = NumpyClient()
+    client.create_collection("bench", VectorParams(size=DIM, distance=Distance.COSINE))
+    client.upsert(
+        "bench",
+        [
+            PointStruct(id=i, vector=v.tolist(), payload=p)
+            for i, (v, p) in enumerate(zip(vectors, payloads))
+        ],
+    )
+    return client
+
+
+def brute_force(vectors, payloads, query, limit, keep=lambda i: True):
+    normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normed @ (query / np.linalg.norm(query))
+    ranked = [i for i in np.argsort(-scores) if keep(i)]
+    return ranked[:limit]
+
+
+def ids(response) -> list:
+    return [p.id for p in response.points]
+
+
+def test_search_matches_brute_force(client, points):
+    vectors, payloads = points
+    query = vectors[3] + 0.1
+    response = client.query_points("bench", query=query.tolist(), limit=5)
+    assert ids(response) == brute_force(vectors, payloads, query, 5)
+    assert response.points[0].payload == payloads[response.points[0].id]
+
+
+def test_filters(client, points):
+    vectors, payloads = points
+    query = vectors[0]
+    must = Filter(
+        must=[FieldCondition(key="incident_type", match=MatchValue(value="stockout"))]
+    )
+    response = client.query_points(
+        "bench", query=query.tolist(), limit=5, query_filter=must
+    )
+    assert ids(response) == brute_force(
+        vectors,
+        payloads,
+        query,
+        5,
+        lambda i: payloads[i]["incident_type"] == "stockout",
+    )
+
+    must_not = Filter(
+        must_not=[
+            FieldCondition(
+                key="incident_type", match=MatchAny(any=["stockout", "sales_drop"])
+            )
+        ]
+    )
+    response = client.query_points(
+        "bench", query=query.tolist(), limit=40, query_filter=must_not
+    )
+    assert {p.payload["incident_type"] for p in response.points} == {"support_spike"}
+    assert len(response.points) == len([p for p in payloads if p["n"] % 3 == 2])
+
+
+def test_search_after_deletes(client, points):
+    vectors, payloads = points
+    # Deleting from the middle swaps the last rows into the holes
+    deleted = {0, 5, 17, 39}
+    client.delete("bench", PointIdsList(points=list(deleted)))
+    assert client.get_collection("bench").points_count == 40 - len(deleted)
+
+    for query_id in (1, 38, 20):
+        query = vectors[query_id]
+        response = client.query_points("bench", query=query.tolist(), limit=6)
+        expected = brute_force(
+            vectors, payloads, query, 6, lambda i: int(i) not in deleted
+        )
+        assert ids(response) == expected
+        for p in response.points:
+            assert p.payload == payloads[p.id]
+
+    # Deleting unknown ids is a no-op
+    client.delete("bench", PointIdsList(points=[999]))
+    assert client.get_collection("bench").points_count == 36
+
+
+def test_upsert_replaces_existing_point(client, points):
+    vectors, _ = points
+    client.upsert(
+        "bench",
+        [PointStruct(id=4, vector=vectors[9].tolist(), payload={"incident_type": "x"})],
+    )
+    assert client.get_collection("bench").points_count == 40
+    response = client.query_points("bench", query=vectors[9].tolist(), limit=2)
+    assert set(ids(response)) == {4, 9}
+
+
+def test_batch_matches_single_queries(client, points):
+    vectors, _ = points
+    only_spikes = Filter(
+        must=[
+            FieldCondition(key="incident_type", match=MatchValue(value="support_spike"))
+        ]
+    )
+    requests = [
+        QueryRequest(query=vectors[i].tolist(), limit=4, filter=f)
+        for i, f in [(2, None), (8, only_spikes), (30, None)]
+    ]
+    batch = client.query_batch_points("bench", requests=requests)
+    for request, response in zip(requests, batch):
+        single = client.query_points(
+            "bench", query=request.query, limit=4, query_filter=request.filter
+        )
+        assert ids(response) == ids(single)
+
+
+def test_scroll_pages_through_every_point(client):
+    client.delete("bench", PointIdsList(points=[3, 11]))
+    seen, offset = [], None
+    while True:
+        records, offset = client.scroll("bench", limit=15, offset=offset)
+        seen.extend(r.id for r in records)
+        if offset is None:
+            break
+    assert sorted(seen) == sorted(set(range(40)) - {3, 11})
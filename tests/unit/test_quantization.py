@@ -0,0 +1,66 @@
+import pytest
+from qdrant_client.models import BinaryQuantization, ScalarQuantization, ScalarType
+from config import Config
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("none", {"tickets": "none", "incidents": "none"}),
+        ("Scalar", {"tickets": "scalar", "incidents": "scalar"}),
+        (
+            "tickets=scalar, incidents=binary",
+            {"tickets": "scalar", "incidents": "binary", "products": "none"},
+        ),
+    ],
+)
+def test_quantization_spec(vs, monkeypatch, spec, expected):
+    monkeypatch.setattr(Config, "QDRANT_QUANTIZATION", spec)
+    assert {name: vs.quantization(name) for name in expected} == expected
+
+
+def test_unknown_quantization_is_rejected(vs, monkeypatch):
+    monkeypatch.setattr(Config, "QDRANT_QUANTIZATION", "tickets=pq")
+    with pytest.raises(ValueError):
+        vs.quantization("tickets")
+
+
+def test_quantization_config(vs, monkeypatch):
+    monkeypatch.setattr(
+        Config, "QDRANT_QUANTIZATION", "tickets=scalar,incidents=binary"
+    )
+    scalar = vs._quantization_config("tickets")
+    assert isinstance(scalar, ScalarQuantization)
+    assert scalar.scalar.type == ScalarType.INT8 and scalar.scalar.always_ram
+    assert isinstance(vs._quantization_config("incidents"), BinaryQuantization)
+    assert vs._quantization_config("products") is None
+
+
+def test_created_collections_carry_the_config(vs, monkeypatch):
+    # In-memory Qdrant drops quantization settings, so check what is sent
+    created = {}
+    create = vs.client.create_collection
+
+    def spy(collection_name, **kwargs):
+        created[collection_name] = kwargs["quantization_config"]
+        return create(collection_name, **kwargs)
+
+    monkeypatch.setattr(vs.client, "create_collection", spy)
+    monkeypatch.setattr(Config, "QDRANT_QUANTIZATION", "bench_a=scalar")
+    vs._create_collection("bench_a", 8)
+    vs._create_collection("bench_b", 8)
+    assert isinstance(created["bench_a"], ScalarQuantization)
+    assert created["bench_b"] is None
+
+
+def test_search_params(vs, monkeypatch):
+    monkeypatch.setattr(Config, "QDRANT_QUANTIZATION", "tickets=scalar")
+    monkeypatch.setattr(Config, "QDRANT_QUANTIZATION_OVERSAMPLING", 3.0)
+    # Embedded Qdrant always searches exactly
+    assert vs._search_params("tickets") is None
+
+    monkeypatch.setattr(Config, "QDRANT_MODE", "server")
+    params = vs._search_params("tickets")
+    assert params.quantization.rescore is Config.QDRANT_QUANTIZATION_RESCORE
+    assert params.quantization.oversampling == 3.0
+    assert vs._search_params("products") is None
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from config import Config
+from graph.routing import (
+    LocalRouter,
+    RouterCache,
+    RouterModel,
+    history_digest,
+    route_by_rules,
+)
+
+VECTORS = {
+    "show regional performance": [1.0, 0.0, 0.0],
+    "regional performance breakdown": [0.96, 0.28, 0.0],
+    "tell me a joke": [0.0, 0.0, 1.0],
+    "a": [0.0, 1.0, 0.0],
+    "b": [0.6, 0.0, 0.8],
+    "c": [0.0, 0.6, 0.8],
+}
+
+
+class FakeEmbed:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return VECTORS[text]
+
+
+@pytest.fixture
+def embed():
+    return FakeEmbed()
+
+
+def test_exact_hit_after_normalisation_skips_embedding(embed):
+    cache = RouterCache(max_size=4, threshold=0.9, embed=embed)
+    cache.put("Show regional performance", ["sales"])
+    embed.calls.clear()
+
+    agents, _ = cache.get("  show REGIONAL performance?! ")
+    assert agents == ["sales"]
+    assert embed.calls == []
+    assert cache.stats()["exact"] == 1
+
+
+def test_semantic_hit_above_threshold_only(embed):
+    cache = RouterCache(max_size=4, threshold=0.9, embed=embed)
+    cache.put("show regional performance", ["sales"])
+
+    agents, _ = cache.get("Regional performance breakdown")
+    assert agents == ["sales"]
+    agents, vector = cache.get("tell me a joke")
+    assert agents is None
+    assert vector is not None
+    assert cache.stats() == {
+        "size": 1,
+        "exact": 0,
+        "semantic": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_miss_vector_is_reused_by_put(embed):
+    cache = RouterCache(max_size=4, threshold=0.9, embed=embed)
+    cache.put("a", ["support"])
+    embed.calls.clear()
+
+    agents, vector = cache.get("tell me a joke")
+    cache.put("tell me a joke", [], vector)
+    assert embed.calls == ["tell me a joke"]
+    assert cache.get("tell me a joke")[0] == []
+
+
+def test_lru_eviction_reuses_slots(embed):
+    cache = RouterCache(max_size=2, threshold=0.99, embed=embed)
+    cache.put("a", ["sales"])
+    cache.put("b", ["inventory"])
+    assert cache.get("a")[0] == ["sales"]  # "b" is now least recently used
+
+    cache.put("c", ["memory"])
+    assert cache.get("b")[0] is None
+    assert cache.get("a")[0] == ["sales"]
+    assert cache.get("c")[0] == ["memory"]
+    assert cache.stats()["size"] == 2
+    # "c" took the evicted slot, so nearest-neighbour lookups still see it
+    slot = cache._entries["|c"][1]
+    assert np.allclose(cache._matrix[slot], VECTORS["c"])
+
+
+def test_follow_ups_and_disabled_cache_are_never_cached(embed):
+    cache = RouterCache(max_size=4, threshold=0.9, embed=embed)
+    cache.put("what about that one", ["sales"])
+    assert cache.stats()["size"] == 0
+    assert cache.get("what about that one") == (None, None)
+
+    disabled = RouterCache(max_size=0, threshold=0.9, embed=embed)
+    disabled.put("a", ["sales"])
+    assert disabled.get("a") == (None, None)
+
+
+def test_embedding_failure_falls_back_to_miss():
+    def broken(text):
+        raise RuntimeError("embeddings down")
+
+    cache = RouterCache(max_size=4, threshold=0.9, embed=broken)
+    cache.put("a", ["sales"])
+    assert cache.get("a") == (None, None)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("what's out of stock", ["inventory"]),
+        ("open tickets", ["support"]),
+        ("Hello!", []),
+        ("Show sales in the past 7 days", ["sales"]),
+        ("any similar incidents last time?", ["memory"]),
+        ("open tickets and out of stock items", None),
+        ("Why did sales drop?", None),
+        ("how about it?", None),
+    ],
+)
+def test_rules(query, expected):
+    assert route_by_rules(query) == expected
+
+
+def test_local_router_counts_only_local_stages(tmp_path):
+    examples = (
+        [
+            {"query": f"how much did we earn {d}", "agents": ["sales"]}
+            for d in ("today", "yesterday", "this week", "last month")
+        ]
+        + [
+            {"query": f"unhappy customers {d}", "agents": ["support"]}
+            for d in ("today", "yesterday", "this week", "last month")
+        ]
+        + [
+            {"query": q, "agents": []}
+            for q in ("tell me a joke", "what is the weather", "recommend a movie")
+        ]
+    )
+    path = tmp_path / "router.npz"
+    RouterModel.train(examples, dim=256).save(str(path))
+    router = LocalRouter(model_path=str(path), threshold=0.9)
+
+    assert router.route("open tickets") == (["support"], "rules")
+    assert router.route("how much did we earn on friday") == (["sales"], "model")
+    assert router.route("quantum physics explained") == (None, None)
+    router.record("cache")
+    router.record("llm")
+
+    stats = router.stats()
+    assert [stats[stage] for stage in ("rules", "model", "cache", "llm")] == [1] * 4
+    assert stats["fallback_rate"] == 0.25
+
+
+def test_decisions_are_scoped_to_recent_history(embed, monkeypatch):
+    monkeypatch.setattr(Config, "ROUTER_CACHE_HISTORY", 2)
+    cache = RouterCache(max_size=4, threshold=0.9, embed=embed)
+    about_sales = [HumanMessage("how were sales"), AIMessage("Revenue was up.")]
+    about_tickets = [HumanMessage("open tickets"), AIMessage("There are 4.")]
+    cache.put("show regional performance", ["sales"], chat_history=about_sales)
+
+    assert cache.get("show regional performance", about_sales)[0] == ["sales"]
+    assert cache.get("regional performance breakdown", about_sales)[0] == ["sales"]
+    assert cache.get("show regional performance", about_tickets)[0] is None
+    assert cache.get("regional performance breakdown")[0] is None
+    # Only the most recent messages count towards the digest
+    longer = [HumanMessage("hi"), AIMessage("Hello!")] + about_sales
+    assert history_digest(longer) == history_digest(about_sales)
+    assert history_digest([]) == ""
@@ -0,0 +1,119 @@
+import pytest
+from db import run_async
+from db.database import MIGRATIONS
+
+START, END = "2024-01-01", "2024-01-31"
+
+SALES = [
+    (1, 1, 2, 40.0, "2024-01-05", "north"),
+    (2, 1, 1, 20.0, "2024-01-05", "north"),
+    (3, 2, 3, 90.0, "2024-01-05", "south"),
+    (4, 2, 1, 30.0, "2024-01-06", None),
+    (5, 3, 5, 25.0, "2024-01-07", "north"),
+    (6, 3, 1, 5.0, "2024-02-01", "north"),
+]
+
+
+def raw(db, sql: str) -> list[dict]:
+    return run_async(db._fetch(sql, (START, END)))
+
+
+def raw_sales(db) -> list[dict]:
+    return raw(
+        db,
+        "SELECT sale_date, SUM(amount) as revenue, SUM(quantity) as orders "
+        "FROM sales WHERE sale_date BETWEEN ? AND ? GROUP BY sale_date",
+    )
+
+
+def raw_by_region(db) -> list[dict]:
+    return raw(
+        db,
+        "SELECT region, SUM(amount) as revenue, SUM(quantity) as orders "
+        "FROM sales WHERE sale_date BETWEEN ? AND ? GROUP BY region",
+    )
+
+
+def raw_top_products(db) -> list[dict]:
+    return raw(
+        db,
+        "SELECT p.id, p.name, SUM(s.amount) as revenue, SUM(s.quantity) as units "
+        "FROM sales s JOIN products p ON s.product_id = p.id "
+        "WHERE s.sale_date BETWEEN ? AND ? GROUP BY p.id ORDER BY revenue DESC",
+    )
+
+
+def by(rows: list[dict], key: str) -> dict:
+    return {r[key]: r for r in rows}
+
+
+def assert_matches_raw(db):
+    assert by(run_async(db.get_sales(START, END)), "sale_date") == by(
+        raw_sales(db), "sale_date"
+    )
+    assert by(run_async(db.get_sales_by_region(START, END)), "region") == by(
+        raw_by_region(db), "region"
+    )
+    assert run_async(db.get_top_products(START, END, limit=10)) == raw_top_products(db)
+
+
+@pytest.fixture
+def sales_db(db):
+    for product_id in (1, 2, 3):
+        run_async(
+            db._execute(
+                "INSERT INTO products (id, name, price) VALUES (?, ?, ?)",
+                (product_id, f"Product {product_id}", 10.0),
+            )
+        )
+    for row in SALES:
+        run_async(db._execute("INSERT INTO sales VALUES (?, ?, ?, ?, ?, ?)", row))
+    return db
+
+
+def test_rollup_matches_raw_after_insert(sales_db):
+    assert_matches_raw(sales_db)
+
+
+def test_rollup_matches_raw_after_update(sales_db):
+    run_async(sales_db._execute("UPDATE sales SET amount = 100.0 WHERE id = 1"))
+    run_async(sales_db._execute("UPDATE sales SET region = 'east' WHERE id = 3"))
+    run_async(
+        sales_db._execute("UPDATE sales SET sale_date = '2024-01-20' WHERE id = 2")
+    )
+    run_async(sales_db._execute("UPDATE sales SET product_id = 1 WHERE id = 5"))
+    assert_matches_raw(sales_db)
+
+
+def test_rollup_matches_raw_after_delete(sales_db):
+    run_async(sales_db._execute("DELETE FROM sales WHERE id IN (2, 4)"))
+    assert_matches_raw(sales_db)
+    # Groups whose last order is gone disappear from the rollup
+    dates = {r["sale_date"] for r in run_async(sales_db.get_sales(START, END))}
+    assert "2024-01-06" not in dates
+
+
+def test_rebuild_matches_triggers(sales_db):
+    before = run_async(sales_db._fetch("SELECT * FROM sales_daily ORDER BY 1, 2, 3"))
+    run_async(sales_db.rebuild_sales_daily())
+    after = run_async(sales_db._fetch("SELECT * FROM sales_daily ORDER BY 1, 2, 3"))
+    assert after == before
+
+
+def test_migration_backfills_existing_sales(tmp_path):
+    from db import Database
+
+    db = Database(str(tmp_path / "legacy.db"))
+    run_async(db.init(migrate=False))
+    run_async(db.migrate(target=1))
+    run_async(
+        db._execute("INSERT INTO products (id, name, price) VALUES (1, 'P', 1.0)")
+    )
+    run_async(
+        db._execute("INSERT INTO sales VALUES (1, 1, 2, 40.0, '2024-01-05', 'north')")
+    )
+
+    run_async(db.migrate())
+    assert run_async(db.schema_version()) == MIGRATIONS[-1][0]
+    assert_matches_raw(db)
+    run_async(db.close())
@@ -0,0 +1,68 @@
+from vectorstore.cache import ResultCache
+
+KEY = ("tickets", "query-hash", 5, None)
+
+
+def test_result_cache_hit_returns_copies():
+    cache = ResultCache(max_size=4, ttl=60)
+    cache.put(KEY, [{"subject": "a"}], cache.generation("tickets"))
+
+    first = cache.get(KEY)
+    first[0]["subject"] = "mutated"
+    assert cache.get(KEY) == [{"subject": "a"}]
+    assert cache.stats["hits"] == 2
+
+
+def test_invalidate_drops_entries_for_that_collection_only():
+    cache = ResultCache(max_size=4, ttl=60)
+    other = ("incidents",) + KEY[1:]
+    cache.put(KEY, [{"id": 1}], cache.generation("tickets"))
+    cache.put(other, [{"id": 2}], cache.generation("incidents"))
+
+    cache.invalidate("tickets")
+    assert cache.get(KEY) is None
+    assert cache.get(other) == [{"id": 2}]
+
+
+def test_stale_generation_is_never_stored():
+    cache = ResultCache(max_size=4, ttl=60)
+    generation = cache.generation("tickets")
+    # A write lands while the search is in flight
+    cache.invalidate("tickets")
+    cache.put(KEY, [{"id": 1}], generation)
+    assert cache.get(KEY) is None
+
+
+def test_expired_and_evicted_entries_miss(monkeypatch):
+    cache = ResultCache(max_size=2, ttl=10)
+    clock = [100.0]
+    monkeypatch.setattr("vectorstore.cache.time.monotonic", lambda: clock[0])
+    keys = [("tickets", str(i), 5, None) for i in range(3)]
+    for key in keys:
+        cache.put(key, [{"key": key[1]}], cache.generation("tickets"))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == [{"key": "2"}]
+    clock[0] += 11
+    assert cache.get(keys[2]) is None
+
+
+def test_upsert_invalidates_cached_search(vs):
+    vs.add_ticket(1, "Late delivery", "Parcel arrived a week late", "shipping")
+    before = vs.search_tickets("parcel arrived late", limit=5)
+    assert [t["ticket_id"] for t in before] == [1]
+    assert vs.search_tickets("parcel arrived late", limit=5) == before
+    assert vs.result_cache.stats["hits"] == 1
+
+    vs.add_ticket(2, "Parcel late again", "Parcel arrived late twice", "shipping")
+    after = vs.search_tickets("parcel arrived late", limit=5)
+    assert {t["ticket_id"] for t in after} == {1, 2}
+
+
+def test_delete_invalidates_cached_search(vs):
+    vs.add_ticket(1, "Late delivery", "Parcel arrived a week late", "shipping")
+    vs.add_ticket(2, "Parcel late again", "Parcel arrived late twice", "shipping")
+    assert len(vs.search_tickets("parcel arrived late")) == 2
+
+    vs.delete_points("tickets", [2])
+    assert [t["ticket_id"] for t in vs.search_tickets("parcel arrived late")] == [1]
@@ -0,0 +1,76 @@
+import os
+import stat
+import pytest
+from vectorstore import snapshot
+
+
+def fill(vs):
+    vs.add_tickets_batch(
+        [
+            {
+                "ticket_id": i,
+                "subject": f"Refund pending {i}",
+                "description": "Refund not processed after return",
+                "category": "refund",
+            }
+            for i in range(1, 6)
+        ]
+    )
+    vs.add_product(1, "Yoga Mat", "Fitness", "Non-slip eco-friendly mat")
+
+
+def test_round_trip(vs, tmp_path):
+    fill(vs)
+    before = vs.search_tickets("refund not processed", limit=5)
+    path = str(tmp_path / "snap")
+
+    manifest = vs.export_snapshot(path)
+    assert manifest["collections"]["tickets"]["count"] == 5
+    assert os.path.islink(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o755
+
+    vs.reset()
+    assert vs.count("tickets") == 0
+    assert vs.import_snapshot(path) is True
+    assert vs.count("tickets") == 5 and vs.count("products") == 1
+    after = vs.search_tickets("refund not processed", limit=5)
+    assert [t["ticket_id"] for t in after] == [t["ticket_id"] for t in before]
+    # Vectors are stored as float32
+    assert [t["score"] for t in after] == pytest.approx([t["score"] for t in before])
+
+
+def test_republish_swaps_link_and_prunes_old_versions(vs, tmp_path):
+    fill(vs)
+    path = str(tmp_path / "snap")
+    published = []
+    for _ in range(3):
+        vs.export_snapshot(path)
+        published.append(os.path.realpath(path))
+
+    assert len(set(published)) == 3
+    versions = sorted(os.listdir(f"{path}.versions"))
+    assert [os.path.join(f"{path}.versions", v) for v in versions] == sorted(
+        published[1:]
+    )
+    assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
+
+
+def test_replaces_legacy_directory(vs, tmp_path):
+    fill(vs)
+    path = tmp_path / "snap"
+    path.mkdir()
+    (path / snapshot.MANIFEST).write_text("{}")
+
+    vs.export_snapshot(str(path))
+    assert os.path.islink(path)
+    assert snapshot.read_manifest(str(path))["version"] == snapshot.SNAPSHOT_VERSION
+
+
+def test_rejects_other_embedding_model(vs, tmp_path, monkeypatch):
+    fill(vs)
+    path = str(tmp_path / "snap")
+    vs.export_snapshot(path)
+
+    monkeypatch.setattr(snapshot, "embedding_model_id", lambda: "other-model")
+    assert vs.import_snapshot(path) is False
+    assert snapshot.import_snapshot(vs, str(tmp_path / "missing")) is False
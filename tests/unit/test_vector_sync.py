@@ -0,0 +1,128 @@
+import pytest
+from config import Config
+from db import run_async
+from vectorstore import seed_vectors
+from vectorstore.sync import VectorSync, point_id
+
+
+@pytest.fixture
+def sync(db, vs):
+    return VectorSync(db, vs)
+
+
+def payload(vs, table: str, row_id: int) -> dict | None:
+    points = vs.client.retrieve(table, [point_id(table, row_id)])
+    return points[0].payload if points else None
+
+
+def pending(db) -> list[dict]:
+    return run_async(db.get_vector_changes())
+
+
+def create_ticket(db, subject="Refund pending", description="Refund not processed"):
+    run_async(db.create_ticket(subject, description, "refund", "high"))
+    return run_async(db._fetch("SELECT MAX(id) AS id FROM tickets"))[0]["id"]
+
+
+def test_insert_propagates_and_trims_log(db, vs, sync):
+    ticket_id = create_ticket(db)
+    run_async(
+        db._execute(
+            "INSERT INTO incidents (id, type, description, root_cause, "
+            "action_taken, outcome) VALUES (7, 'stockout', 'Sold out', 'Demand', "
+            "'Restock', 'Recovered')"
+        )
+    )
+    assert len(pending(db)) == 2
+
+    assert sync.sync() == 2
+    assert payload(vs, "tickets", ticket_id)["status"] == "open"
+    assert payload(vs, "incidents", 7)["incident_type"] == "stockout"
+    assert pending(db) == []
+
+
+def test_resolve_propagates(db, vs, sync):
+    ticket_id = create_ticket(db)
+    sync.sync()
+    assert ticket_id not in [
+        t["ticket_id"] for t in vs.search_resolved_tickets("refund not processed")
+    ]
+
+    run_async(db.resolve_ticket(ticket_id))
+    assert sync.sync() == 1
+    assert payload(vs, "tickets", ticket_id)["status"] == "resolved"
+    assert ticket_id in [
+        t["ticket_id"] for t in vs.search_resolved_tickets("refund not processed")
+    ]
+
+
+def test_delete_propagates(db, vs, sync):
+    ticket_id = create_ticket(db)
+    sync.sync()
+    run_async(db._execute("DELETE FROM tickets WHERE id = ?", (ticket_id,)))
+
+    assert sync.sync() == 1
+    assert payload(vs, "tickets", ticket_id) is None
+    assert pending(db) == []
+
+
+def test_repeated_changes_collapse_within_a_batch(db, vs, sync):
+    ticket_id = create_ticket(db)
+    run_async(db.resolve_ticket(ticket_id))
+    run_async(
+        db._execute(
+            "UPDATE tickets SET subject = 'Refund issued' WHERE id = ?", (ticket_id,)
+        )
+    )
+    assert sync.sync_once(batch_size=2) == 2
+    # The third entry stays queued until the next batch
+    assert len(pending(db)) == 1
+    assert payload(vs, "tickets", ticket_id)["subject"] == "Refund issued"
+    assert sync.sync() == 1
+
+
+def test_failed_embedding_keeps_log_for_retry(db, vs, sync, monkeypatch):
+    ticket_id = create_ticket(db)
+    embed_batch = vs._embed_batch
+
+    def fail(texts):
+        raise RuntimeError("embeddings down")
+
+    monkeypatch.setattr(vs, "_embed_batch", fail)
+    with pytest.raises(RuntimeError):
+        sync.sync()
+    assert len(pending(db)) == 1
+    assert payload(vs, "tickets", ticket_id) is None
+
+    monkeypatch.setattr(vs, "_embed_batch", embed_batch)
+    assert sync.sync() == 1
+    assert payload(vs, "tickets", ticket_id) is not None
+    assert pending(db) == []
+
+
+def test_backfill_restores_synced_rows_into_rebuilt_store(db, vs, sync):
+    kept = create_ticket(db)
+    dropped = create_ticket(db, "Wrong size", "Need a size 10")
+    sync.sync()
+    run_async(db._execute("DELETE FROM tickets WHERE id = ?", (dropped,)))
+    sync.sync()
+
+    # A restart in memory mode rebuilds the store from the curated seed only
+    vs.reset()
+    assert payload(vs, "tickets", kept) is None
+
+    assert sync.backfill() == 1
+    assert payload(vs, "tickets", kept)["subject"] == "Refund pending"
+    assert payload(vs, "tickets", dropped) is None
+
+
+def test_seed_vectors_replays_synced_rows(db, vs, sync, monkeypatch):
+    monkeypatch.setattr(Config, "DB_PATH", db.path)
+    monkeypatch.setattr(Config, "VECTOR_SNAPSHOT_PATH", None)
+    ticket_id = create_ticket(db)
+    sync.sync()
+
+    vs.reset()
+    seed_vectors()
+    assert vs.count("incidents") > 0
+    assert payload(vs, "tickets", ticket_id)["status"] == "open"
@@ -1,4 +1,5 @@
 from .store import VectorStore
 from .seed import seed_vectors
+from .sync import VectorSync, request_sync
 
-__all__ = ["VectorStore", "seed_vectors"]
+__all__ = ["VectorStore", "seed_vectors", "VectorSync", "request_sync"]
@@ -0,0 +1,189 @@
+import array
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from logger import log
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache keyed by (model, sha256(text)).
+
+    An in-memory LRU sits in front of an optional SQLite file, so repeated
+    queries and re-seeds skip the embedding API entirely.
+    """
+
+    def __init__(self, model: str, max_size: int = 10_000, path: str = None):
+        self.model = model or ""
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._lru: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._disk = sqlite3.connect(path, check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._disk.commit()
+            log.debug(f"Embedding cache on disk: {path}")
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\0{text}".encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._lru),
+        }
+
+    def _remember(self, key: str, vector: list[float]):
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def get_many(self, texts: list[str]) -> list[list[float] | None]:
+        keys = [self.key(t) for t in texts]
+        found: dict[str, list[float]] = {}
+
+        with self._lock:
+            for k in keys:
+                if k in self._lru:
+                    self._lru.move_to_end(k)
+                    found[k] = self._lru[k]
+
+            missing = [k for k in dict.fromkeys(keys) if k not in found]
+            if self._disk is not None:
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i : i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._disk.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    for k, blob in rows:
+                        vector = array.array("f", blob).tolist()
+                        found[k] = vector
+                        self._remember(k, vector)
+                        self.disk_hits += 1
+
+            results = [found.get(k) for k in keys]
+            for r in results:
+                if r is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+        return results
+
+    def get(self, text: str) -> list[float] | None:
+        return self.get_many([text])[0]
+
+    def put_many(self, texts: list[str], vectors: list[list[float]]):
+        entries = [(self.key(t), v) for t, v in zip(texts, vectors)]
+        with self._lock:
+            for k, v in entries:
+                self._remember(k, v)
+            if self._disk is not None:
+                self._disk.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    ((k, array.array("f", v).tobytes()) for k, v in entries),
+                )
+                self._disk.commit()
+
+    def put(self, text: str, vector: list[float]):
+        self.put_many([text], [vector])
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+
+class ResultCache:
+    """TTL + LRU cache of search results with per-collection invalidation.
+
+    Each collection has a generation counter that upserts bump; entries carry
+    the generation they were computed at, so results from before a write are
+    never served, even if the search was in flight when the write landed.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[tuple, tuple[float, int, list[dict]]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+        }
+
+    def generation(self, collection: str) -> int:
+        with self._lock:
+            return self._generations.setdefault(collection, 0)
+
+    def get(self, key: tuple) -> list[dict] | None:
+        collection = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, generation, results = entry
+                current = self._generations.get(collection, 0)
+                if expires > time.monotonic() and generation == current:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return [dict(r) for r in results]
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def put(self, key: tuple, results: list[dict], generation: int):
+        collection = key[0]
+        with self._lock:
+            if generation != self._generations.get(collection, 0):
+                return
+            self._entries[key] = (
+                time.monotonic() + self.ttl,
+                generation,
+                [dict(r) for r in results],
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, collection: str = None):
+        with self._lock:
+            if collection is None:
+                for name in self._generations:
+                    self._generations[name] += 1
+                self._entries.clear()
+            else:
+                self._generations[collection] = self._generations.get(collection, 0) + 1
@@ -0,0 +1,73 @@
+import re
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 64-bit mixing constants (splitmix64 finaliser)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_BASE = np.uint64(0x100000001B3)
+
+
+class HashEmbeddings(Embeddings):
+    """Deterministic local embeddings from signed, hashed character n-grams.
+
+    No network, no model weights: vectors depend only on the text, dim and
+    n-gram sizes, so they are stable across processes and machines. Texts
+    sharing many n-grams land close together, which is enough for offline
+    runs and for benchmarking the seed/search paths without the API.
+    """
+
+    def __init__(self, dim: int = 1536, ngrams: tuple[int, ...] = (3, 4, 5)):
+        self.dim = dim
+        self.ngrams = ngrams
+
+    @staticmethod
+    def _normalize(text: str) -> bytes:
+        return f" {_WHITESPACE.sub(' ', text.lower()).strip()} ".encode("utf-8")
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        encoded = [self._normalize(t) for t in texts]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64)
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        owner = np.repeat(np.arange(len(texts)), lengths)
+
+        rows, cols, signs = [], [], []
+        with np.errstate(over="ignore"):
+            for n in self.ngrams:
+                if len(data) < n:
+                    continue
+                count = len(data) - n + 1
+                # n-grams must not straddle two texts
+                valid = owner[:count] == owner[n - 1 :]
+                h = np.full(count, np.uint64(n))
+                for k in range(n):
+                    h = (h * _BASE) ^ data[k : k + count]
+                h ^= h >> np.uint64(30)
+                h *= _MIX_1
+                h ^= h >> np.uint64(27)
+                h *= _MIX_2
+                h ^= h >> np.uint64(31)
+                rows.append(owner[:count][valid])
+                cols.append((h[valid] % np.uint64(self.dim)).astype(np.int64))
+                signs.append(np.where(h[valid] >> np.uint64(63), -1.0, 1.0))
+
+        if not rows:
+            return np.zeros((len(texts), self.dim), dtype=np.float32)
+        flat = np.concatenate(rows) * self.dim + np.concatenate(cols)
+        vectors = np.bincount(
+            flat, weights=np.concatenate(signs), minlength=len(texts) * self.dim
+        ).reshape(len(texts), self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors.astype(np.float32)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._embed(texts).tolist()
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed([text])[0].tolist()
@@ -0,0 +1,272 @@
+import threading
+from types import SimpleNamespace
+import numpy as np
+from qdrant_client.models import (
+    CollectionDescription,
+    CollectionsResponse,
+    CollectionStatus,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    Record,
+    ScoredPoint,
+)
+from qdrant_client.http.models import QueryResponse
+
+
+class _Collection:
+    """Row-major L2-normalised float32 matrix plus ids and payloads.
+
+    Deletes swap the last row into the hole, so rows stay dense and every
+    search is a single matmul over [:size].
+    """
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.size = 0
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self.ids: list = []
+        self.payloads: list[dict] = []
+        self.rows: dict = {}
+        self._columns: dict[str, np.ndarray] = {}
+
+    def _grow(self, needed: int):
+        capacity = len(self.matrix)
+        if needed <= capacity:
+            return
+        grown = np.zeros((max(needed, capacity * 2, 64), self.dim), dtype=np.float32)
+        grown[: self.size] = self.matrix[: self.size]
+        self.matrix = grown
+
+    def upsert(self, ids: list, vectors: np.ndarray, payloads: list[dict]):
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms > 0, norms, 1)
+        self._grow(self.size + len(ids))
+        for point_id, vector, payload in zip(ids, vectors, payloads):
+            row = self.rows.get(point_id)
+            if row is None:
+                row = self.size
+                self.size += 1
+                self.rows[point_id] = row
+                self.ids.append(point_id)
+                self.payloads.append(payload or {})
+            else:
+                self.payloads[row] = payload or {}
+            self.matrix[row] = vector
+        self._columns.clear()
+
+    def delete(self, ids: list):
+        for point_id in ids:
+            row = self.rows.pop(point_id, None)
+            if row is None:
+                continue
+            last = self.size - 1
+            if row != last:
+                moved = self.ids[last]
+                self.matrix[row] = self.matrix[last]
+                self.ids[row] = moved
+                self.payloads[row] = self.payloads[last]
+                self.rows[moved] = row
+            self.ids.pop()
+            self.payloads.pop()
+            self.size -= 1
+        self._columns.clear()
+
+    def column(self, key: str) -> np.ndarray:
+        """Payload field as an object array, cached until the next write."""
+        values = self._columns.get(key)
+        if values is None:
+            values = np.empty(self.size, dtype=object)
+            values[:] = [p.get(key) for p in self.payloads]
+            self._columns[key] = values
+        return values
+
+    def mask(self, query_filter: Filter | None) -> np.ndarray | None:
+        if query_filter is None:
+            return None
+
+        def condition(c) -> np.ndarray:
+            if isinstance(c, Filter):
+                return self.mask(c)
+            if not isinstance(c, FieldCondition):
+                raise ValueError(f"Unsupported filter condition: {c!r}")
+            values = self.column(c.key)
+            if isinstance(c.match, MatchValue):
+                return values == c.match.value
+            if isinstance(c.match, MatchAny):
+                return np.isin(values, list(c.match.any))
+            raise ValueError(f"Unsupported match on {c.key}: {c.match!r}")
+
+        def as_list(conditions):
+            if conditions is None:
+                return []
+            return conditions if isinstance(conditions, list) else [conditions]
+
+        result = np.ones(self.size, dtype=bool)
+        for c in as_list(query_filter.must):
+            result &= condition(c)
+        should = as_list(query_filter.should)
+        if should:
+            result &= np.logical_or.reduce([condition(c) for c in should])
+        for c in as_list(query_filter.must_not):
+            result &= ~condition(c)
+        return result
+
+    def top_k(
+        self, scores: np.ndarray, limit: int, mask: np.ndarray | None
+    ) -> list[ScoredPoint]:
+        if mask is not None:
+            scores = np.where(mask, scores, -np.inf)
+            limit = min(limit, int(mask.sum()))
+        limit = min(limit, self.size)
+        if limit <= 0:
+            return []
+        idx = np.argpartition(-scores, limit - 1)[:limit]
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+        return [
+            ScoredPoint(
+                id=self.ids[i],
+                version=0,
+                score=float(scores[i]),
+                payload=self.payloads[i],
+            )
+            for i in idx
+        ]
+
+
+class NumpyClient:
+    """In-process brute-force stand-in for QdrantClient (QDRANT_MODE=numpy).
+
+    Implements the subset of the QdrantClient API that VectorStore uses, with
+    cosine similarity only. Nothing is persisted; pair it with a vector
+    snapshot for fast restarts.
+    """
+
+    def __init__(self):
+        self._collections: dict[str, _Collection] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, name: str) -> _Collection:
+        collection = self._collections.get(name)
+        if collection is None:
+            raise ValueError(f"Collection {name} not found")
+        return collection
+
+    # Collections
+
+    def get_collections(self) -> CollectionsResponse:
+        return CollectionsResponse(
+            collections=[CollectionDescription(name=n) for n in self._collections]
+        )
+
+    def collection_exists(self, collection_name: str) -> bool:
+        return collection_name in self._collections
+
+    def create_collection(self, collection_name: str, vectors_config, **_) -> bool:
+        with self._lock:
+            self._collections[collection_name] = _Collection(vectors_config.size)
+        return True
+
+    def delete_collection(self, collection_name: str, **_) -> bool:
+        with self._lock:
+            return self._collections.pop(collection_name, None) is not None
+
+    def get_collection(self, collection_name: str):
+        collection = self._get(collection_name)
+        return SimpleNamespace(
+            points_count=collection.size,
+            status=CollectionStatus.GREEN,
+            payload_schema={},
+        )
+
+    def create_payload_index(self, *_, **__):
+        # Filters are evaluated as vectorised masks; nothing to index
+        return None
+
+    # Points
+
+    def upsert(self, collection_name: str, points: list, **_):
+        with self._lock:
+            self._get(collection_name).upsert(
+                [p.id for p in points],
+                np.array([p.vector for p in points], dtype=np.float32),
+                [p.payload for p in points],
+            )
+
+    def upload_collection(
+        self, collection_name: str, vectors, payload=None, ids=None, **_
+    ):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        ids = list(ids) if ids is not None else list(range(len(vectors)))
+        payload = list(payload) if payload is not None else [{}] * len(ids)
+        with self._lock:
+            self._get(collection_name).upsert(ids, vectors, payload)
+
+    def delete(self, collection_name: str, points_selector, **_):
+        with self._lock:
+            self._get(collection_name).delete(list(points_selector.points))
+
+    def scroll(
+        self,
+        collection_name: str,
+        limit: int = 10,
+        offset=None,
+        with_payload: bool = True,
+        with_vectors: bool = False,
+        **_,
+    ):
+        with self._lock:
+            collection = self._get(collection_name)
+            start = offset or 0
+            end = min(start + limit, collection.size)
+            records = [
+                Record(
+                    id=collection.ids[i],
+                    payload=collection.payloads[i] if with_payload else None,
+                    vector=collection.matrix[i].tolist() if with_vectors else None,
+                )
+                for i in range(start, end)
+            ]
+        return records, (end if end < collection.size else None)
+
+    # Search
+
+    def query_points(
+        self,
+        collection_name: str,
+        query,
+        limit: int = 10,
+        query_filter: Filter = None,
+        **_,
+    ) -> QueryResponse:
+        with self._lock:
+            collection = self._get(collection_name)
+            q = np.asarray(query, dtype=np.float32)
+            q = q / (np.linalg.norm(q) or 1)
+            scores = collection.matrix[: collection.size] @ q
+            points = collection.top_k(scores, limit, collection.mask(query_filter))
+        return QueryResponse(points=points)
+
+    def query_batch_points(
+        self, collection_name: str, requests: list, **_
+    ) -> list[QueryResponse]:
+        if not requests:
+            return []
+        with self._lock:
+            collection = self._get(collection_name)
+            q = np.asarray([r.query for r in requests], dtype=np.float32)
+            q = q / np.linalg.norm(q, axis=1, keepdims=True).clip(1e-12)
+            # One matmul for the whole batch
+            scores = q @ collection.matrix[: collection.size].T
+            return [
+                QueryResponse(
+                    points=collection.top_k(row, r.limit, collection.mask(r.filter))
+                )
+                for row, r in zip(scores, requests)
+            ]
+
+    def close(self):
+        with self._lock:
+            self._collections.clear()
@@ -1,5 +1,7 @@
 from datetime import datetime
+from config import Config
 from .store import VectorStore
+from .sync import VectorSync
 from logger import log
 
 
@@ -11,11 +13,20 @@ def seed_vectors():
         log.info("VectorStore already seeded")
         return
 
-    log.info("Seeding VectorStore...")
-    seed_incidents(vs)
-    seed_tickets(vs)
-    seed_products(vs)
-    log.info("VectorStore seeded successfully")
+    snapshot = Config.VECTOR_SNAPSHOT_PATH
+    if not (snapshot and vs.import_snapshot(snapshot)):
+        log.info("Seeding VectorStore...")
+        seed_incidents(vs)
+        seed_tickets(vs)
+        seed_products(vs)
+        log.info("VectorStore seeded successfully")
+
+        if snapshot:
+            vs.export_snapshot(snapshot)
+
+    # The snapshot only holds the curated seed; tickets and incidents synced
+    # from SQLite since then are replayed on top of it.
+    VectorSync(vs=vs).backfill()
 
 
 def seed_incidents(vs: VectorStore):
@@ -255,15 +266,19 @@ def seed_incidents(vs: VectorStore):
         },
     ]
 
-    for inc in incidents:
-        vs.add_incident(
-            incident_id=inc["id"],
-            incident_type=inc["type"],
-            description=inc["description"],
-            root_cause=inc["root_cause"],
-            action_taken=inc["action_taken"],
-            outcome=inc["outcome"],
-        )
+    vs.add_incidents_batch(
+        [
+            {
+                "incident_id": inc["id"],
+                "incident_type": inc["type"],
+                "description": inc["description"],
+                "root_cause": inc["root_cause"],
+                "action_taken": inc["action_taken"],
+                "outcome": inc["outcome"],
+            }
+            for inc in incidents
+        ]
+    )
 
     log.debug(f"Added {len(incidents)} incidents to VectorStore")
 
@@ -377,14 +392,18 @@ def seed_tickets(vs: VectorStore):
         },
     ]
 
-    for t in tickets:
-        vs.add_ticket(
-            ticket_id=t["id"],
-            subject=t["subject"],
-            description=t["description"],
-            category=t["category"],
-            resolution=t["resolution"],
-        )
+    vs.add_tickets_batch(
+        [
+            {
+                "ticket_id": t["id"],
+                "subject": t["subject"],
+                "description": t["description"],
+                "category": t["category"],
+                "resolution": t["resolution"],
+            }
+            for t in tickets
+        ]
+    )
 
     log.debug(f"Added {len(tickets)} tickets to VectorStore")
 
@@ -483,8 +502,12 @@ def seed_products(vs: VectorStore):
         ),
     ]
 
-    for p in products:
-        vs.add_product(product_id=p[0], name=p[1], category=p[2], description=p[3])
+    vs.add_products_batch(
+        [
+            {"product_id": p[0], "name": p[1], "category": p[2], "description": p[3]}
+            for p in products
+        ]
+    )
 
     log.debug(f"Added {len(products)} products to VectorStore")
 
@@ -0,0 +1,143 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+import numpy as np
+from config import embedding_model_id
+from logger import log
+
+SNAPSHOT_VERSION = 1
+MANIFEST = "manifest.json"
+# Published versions kept next to the current one, so a replica still reading
+# the previous snapshot is not pulled from under it.
+KEEP_VERSIONS = 2
+
+
+def export_snapshot(vs, path: str) -> dict:
+    """Write every collection as <name>.npy (float32) + <name>.jsonl.
+
+    The .jsonl holds one {"id", "payload"} line per vector row. Each export
+    goes to a new directory under `<path>.versions/` and `path` is a symlink
+    swapped to it with a single rename, so readers never see a partial or
+    missing snapshot.
+    """
+    path = os.path.abspath(path)
+    versions = f"{path}.versions"
+    os.makedirs(versions, exist_ok=True)
+    # Nanosecond prefix keeps versions in publish order for pruning
+    tmp = tempfile.mkdtemp(prefix=f"{time.time_ns():020d}_", dir=versions)
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "embedding_model": embedding_model_id(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "collections": {},
+    }
+    try:
+        for name, dim in vs.COLLECTIONS.items():
+            vectors = []
+            with open(os.path.join(tmp, f"{name}.jsonl"), "w") as f:
+                offset = None
+                while True:
+                    points, offset = vs.client.scroll(
+                        collection_name=name,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=True,
+                    )
+                    for p in points:
+                        f.write(json.dumps({"id": p.id, "payload": p.payload}) + "\n")
+                        vectors.append(p.vector)
+                    if offset is None:
+                        break
+            array = np.asarray(vectors, dtype=np.float32).reshape(-1, dim)
+            np.save(os.path.join(tmp, f"{name}.npy"), array)
+            manifest["collections"][name] = {"count": len(array), "dim": dim}
+
+        with open(os.path.join(tmp, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2)
+        # mkdtemp creates 0700; other replicas' users need to read it
+        os.chmod(tmp, 0o755)
+        _publish(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    _prune(versions, keep=os.path.basename(tmp))
+
+    counts = {n: c["count"] for n, c in manifest["collections"].items()}
+    log.info(f"VectorStore snapshot exported to {path}: {counts}")
+    return manifest
+
+
+def _publish(version_dir: str, path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        # Snapshots exported before versioning were plain directories
+        shutil.rmtree(path)
+    link = f"{path}.{os.getpid()}.tmp"
+    target = os.path.relpath(version_dir, os.path.dirname(path))
+    if os.path.lexists(link):
+        os.remove(link)
+    os.symlink(target, link)
+    os.replace(link, path)
+
+
+def _prune(versions: str, keep: str):
+    names = sorted(n for n in os.listdir(versions) if n != keep)
+    for name in names[: max(0, len(names) - (KEEP_VERSIONS - 1))]:
+        shutil.rmtree(os.path.join(versions, name), ignore_errors=True)
+
+
+def read_manifest(path: str) -> dict | None:
+    try:
+        with open(os.path.join(path, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def import_snapshot(vs, path: str, batch_size: int = 1000) -> bool:
+    """Load a snapshot written by export_snapshot; False if it is missing or
+    was produced by a different embedding model/dimension."""
+    # Pin the published version so a concurrent export cannot swap it mid-read
+    path = os.path.realpath(path)
+    manifest = read_manifest(path)
+    if manifest is None:
+        return False
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        log.warning(f"Ignoring snapshot {path}: unsupported version")
+        return False
+    if manifest.get("embedding_model") != embedding_model_id():
+        log.warning(
+            f"Ignoring snapshot {path}: built with {manifest.get('embedding_model')}, "
+            f"current embeddings are {embedding_model_id()}"
+        )
+        return False
+    for name, meta in manifest["collections"].items():
+        if vs.COLLECTIONS.get(name) != meta["dim"]:
+            log.warning(f"Ignoring snapshot {path}: {name} dimension mismatch")
+            return False
+
+    vs.init_collections()
+    for name, meta in manifest["collections"].items():
+        # Memory-mapped: vectors are paged in batch by batch, never copied whole
+        vectors = np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+        with open(os.path.join(path, f"{name}.jsonl")) as f:
+            records = [json.loads(line) for line in f]
+        if len(records) != len(vectors):
+            raise ValueError(f"Snapshot {path} is corrupt: {name} length mismatch")
+
+        vs.client.upload_collection(
+            collection_name=name,
+            vectors=vectors,
+            payload=(r["payload"] for r in records),
+            ids=(r["id"] for r in records),
+            batch_size=batch_size,
+            wait=True,
+        )
+        vs.invalidate(name)
+
+    counts = {n: c["count"] for n, c in manifest["collections"].items()}
+    log.info(f"VectorStore snapshot imported from {path}: {counts}")
+    return True
@@ -0,0 +1,152 @@
+import math
+import re
+import threading
+from collections import Counter
+from qdrant_client.models import FieldCondition, Filter, MatchAny, MatchValue
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Order numbers, quoted phrases and codes mixing letters and digits (SAVE20).
+# Bare numbers (years, amounts) are not enough: they appear in ordinary
+# questions that still need dense retrieval.
+_LEXICAL = re.compile(r'#\d+|"[^"]+"|\b(?=[A-Z0-9]*\d)(?=[A-Z0-9]*[A-Z])[A-Z0-9]{4,}\b')
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def is_lexical(query: str) -> bool:
+    """True for queries that are clearly exact-keyword lookups."""
+    return bool(_LEXICAL.search(query))
+
+
+def payload_matches(payload: dict, filter_conditions: Filter | None) -> bool:
+    """Evaluate a Qdrant keyword filter (must/should/must_not) against a payload.
+
+    Supports the FieldCondition + MatchValue/MatchAny subset used by VectorStore.
+    """
+    if filter_conditions is None:
+        return True
+
+    def check(condition) -> bool:
+        if isinstance(condition, Filter):
+            return payload_matches(payload, condition)
+        if not isinstance(condition, FieldCondition):
+            raise ValueError(f"Unsupported filter condition: {condition!r}")
+        value = payload.get(condition.key)
+        if isinstance(condition.match, MatchValue):
+            return value == condition.match.value
+        if isinstance(condition.match, MatchAny):
+            return value in condition.match.any
+        raise ValueError(f"Unsupported match on {condition.key}: {condition.match!r}")
+
+    def as_list(conditions):
+        if conditions is None:
+            return []
+        return conditions if isinstance(conditions, list) else [conditions]
+
+    must = as_list(filter_conditions.must)
+    should = as_list(filter_conditions.should)
+    must_not = as_list(filter_conditions.must_not)
+    return (
+        all(check(c) for c in must)
+        and (not should or any(check(c) for c in should))
+        and not any(check(c) for c in must_not)
+    )
+
+
+class BM25Index:
+    """In-memory Okapi BM25 index over point texts, keyed by point id."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._docs: dict[int | str, tuple[Counter, int, dict]] = {}
+        self._postings: dict[str, dict[int | str, int]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _remove(self, point_id):
+        doc = self._docs.pop(point_id, None)
+        if doc is None:
+            return
+        terms, length, _ = doc
+        self._total_length -= length
+        for term in terms:
+            postings = self._postings[term]
+            del postings[point_id]
+            if not postings:
+                del self._postings[term]
+
+    def add_many(self, records: list[tuple[int | str, str, dict]]):
+        """Index (point_id, text, payload) records, replacing existing ids."""
+        with self._lock:
+            for point_id, text, payload in records:
+                self._remove(point_id)
+                tokens = tokenize(text)
+                terms = Counter(tokens)
+                self._docs[point_id] = (terms, len(tokens), payload)
+                self._total_length += len(tokens)
+                for term, tf in terms.items():
+                    self._postings.setdefault(term, {})[point_id] = tf
+
+    def remove(self, point_id):
+        with self._lock:
+            self._remove(point_id)
+
+    def clear(self):
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._total_length = 0
+
+    def search(
+        self, query: str, limit: int = 5, filter_conditions: Filter = None
+    ) -> list[tuple[int | str, float, dict]]:
+        """Top (point_id, score, payload) by BM25, best first."""
+        with self._lock:
+            n = len(self._docs)
+            if n == 0:
+                return []
+            avg_length = self._total_length / n
+            scores: dict[int | str, float] = {}
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                for point_id, tf in postings.items():
+                    length = self._docs[point_id][1]
+                    norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                    scores[point_id] = scores.get(point_id, 0.0) + idf * tf * (
+                        self.k1 + 1
+                    ) / (tf + norm)
+
+            ranked = sorted(scores.items(), key=lambda item: -item[1])
+            results = []
+            for point_id, score in ranked:
+                payload = self._docs[point_id][2]
+                if payload_matches(payload, filter_conditions):
+                    results.append((point_id, score, payload))
+                    if len(results) == limit:
+                        break
+            return results
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[int | str]], k: int = 60
+) -> list[tuple[int | str, float]]:
+    """Fuse ranked id lists; scores are normalised so 1.0 means first everywhere."""
+    scores: dict[int | str, float] = {}
+    for ranking in rankings:
+        for rank, point_id in enumerate(ranking, 1):
+            scores[point_id] = scores.get(point_id, 0.0) + 1 / (k + rank)
+    best = len(rankings) / (k + 1)
+    return sorted(
+        ((point_id, score / best) for point_id, score in scores.items()),
+        key=lambda item: -item[1],
+    )
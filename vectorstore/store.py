@@ -1,16 +1,37 @@
 import os
+import asyncio
 import atexit
-from qdrant_client import QdrantClient
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
     Distance,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     VectorParams,
+    PointIdsList,
     PointStruct,
+    QueryRequest,
     Filter,
     FieldCondition,
     MatchValue,
 )
-from config import Config, get_embeddings
+from config import Config, get_embeddings, embedding_model_id
 from logger import log
+from .cache import EmbeddingCache, ResultCache
+from .sparse import BM25Index, is_lexical, reciprocal_rank_fusion
+
+# Modes whose data lives inside this process: exact search only, no payload
+# indexes, no async client.
+EMBEDDED_MODES = ("memory", "local", "numpy")
 
 
 class VectorStore:
@@ -18,9 +39,19 @@ class VectorStore:
     _client = None
 
     COLLECTIONS = {
-        "incidents": 1536,
-        "tickets": 1536,
-        "products": 1536,
+        "incidents": Config.EMBEDDING_DIM,
+        "tickets": Config.EMBEDDING_DIM,
+        "products": Config.EMBEDDING_DIM,
+    }
+
+    # Dense candidates per requested result when fusing with BM25
+    HYBRID_DEPTH = 4
+
+    # Keyword fields used in search filters
+    PAYLOAD_INDEXES = {
+        "incidents": ["incident_type"],
+        "tickets": ["category", "status"],
+        "products": ["category"],
     }
 
     def __new__(cls):
@@ -39,6 +70,20 @@ class VectorStore:
 
         self.client = VectorStore._client
         self.embeddings = get_embeddings()
+        self.embedding_cache = EmbeddingCache(
+            embedding_model_id(),
+            max_size=Config.EMBEDDING_CACHE_SIZE,
+            path=Config.EMBEDDING_CACHE_PATH,
+        )
+        self.result_cache = ResultCache(
+            max_size=Config.SEARCH_CACHE_SIZE, ttl=Config.SEARCH_CACHE_TTL
+        )
+        # AsyncQdrantClient is bound to the loop it first runs on
+        self._aclients = weakref.WeakKeyDictionary()
+        self._aclients_lock = threading.Lock()
+        self._sparse: dict[str, BM25Index] = {}
+        self._sparse_lock = threading.Lock()
+        self._dim_checked = False
         self._initialized = True
 
     @classmethod
@@ -58,6 +103,12 @@ class VectorStore:
             log.info("VectorStore: in-memory mode")
             return QdrantClient(":memory:")
 
+        elif mode == "numpy":
+            from .numpy_backend import NumpyClient
+
+            log.info("VectorStore: in-process NumPy mode")
+            return NumpyClient()
+
         elif mode == "local":
             os.makedirs(Config.QDRANT_PATH, exist_ok=True)
             log.info(f"VectorStore: local at {Config.QDRANT_PATH}")
@@ -73,23 +124,161 @@ class VectorStore:
             )
             return QdrantClient(host=Config.QDRANT_HOST, port=Config.QDRANT_PORT)
 
+    @property
+    def aclient(self) -> AsyncQdrantClient | None:
+        """Async client for the running event loop; None unless in server mode.
+
+        Local and in-memory Qdrant keep their data inside the sync client, so
+        async searches there run the sync path on a worker thread instead.
+        """
+        if Config.QDRANT_MODE in EMBEDDED_MODES:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._aclients_lock:
+            client = self._aclients.get(loop)
+            if client is None:
+                client = AsyncQdrantClient(
+                    host=Config.QDRANT_HOST, port=Config.QDRANT_PORT
+                )
+                self._aclients[loop] = client
+        return client
+
+    async def aclose(self):
+        """Close the async client bound to the running loop, if any."""
+        with self._aclients_lock:
+            client = self._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def embed(self, text: str) -> list[float]:
+        """Query embedding through the shared embedding cache."""
+        return self._embed(text)
+
+    def _check_dim(self, vector: list[float]):
+        # Collections are sized from EMBEDDING_DIM; catch a model that ignores
+        # or rejects `dimensions` before its vectors reach Qdrant or the cache
+        if self._dim_checked:
+            return
+        if len(vector) != Config.EMBEDDING_DIM:
+            raise ValueError(
+                f"Embedding model {embedding_model_id()} returned {len(vector)} "
+                f"dimensions, but EMBEDDING_DIM is {Config.EMBEDDING_DIM}"
+            )
+        self._dim_checked = True
+
     def _embed(self, text: str) -> list[float]:
-        return self.embeddings.embed_query(text)
+        vector = self.embedding_cache.get(text)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self._check_dim(vector)
+            self.embedding_cache.put(text, vector)
+        return vector
 
     def _embed_batch(self, texts: list[str]) -> list[list[float]]:
-        return self.embeddings.embed_documents(texts)
+        vectors = self.embedding_cache.get_many(texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+        if missing:
+            embedded = self.embeddings.embed_documents(missing)
+            self._check_dim(embedded[0])
+            self.embedding_cache.put_many(missing, embedded)
+            by_text = dict(zip(missing, embedded))
+            vectors = [
+                v if v is not None else by_text[t] for t, v in zip(texts, vectors)
+            ]
+        return vectors
+
+    async def _aembed(self, text: str) -> list[float]:
+        vector = self.embedding_cache.get(text)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(text)
+            self._check_dim(vector)
+            self.embedding_cache.put(text, vector)
+        return vector
 
     def init_collections(self):
         existing = [c.name for c in self.client.get_collections().collections]
         for name, dim in self.COLLECTIONS.items():
             if name not in existing:
-                self.client.create_collection(
-                    collection_name=name,
-                    vectors_config=VectorParams(size=dim, distance=Distance.COSINE),
-                )
-                log.debug(f"Created collection: {name}")
+                self._create_collection(name, dim)
+            self._create_payload_indexes(name)
         log.info("VectorStore collections initialized")
 
+    def _create_collection(self, name: str, dim: int):
+        self.client.create_collection(
+            collection_name=name,
+            vectors_config=VectorParams(
+                size=dim,
+                distance=Distance.COSINE,
+                on_disk=Config.QDRANT_VECTORS_ON_DISK,
+            ),
+            hnsw_config=HnswConfigDiff(
+                m=Config.QDRANT_HNSW_M,
+                ef_construct=Config.QDRANT_HNSW_EF_CONSTRUCT,
+                on_disk=Config.QDRANT_HNSW_ON_DISK,
+            ),
+            quantization_config=self._quantization_config(name),
+        )
+        log.debug(
+            f"Created collection: {name} (quantization: {self.quantization(name)})"
+        )
+
+    def quantization(self, collection: str) -> str:
+        """none | scalar | binary, from QDRANT_QUANTIZATION.
+
+        Accepts one mode for every collection ("scalar") or a per-collection
+        list ("tickets=scalar,incidents=binary").
+        """
+        spec = (Config.QDRANT_QUANTIZATION or "none").strip().lower()
+        if "=" in spec:
+            modes = dict(
+                item.split("=", 1) for item in spec.replace(" ", "").split(",") if item
+            )
+            mode = modes.get(collection, "none")
+        else:
+            mode = spec
+        if mode not in ("none", "scalar", "binary"):
+            raise ValueError(f"Unknown quantization for {collection}: {mode}")
+        return mode
+
+    def _quantization_config(self, collection: str):
+        mode = self.quantization(collection)
+        if mode == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if mode == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def _search_params(self, collection: str) -> SearchParams | None:
+        # Local/in-memory Qdrant always runs exact search
+        if Config.QDRANT_MODE in EMBEDDED_MODES:
+            return None
+        if self.quantization(collection) == "none":
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=Config.QDRANT_QUANTIZATION_RESCORE,
+                oversampling=Config.QDRANT_QUANTIZATION_OVERSAMPLING,
+            )
+        )
+
+    def _create_payload_indexes(self, collection: str):
+        # Local/in-memory Qdrant ignores payload indexes (and warns about them)
+        if Config.QDRANT_MODE in EMBEDDED_MODES:
+            return
+        indexed = self.client.get_collection(collection).payload_schema
+        for field in self.PAYLOAD_INDEXES.get(collection, []):
+            if field not in indexed:
+                self.client.create_payload_index(
+                    collection_name=collection,
+                    field_name=field,
+                    field_schema=PayloadSchemaType.KEYWORD,
+                )
+                log.debug(f"Created payload index: {collection}.{field}")
+
     def _search(
         self,
         collection: str,
@@ -97,16 +286,289 @@ class VectorStore:
         limit: int = 5,
         filter_conditions: Filter = None,
     ) -> list[dict]:
-        vector = self._embed(query)
-        results = self.client.query_points(
-            collection_name=collection,
-            query=vector,
-            limit=limit,
-            query_filter=filter_conditions,
+        cache = self.result_cache
+        if cache.enabled:
+            key = self._result_key(collection, query, limit, filter_conditions)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            generation = cache.generation(collection)
+
+        results = self._lexical_search(collection, query, limit, filter_conditions)
+        if results is None:
+            vector = self._embed(query)
+            response = self.client.query_points(
+                collection_name=collection,
+                query=vector,
+                limit=self._dense_limit(limit),
+                query_filter=filter_conditions,
+                search_params=self._search_params(collection),
+            )
+            results = self._fuse(
+                collection, query, response.points, limit, filter_conditions
+            )
+        if cache.enabled:
+            cache.put(key, results, generation)
+        return results
+
+    async def _asearch(
+        self,
+        collection: str,
+        query: str,
+        limit: int = 5,
+        filter_conditions: Filter = None,
+    ) -> list[dict]:
+        aclient = self.aclient
+        if aclient is None:
+            return await asyncio.to_thread(
+                self._search, collection, query, limit, filter_conditions
+            )
+
+        cache = self.result_cache
+        if cache.enabled:
+            key = self._result_key(collection, query, limit, filter_conditions)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            generation = cache.generation(collection)
+
+        if Config.HYBRID_SEARCH:
+            # First use rebuilds the BM25 index from Qdrant; keep it off the loop
+            await asyncio.to_thread(self._sparse_index, collection)
+        results = self._lexical_search(collection, query, limit, filter_conditions)
+        if results is None:
+            vector = await self._aembed(query)
+            response = await aclient.query_points(
+                collection_name=collection,
+                query=vector,
+                limit=self._dense_limit(limit),
+                query_filter=filter_conditions,
+                search_params=self._search_params(collection),
+            )
+            results = self._fuse(
+                collection, query, response.points, limit, filter_conditions
+            )
+        if cache.enabled:
+            cache.put(key, results, generation)
+        return results
+
+    def search_batch(
+        self,
+        collection: str,
+        queries: list[str],
+        limit: int = 5,
+        filters: list[Filter | None] | Filter | None = None,
+    ) -> list[list[dict]]:
+        """Run several searches with one embedding call and one Qdrant request.
+
+        filters is either one filter for every query or a list aligned with
+        queries. Results come back in query order.
+        """
+        if not queries:
+            return []
+        if not isinstance(filters, list):
+            filters = [filters] * len(queries)
+        if len(filters) != len(queries):
+            raise ValueError("filters must align with queries")
+
+        cache = self.result_cache
+        results: list[list[dict] | None] = [None] * len(queries)
+        keys = [
+            self._result_key(collection, q, limit, f) for q, f in zip(queries, filters)
+        ]
+        if cache.enabled:
+            results = [cache.get(key) for key in keys]
+            generation = cache.generation(collection)
+
+        for i in range(len(queries)):
+            if results[i] is None:
+                results[i] = self._lexical_search(
+                    collection, queries[i], limit, filters[i]
+                )
+                if results[i] is not None and cache.enabled:
+                    cache.put(keys[i], results[i], generation)
+
+        pending = [i for i, r in enumerate(results) if r is None]
+        if pending:
+            vectors = self._embed_batch([queries[i] for i in pending])
+            search_params = self._search_params(collection)
+            responses = self.client.query_batch_points(
+                collection_name=collection,
+                requests=[
+                    QueryRequest(
+                        query=vector,
+                        limit=self._dense_limit(limit),
+                        filter=filters[i],
+                        params=search_params,
+                        with_payload=True,
+                    )
+                    for i, vector in zip(pending, vectors)
+                ],
+            )
+            for i, response in zip(pending, responses):
+                results[i] = self._fuse(
+                    collection, queries[i], response.points, limit, filters[i]
+                )
+                if cache.enabled:
+                    cache.put(keys[i], results[i], generation)
+        return results
+
+    def _sparse_index(self, collection: str) -> BM25Index:
+        """BM25 index for a collection, rebuilt from Qdrant payloads on first use."""
+        with self._sparse_lock:
+            index = self._sparse.get(collection)
+            if index is None:
+                index = BM25Index()
+                text = self.TEXT_BUILDERS[collection]
+                offset = None
+                while True:
+                    points, offset = self.client.scroll(
+                        collection_name=collection,
+                        limit=1000,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=False,
+                    )
+                    index.add_many([(p.id, text(p.payload), p.payload) for p in points])
+                    if offset is None:
+                        break
+                self._sparse[collection] = index
+                log.debug(f"BM25 index for {collection}: {len(index)} documents")
+        return index
+
+    def _loaded_sparse_index(self, collection: str) -> BM25Index | None:
+        """The BM25 index if already built; writes keep it current, otherwise
+        it is built from Qdrant on first hybrid search."""
+        if not Config.HYBRID_SEARCH:
+            return None
+        with self._sparse_lock:
+            return self._sparse.get(collection)
+
+    def _dense_limit(self, limit: int) -> int:
+        return limit * self.HYBRID_DEPTH if Config.HYBRID_SEARCH else limit
+
+    def _lexical_search(
+        self, collection: str, query: str, limit: int, filter_conditions: Filter
+    ) -> list[dict] | None:
+        """BM25-only results for clearly lexical queries; None to go dense.
+
+        Hits carry only "rank_score" (BM25 relative to the best hit); there is
+        no similarity "score" without a dense search.
+        """
+        if not Config.HYBRID_SEARCH or not is_lexical(query):
+            return None
+        hits = self._sparse_index(collection).search(query, limit, filter_conditions)
+        if not hits:
+            return None
+        top = hits[0][1]
+        return [{"rank_score": score / top, **payload} for _, score, payload in hits]
+
+    def _fuse(
+        self,
+        collection: str,
+        query: str,
+        points: list,
+        limit: int,
+        filter_conditions: Filter,
+    ) -> list[dict]:
+        """Reciprocal-rank fusion of dense hits with BM25 hits for the same query.
+
+        Results are ordered by the fused "rank_score"; "score" stays the dense
+        cosine similarity and is absent for hits found only by BM25.
+        """
+        dense = [{"score": p.score, **p.payload} for p in points[:limit]]
+        if not Config.HYBRID_SEARCH:
+            return dense
+        lexical = self._sparse_index(collection).search(
+            query, len(points) or limit, filter_conditions
+        )
+        if not lexical:
+            return dense
+
+        payloads = {p.id: p.payload for p in points}
+        payloads.update({point_id: payload for point_id, _, payload in lexical})
+        similarity = {p.id: p.score for p in points}
+        fused = reciprocal_rank_fusion(
+            [[p.id for p in points], [point_id for point_id, _, _ in lexical]],
+            k=Config.HYBRID_RRF_K,
         )
-        return [{"score": r.score, **r.payload} for r in results.points]
+        return [
+            {
+                **({"score": similarity[point_id]} if point_id in similarity else {}),
+                "rank_score": rank_score,
+                **payloads[point_id],
+            }
+            for point_id, rank_score in fused[:limit]
+        ]
+
+    def _result_key(
+        self, collection: str, query: str, limit: int, filter_conditions: Filter
+    ) -> tuple:
+        return (
+            collection,
+            self.embedding_cache.key(query),
+            limit,
+            (
+                filter_conditions.model_dump_json(exclude_none=True)
+                if filter_conditions
+                else None
+            ),
+        )
+
+    @staticmethod
+    def field_filter(key: str, value: str) -> Filter:
+        return Filter(must=[FieldCondition(key=key, match=MatchValue(value=value))])
+
+    def _upsert_records(
+        self,
+        collection: str,
+        records: list[tuple[int, str, dict]],
+        batch_size: int = None,
+        concurrency: int = None,
+    ) -> int:
+        """Embed (id, text, payload) records in chunks and upsert them in batches.
+
+        Chunks are embedded concurrently with embed_documents; points are
+        upserted in chunk order from the calling thread.
+        """
+        batch_size = batch_size or Config.EMBED_BATCH_SIZE
+        concurrency = concurrency or Config.EMBED_CONCURRENCY
+        chunks = [
+            records[i : i + batch_size] for i in range(0, len(records), batch_size)
+        ]
+
+        def embed(chunk):
+            return self._embed_batch([text for _, text, _ in chunk])
+
+        count = 0
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(chunks)))
+        ) as ex:
+            for chunk, vectors in zip(chunks, ex.map(embed, chunks)):
+                self.client.upsert(
+                    collection_name=collection,
+                    points=[
+                        PointStruct(id=point_id, vector=vector, payload=payload)
+                        for (point_id, _, payload), vector in zip(chunk, vectors)
+                    ],
+                )
+                index = self._loaded_sparse_index(collection)
+                if index is not None:
+                    index.add_many(chunk)
+                self.result_cache.invalidate(collection)
+                count += len(chunk)
+        log.debug(f"Upserted {count} points into {collection}")
+        return count
 
     # ============ INCIDENTS ============
+    @staticmethod
+    def _incident_text(incident: dict) -> str:
+        return (
+            f"Type: {incident['incident_type']}. {incident['description']}. "
+            f"Cause: {incident['root_cause']}. Action: {incident['action_taken']}. "
+            f"Result: {incident['outcome']}"
+        )
+
     def add_incident(
         self,
         incident_id: int,
@@ -116,42 +578,73 @@ class VectorStore:
         action_taken: str,
         outcome: str,
     ):
-        text = f"Type: {incident_type}. {description}. Cause: {root_cause}. Action: {action_taken}. Result: {outcome}"
-        vector = self._embed(text)
-        self.client.upsert(
-            collection_name="incidents",
-            points=[
-                PointStruct(
-                    id=incident_id,
-                    vector=vector,
-                    payload={
-                        "incident_id": incident_id,
-                        "incident_type": incident_type,
-                        "description": description,
-                        "root_cause": root_cause,
-                        "action_taken": action_taken,
-                        "outcome": outcome,
-                    },
-                )
-            ],
+        self.add_incidents_batch(
+            [
+                {
+                    "incident_id": incident_id,
+                    "incident_type": incident_type,
+                    "description": description,
+                    "root_cause": root_cause,
+                    "action_taken": action_taken,
+                    "outcome": outcome,
+                }
+            ]
         )
 
+    def add_incidents_batch(
+        self, incidents: list[dict], batch_size: int = None, concurrency: int = None
+    ) -> int:
+        """Each dict takes the add_incident keyword arguments.
+
+        An optional "point_id" overrides the Qdrant point id (defaults to
+        incident_id).
+        """
+        records = [
+            (
+                inc.get("point_id", inc["incident_id"]),
+                self._incident_text(inc),
+                {
+                    "incident_id": inc["incident_id"],
+                    "incident_type": inc["incident_type"],
+                    "description": inc["description"],
+                    "root_cause": inc["root_cause"],
+                    "action_taken": inc["action_taken"],
+                    "outcome": inc["outcome"],
+                },
+            )
+            for inc in incidents
+        ]
+        return self._upsert_records("incidents", records, batch_size, concurrency)
+
     def search_incidents(self, query: str, limit: int = 5) -> list[dict]:
         return self._search("incidents", query, limit)
 
     def search_incidents_by_type(
         self, query: str, incident_type: str, limit: int = 5
     ) -> list[dict]:
-        filter_cond = Filter(
-            must=[
-                FieldCondition(
-                    key="incident_type", match=MatchValue(value=incident_type)
-                )
-            ]
-        )
+        filter_cond = self.field_filter("incident_type", incident_type)
         return self._search("incidents", query, limit, filter_cond)
 
+    async def asearch_incidents(self, query: str, limit: int = 5) -> list[dict]:
+        return await self._asearch("incidents", query, limit)
+
+    async def asearch_incidents_by_type(
+        self, query: str, incident_type: str, limit: int = 5
+    ) -> list[dict]:
+        filter_cond = self.field_filter("incident_type", incident_type)
+        return await self._asearch("incidents", query, limit, filter_cond)
+
     # ============ TICKETS ============
+    @staticmethod
+    def _ticket_text(ticket: dict) -> str:
+        text = (
+            f"Subject: {ticket['subject']}. Issue: {ticket['description']}. "
+            f"Category: {ticket['category']}."
+        )
+        if ticket.get("resolution"):
+            text += f" Resolution: {ticket['resolution']}"
+        return text
+
     def add_ticket(
         self,
         ticket_id: int,
@@ -160,62 +653,153 @@ class VectorStore:
         category: str,
         resolution: str = None,
     ):
-        text = f"Subject: {subject}. Issue: {description}. Category: {category}."
-        if resolution:
-            text += f" Resolution: {resolution}"
-        vector = self._embed(text)
-        self.client.upsert(
-            collection_name="tickets",
-            points=[
-                PointStruct(
-                    id=ticket_id,
-                    vector=vector,
-                    payload={
-                        "ticket_id": ticket_id,
-                        "subject": subject,
-                        "description": description,
-                        "category": category,
-                        "resolution": resolution,
-                    },
-                )
-            ],
+        self.add_tickets_batch(
+            [
+                {
+                    "ticket_id": ticket_id,
+                    "subject": subject,
+                    "description": description,
+                    "category": category,
+                    "resolution": resolution,
+                }
+            ]
         )
 
+    def add_tickets_batch(
+        self, tickets: list[dict], batch_size: int = None, concurrency: int = None
+    ) -> int:
+        """Each dict takes the add_ticket keyword arguments.
+
+        Optional keys: "point_id" (defaults to ticket_id) and "status".
+        """
+        records = [
+            (
+                t.get("point_id", t["ticket_id"]),
+                self._ticket_text(t),
+                {
+                    "ticket_id": t["ticket_id"],
+                    "subject": t["subject"],
+                    "description": t["description"],
+                    "category": t["category"],
+                    "resolution": t.get("resolution"),
+                    **({"status": t["status"]} if t.get("status") else {}),
+                },
+            )
+            for t in tickets
+        ]
+        return self._upsert_records("tickets", records, batch_size, concurrency)
+
     def search_tickets(self, query: str, limit: int = 5) -> list[dict]:
         return self._search("tickets", query, limit)
 
     def search_tickets_by_category(
         self, query: str, category: str, limit: int = 5
     ) -> list[dict]:
-        filter_cond = Filter(
-            must=[FieldCondition(key="category", match=MatchValue(value=category))]
-        )
+        filter_cond = self.field_filter("category", category)
         return self._search("tickets", query, limit, filter_cond)
 
+    # Synced tickets carry their status; curated seed tickets have none and
+    # are all resolved precedents
+    RESOLVED_TICKETS = Filter(
+        must_not=[FieldCondition(key="status", match=MatchValue(value="open"))]
+    )
+
+    def search_resolved_tickets(self, query: str, limit: int = 5) -> list[dict]:
+        return self._search("tickets", query, limit, self.RESOLVED_TICKETS)
+
+    async def asearch_tickets(self, query: str, limit: int = 5) -> list[dict]:
+        return await self._asearch("tickets", query, limit)
+
+    async def asearch_tickets_by_category(
+        self, query: str, category: str, limit: int = 5
+    ) -> list[dict]:
+        filter_cond = self.field_filter("category", category)
+        return await self._asearch("tickets", query, limit, filter_cond)
+
+    async def asearch_resolved_tickets(self, query: str, limit: int = 5) -> list[dict]:
+        return await self._asearch("tickets", query, limit, self.RESOLVED_TICKETS)
+
     # ============ PRODUCTS ============
+    @staticmethod
+    def _product_text(product: dict) -> str:
+        return (
+            f"Product: {product['name']}. Category: {product['category']}. "
+            f"{product['description']}"
+        )
+
     def add_product(self, product_id: int, name: str, category: str, description: str):
-        text = f"Product: {name}. Category: {category}. {description}"
-        vector = self._embed(text)
-        self.client.upsert(
-            collection_name="products",
-            points=[
-                PointStruct(
-                    id=product_id,
-                    vector=vector,
-                    payload={
-                        "product_id": product_id,
-                        "name": name,
-                        "category": category,
-                        "description": description,
-                    },
-                )
-            ],
+        self.add_products_batch(
+            [
+                {
+                    "product_id": product_id,
+                    "name": name,
+                    "category": category,
+                    "description": description,
+                }
+            ]
         )
 
+    def add_products_batch(
+        self, products: list[dict], batch_size: int = None, concurrency: int = None
+    ) -> int:
+        """Each dict takes the add_product keyword arguments."""
+        records = [
+            (
+                p["product_id"],
+                self._product_text(p),
+                {
+                    "product_id": p["product_id"],
+                    "name": p["name"],
+                    "category": p["category"],
+                    "description": p["description"],
+                },
+            )
+            for p in products
+        ]
+        return self._upsert_records("products", records, batch_size, concurrency)
+
     def search_products(self, query: str, limit: int = 5) -> list[dict]:
         return self._search("products", query, limit)
 
+    async def asearch_products(self, query: str, limit: int = 5) -> list[dict]:
+        return await self._asearch("products", query, limit)
+
+    TEXT_BUILDERS = {
+        "incidents": _incident_text,
+        "tickets": _ticket_text,
+        "products": _product_text,
+    }
+
     # ============ UTILS ============
+    def invalidate(self, collection: str):
+        """Drop derived state (BM25 index, cached results) after bulk writes."""
+        with self._sparse_lock:
+            self._sparse.pop(collection, None)
+        self.result_cache.invalidate(collection)
+
+    def export_snapshot(self, path: str) -> dict:
+        from .snapshot import export_snapshot
+
+        return export_snapshot(self, path)
+
+    def import_snapshot(self, path: str) -> bool:
+        from .snapshot import import_snapshot
+
+        return import_snapshot(self, path)
+
+    def delete_points(self, collection: str, point_ids: list) -> int:
+        if not point_ids:
+            return 0
+        self.client.delete(
+            collection_name=collection, points_selector=PointIdsList(points=point_ids)
+        )
+        index = self._loaded_sparse_index(collection)
+        if index is not None:
+            for point_id in point_ids:
+                index.remove(point_id)
+        self.result_cache.invalidate(collection)
+        return len(point_ids)
+
     def count(self, collection: str) -> int:
         try:
             return self.client.get_collection(collection).points_count
@@ -228,4 +812,7 @@ class VectorStore:
                 self.client.delete_collection(name)
             except:
                 pass
+        with self._sparse_lock:
+            self._sparse.clear()
+        self.result_cache.invalidate()
         self.init_collections()
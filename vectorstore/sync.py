@@ -0,0 +1,151 @@
+import threading
+import uuid
+from config import Config
+from db import Database, run_async
+from logger import log
+from .store import VectorStore
+
+# Synced points get uuid5 ids so they never collide with the curated seed
+# points, which use small integer ids.
+POINT_NAMESPACE = uuid.UUID("6f1f7c0e-5d3b-4a8e-9c61-2b7f0d4e8a15")
+
+
+def point_id(table: str, row_id: int) -> str:
+    return str(uuid.uuid5(POINT_NAMESPACE, f"{table}:{row_id}"))
+
+
+def _ticket_record(row: dict) -> dict:
+    return {
+        "point_id": point_id("tickets", row["id"]),
+        "ticket_id": row["id"],
+        "subject": row["subject"] or "",
+        "description": row["description"] or "",
+        "category": row["category"] or "general",
+        "status": row["status"],
+    }
+
+
+def _incident_record(row: dict) -> dict:
+    return {
+        "point_id": point_id("incidents", row["id"]),
+        "incident_id": row["id"],
+        "incident_type": row["type"] or "",
+        "description": row["description"] or "",
+        "root_cause": row["root_cause"] or "",
+        "action_taken": row["action_taken"] or "",
+        "outcome": row["outcome"] or "",
+    }
+
+
+class VectorSync:
+    """Streams rows logged in vector_changes into the matching Qdrant collection.
+
+    Each pass reads a batch of change-log entries, collapses repeated changes
+    to the same row, upserts the current rows (or deletes points for rows
+    that no longer exist) and only then trims the log, so a failed pass is
+    retried on the next one. Synced rows are kept in the vector_synced ledger
+    so backfill() can restore them into a store rebuilt from the seed.
+    """
+
+    WRITERS = {
+        "tickets": ("add_tickets_batch", _ticket_record),
+        "incidents": ("add_incidents_batch", _incident_record),
+    }
+
+    def __init__(self, db: Database = None, vs: VectorStore = None):
+        self.db = db or Database()
+        self.vs = vs or VectorStore()
+        self._lock = threading.Lock()
+
+    def sync_once(self, batch_size: int = None) -> int:
+        changes = run_async(
+            self.db.get_vector_changes(batch_size or Config.VECTOR_SYNC_BATCH_SIZE)
+        )
+        if not changes:
+            return 0
+
+        by_table: dict[str, set[int]] = {}
+        for change in changes:
+            by_table.setdefault(change["table_name"], set()).add(change["row_id"])
+
+        for table, ids in by_table.items():
+            method, to_record = self.WRITERS[table]
+            rows = run_async(self.db.get_rows_by_id(table, sorted(ids)))
+            if rows:
+                getattr(self.vs, method)([to_record(row) for row in rows])
+            deleted = ids - {row["id"] for row in rows}
+            self.vs.delete_points(table, [point_id(table, i) for i in deleted])
+            run_async(
+                self.db.mark_vector_synced(
+                    table, [row["id"] for row in rows], sorted(deleted)
+                )
+            )
+            log.debug(
+                f"Vector sync: {table} upserted {len(rows)}, deleted {len(deleted)}"
+            )
+
+        run_async(self.db.clear_vector_changes(changes[-1]["seq"]))
+        return len(changes)
+
+    def sync(self) -> int:
+        """Drain the change log; returns the number of change entries applied."""
+        with self._lock:
+            total = 0
+            while applied := self.sync_once():
+                total += applied
+        if total:
+            log.info(f"Vector sync: applied {total} changes")
+        return total
+
+    def backfill(self) -> int:
+        """Replay every previously synced row, for a store that was just
+        rebuilt from the seed or a snapshot."""
+        requeued = run_async(self.db.requeue_vector_synced())
+        if requeued:
+            log.info(f"Vector sync: backfilling {requeued} rows")
+        return self.sync()
+
+
+class SyncWorker:
+    """Daemon thread that runs VectorSync on request and, optionally, on a timer."""
+
+    def __init__(self, interval: float = None):
+        self.interval = (
+            interval if interval is not None else Config.VECTOR_SYNC_INTERVAL
+        )
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._sync: VectorSync | None = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="vector-sync", daemon=True
+                )
+                self._thread.start()
+
+    def request(self):
+        """Schedule a sync soon; requests made while one is running coalesce."""
+        self.start()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(timeout=self.interval or None)
+            self._wake.clear()
+            try:
+                if self._sync is None:
+                    self._sync = VectorSync()
+                    self._sync.vs.init_collections()
+                self._sync.sync()
+            except Exception as e:
+                log.warning(f"Vector sync failed: {e}")
+
+
+worker = SyncWorker()
+
+
+def request_sync():
+    worker.request()